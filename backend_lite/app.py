@@ -12,11 +12,15 @@ from datetime import datetime
 load_dotenv()
 
 # Import services
-from services.scraper import MotleyFoolScraper
+from services.scraper import create_scraper
+from services.transcript_store import TranscriptStore
 from services.parser import TranscriptParser
+from services.parse_cache import ParseCache
+from services.parser_registry import ParserCascade
 from services.sentiment_analyzer import SentimentAnalyzer
 from services.strategic_analyzer import StrategicAnalyzer
 from services.tone_analyzer import ToneAnalyzer
+from services.pipeline import PipelineContext
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -26,21 +30,42 @@ CORS(app)
 cache_dir = os.getenv('CACHE_DIR', './cache')
 cache = dc.Cache(cache_dir)
 
+# Backfilled transcripts live in their own store so clearing analysis results keeps them
+transcript_store_dir = os.getenv('TRANSCRIPT_STORE_DIR', os.path.join(cache_dir, 'transcripts'))
+
+# Parsed transcripts, invalidated by parser changes rather than by clearing the analysis cache
+parse_cache_dir = os.getenv('PARSE_CACHE_DIR', os.path.join(cache_dir, 'parsed'))
+
+# FinBERT probabilities per text, invalidated by a model, revision or backend change
+sentiment_cache_dir = os.getenv('SENTIMENT_CACHE_DIR', os.path.join(cache_dir, 'sentiment'))
+
+# Processes used to parse a request's transcripts; 1 parses in the request thread
+parse_workers = int(os.getenv('PARSE_WORKERS', 1))
+
 # Initialize services (lazy loading)
 scraper = None
 parser = None
+parse_cache = None
 sentiment_analyzer = None
 strategic_analyzer = None
 tone_analyzer = None
+transcript_store = None
 
 
 def get_scraper():
     global scraper
     if scraper is None:
-        scraper = MotleyFoolScraper()
+        scraper = create_scraper(cache_dir)
     return scraper
 
 
+def get_transcript_store():
+    global transcript_store
+    if transcript_store is None:
+        transcript_store = TranscriptStore(transcript_store_dir)
+    return transcript_store
+
+
 def get_parser():
     global parser
     if parser is None:
@@ -48,10 +73,21 @@ def get_parser():
     return parser
 
 
+def get_parse_cache():
+    global parse_cache
+    if parse_cache is None:
+        parse_cache = ParseCache(parse_cache_dir, ParserCascade(get_parser()))
+    return parse_cache
+
+
 def get_sentiment_analyzer():
     global sentiment_analyzer
     if sentiment_analyzer is None:
-        sentiment_analyzer = SentimentAnalyzer()
+        sentiment_analyzer = SentimentAnalyzer(batch_size=int(os.getenv('SENTIMENT_BATCH_SIZE', 16)),
+                                               coverage=os.getenv('SENTIMENT_COVERAGE', 'sample'),
+                                               backend=os.getenv('SENTIMENT_BACKEND'),
+                                               model_cache_dir=os.getenv('MODEL_CACHE_DIR', './model_cache'),
+                                               cache_dir=sentiment_cache_dir)
     return sentiment_analyzer
 
 
@@ -74,7 +110,9 @@ def health():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': datetime.now().isoformat(),
+        'parser_strategies': parse_cache.parser.stats() if parse_cache else None,
+        'sentiment_cache': sentiment_analyzer.cache.stats() if sentiment_analyzer and sentiment_analyzer.cache else None
     })
 
 
@@ -106,50 +144,33 @@ def analyze():
                 'message': 'No transcripts found'
             }), 404
         
-        # Process each transcript
-        results = []
-        parser_inst = get_parser()
+        # Scrape and parse each transcript exactly once for this request
+        context = PipelineContext(ticker, quarters)
+        context.load(scraper_inst, get_parse_cache(), transcript_urls, store=get_transcript_store(),
+                     workers=parse_workers)
+        
+        # Analyze sentiment
         sentiment_inst = get_sentiment_analyzer()
+        sentiments = sentiment_inst.analyze_transcripts([transcript.parsed for transcript in context.transcripts])
+        for transcript, (management_sentiment, qa_sentiment) in zip(context.transcripts, sentiments):
+            transcript.management_sentiment = management_sentiment
+            transcript.qa_sentiment = qa_sentiment
         
-        for url in transcript_urls:
-            # Scrape transcript
-            transcript_data = scraper_inst.scrape_transcript(url)
-            if not transcript_data:
-                continue
-            
-            # Parse transcript
-            parsed = parser_inst.parse(transcript_data)
-            
-            # Analyze sentiment
-            management_sentiment = sentiment_inst.analyze_management(parsed['management_remarks'])
-            qa_sentiment = sentiment_inst.analyze_qa(parsed['qa_session'])
-            
-            results.append({
-                'quarter': parsed['quarter'],
-                'year': parsed['year'],
-                'transcript_url': url,
-                'management_sentiment': management_sentiment,
-                'qa_sentiment': qa_sentiment,
-                'prepared_remarks_count': len(parsed['management_remarks']),
-                'qa_count': len(parsed['qa_session']),
-                'transcript_data': parsed  # Include parsed transcript for tone analysis
-            })
+        results = context.results()
         
         # Analyze quarter-over-quarter tone change
         tone_inst = get_tone_analyzer()
         tone_changes = tone_inst.analyze_tone_changes(results)
         
-        # Extract strategic focuses
+        # Extract strategic focuses from the transcripts already scraped above
         strategic_inst = get_strategic_analyzer()
         strategic_focuses = []
-        for i, result in enumerate(results):
-            # Get full transcript for strategic analysis
-            transcript_data = scraper_inst.scrape_transcript(transcript_urls[i])
-            focuses = strategic_inst.extract_focuses(transcript_data)
+        for transcript in context.transcripts:
+            transcript.focuses = strategic_inst.extract_focuses(transcript.transcript_data)
             strategic_focuses.append({
-                'quarter': result['quarter'],
-                'year': result['year'],
-                'focuses': focuses
+                'quarter': transcript.quarter,
+                'year': transcript.year,
+                'focuses': transcript.focuses
             })
         
         # Prepare final response (clean up transcript_data for JSON response)
@@ -161,14 +182,15 @@ def analyze():
         analysis_results = {
             'ticker': ticker,
             'quarters_analyzed': len(results),
+            'failed_transcripts': context.failed_urls,
             'transcripts': clean_results,
             'tone_changes': tone_changes,
             'strategic_focuses': strategic_focuses,
             'analysis_timestamp': datetime.now().isoformat()
         }
         
-        # Cache results
-        if use_cache:
+        # Cache results (partial runs are not cached so the next request retries the failures)
+        if use_cache and not context.failed_urls:
             cache.set(cache_key, analysis_results, expire=3600)
         
         return jsonify({
@@ -214,29 +236,23 @@ def collect_data():
             }), 404
         
         # Collect transcript data without analysis
-        transcripts = []
-        parser_inst = get_parser()
+        context = PipelineContext(ticker, quarters)
+        context.load(scraper_inst, get_parse_cache(), transcript_urls, store=get_transcript_store(),
+                     workers=parse_workers)
         
-        for url in transcript_urls:
-            # Scrape transcript
-            transcript_data = scraper_inst.scrape_transcript(url)
-            if not transcript_data:
-                continue
-            
-            # Parse transcript
-            parsed = parser_inst.parse(transcript_data)
-            
+        transcripts = []
+        for transcript in context.transcripts:
             transcripts.append({
-                'quarter': parsed['quarter'],
-                'year': parsed['year'],
-                'transcript_url': url,
-                'prepared_remarks_count': len(parsed['management_remarks']),
-                'qa_count': len(parsed['qa_session']),
+                'quarter': transcript.quarter,
+                'year': transcript.year,
+                'transcript_url': transcript.url,
+                'prepared_remarks_count': len(transcript.parsed['management_remarks']),
+                'qa_count': len(transcript.parsed['qa_session']),
                 'collected_at': datetime.now().isoformat()
             })
         
-        # Cache collected data
-        if use_cache:
+        # Cache collected data (partial runs are not cached, as in /api/analyze)
+        if use_cache and not context.failed_urls:
             cache.set(cache_key, transcripts, expire=3600)
         
         return jsonify({
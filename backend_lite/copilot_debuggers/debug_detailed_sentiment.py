@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Detailed debug script to inspect actual text being sent to FinBERT models
+
+The running server scrapes according to its own SCRAPER_HTTP_MODE; start it
+with SCRAPER_HTTP_MODE=replay to analyze recorded pages instead of fool.com.
 """
 
 from services.sentiment_analyzer import SentimentAnalyzer
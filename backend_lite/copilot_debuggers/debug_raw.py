@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """
 Debug the raw transcript structure to understand the issue
+
+Set SCRAPER_HTTP_MODE=replay and SCRAPER_FIXTURE_DIR=<dir> (see
+scripts/replay_server.py) to run against recorded pages instead of fool.com.
 """
 from services.scraper import MotleyFoolScraper
+from services.replay import configure_session_from_env
 
 def debug_raw_transcript():
     print("🔍 DEBUGGING RAW TRANSCRIPT STRUCTURE")
     print("=" * 60)
     
     scraper = MotleyFoolScraper()
+    configure_session_from_env(scraper.session, **scraper.transport.adapter_kwargs)
     
     # Get one transcript
     url = "https://www.fool.com/earnings/call-transcripts/2024/08/28/nvidia-nvda-q2-2025-earnings-call-transcript/"
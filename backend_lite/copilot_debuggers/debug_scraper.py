@@ -1,13 +1,19 @@
 """
 Debug script to test the scraper directly
+
+Set SCRAPER_HTTP_MODE=replay and SCRAPER_FIXTURE_DIR=<dir> (see
+scripts/replay_server.py) to run against recorded pages instead of fool.com.
 """
 import requests
 from bs4 import BeautifulSoup
 
+from services.replay import configure_session_from_env
+
 url = "https://www.fool.com/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/"
 
 print(f"Fetching: {url}")
-response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
+session = configure_session_from_env(requests.Session())
+response = session.get(url, headers={'User-Agent': 'Mozilla/5.0'})
 print(f"Status code: {response.status_code}")
 
 soup = BeautifulSoup(response.content, 'html.parser')
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """
 Debug sentiment analysis to understand why results seem uniform
+
+Set SCRAPER_HTTP_MODE=replay and SCRAPER_FIXTURE_DIR=<dir> (see
+scripts/replay_server.py) to run against recorded pages instead of fool.com.
 """
 import diskcache as dc
 import json
 from services.sentiment_analyzer import SentimentAnalyzer
 from services.scraper import MotleyFoolScraper
+from services.replay import configure_session_from_env
 from services.parser import TranscriptParser
 
 def debug_sentiment():
@@ -54,6 +58,7 @@ def debug_sentiment():
     
     # Let's look at the actual content being analyzed
     scraper = MotleyFoolScraper()
+    configure_session_from_env(scraper.session, **scraper.transport.adapter_kwargs)
     parser = TranscriptParser()
     
     # Get one transcript
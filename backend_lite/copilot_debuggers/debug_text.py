@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 """
 Debug what text is actually being analyzed
+
+Set SCRAPER_HTTP_MODE=replay and SCRAPER_FIXTURE_DIR=<dir> (see
+scripts/replay_server.py) to run against recorded pages instead of fool.com.
 """
 import diskcache as dc
 from services.scraper import MotleyFoolScraper
+from services.replay import configure_session_from_env
 from services.parser import TranscriptParser
 
 def debug_text_extraction():
@@ -11,6 +15,7 @@ def debug_text_extraction():
     print("=" * 60)
     
     scraper = MotleyFoolScraper()
+    configure_session_from_env(scraper.session, **scraper.transport.adapter_kwargs)
     parser = TranscriptParser()
     
     # Get one transcript
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """
 Debug script to check token limits and text processing for FinBERT models
+
+Set SCRAPER_HTTP_MODE=replay and SCRAPER_FIXTURE_DIR=<dir> (see
+scripts/replay_server.py) to run against recorded pages instead of fool.com.
 """
 
 from services.sentiment_analyzer import SentimentAnalyzer
 from services.parser import TranscriptParser
 from services.scraper import MotleyFoolScraper
+from services.replay import configure_session_from_env
 from transformers import AutoTokenizer
 import logging
 
@@ -16,6 +20,7 @@ def analyze_token_usage():
     
     # Initialize components
     scraper = MotleyFoolScraper()
+    configure_session_from_env(scraper.session, **scraper.transport.adapter_kwargs)
     parser = TranscriptParser()
     analyzer = SentimentAnalyzer()
     
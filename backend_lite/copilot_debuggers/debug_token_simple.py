@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Simple debug script to check token limits for sentiment analysis
+
+The running server scrapes according to its own SCRAPER_HTTP_MODE; start it
+with SCRAPER_HTTP_MODE=replay to analyze recorded pages instead of fool.com.
 """
 
 import requests
@@ -0,0 +1,144 @@
+"""
+Resumable bulk backfill of historical earnings call transcripts
+
+Discovers transcripts (quote page, archive and monthly sitemaps since --since),
+scrapes them through the rate-limited scraper, parses them with TranscriptParser
+and writes both to the TranscriptStore used by /api/analyze. Each transcript is
+stored as soon as it is done, so a killed run picks up where it stopped.
+
+Usage:
+    python scripts/backfill_transcripts.py --ticker NVDA --since 2019-01
+    python scripts/backfill_transcripts.py --ticker NVDA --ticker AMD --batch-size 8 --workers 4 --retry-failed
+"""
+import os
+import sys
+import time
+import argparse
+import logging
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv
+
+from services.scraper import create_scraper
+from services.parse_cache import ParseCache
+from services.parser_registry import ParserCascade
+from services.transcript_store import TranscriptStore
+
+MAX_ATTEMPTS = 3
+
+
+def month_range(since: str):
+    """(year, month) pairs from a YYYY-MM string up to the current month"""
+    year, month = (int(part) for part in since.split('-'))
+    now = datetime.now()
+    months = []
+    while (year, month) <= (now.year, now.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def backfill_ticker(ticker, scraper, parser, store, since, batch_size, limit, retry_failed, workers):
+    checkpoint_name = f'backfill:{ticker}'
+    checkpoint = store.get_checkpoint(checkpoint_name)
+    failures = {} if retry_failed else checkpoint.get('failures', {})
+
+    print(f"\n📚 {ticker}: refreshing discovery index...")
+    sitemap_months = month_range(since) if since else None
+    added = scraper.refresh_transcript_index(ticker, sitemap_months=sitemap_months)
+    entries = scraper.transcript_index.latest(ticker, num_quarters=10 ** 6)
+    print(f"   {len(entries)} transcripts indexed ({added} new)")
+
+    pending = [entry['url'] for entry in entries
+               if not store.has(entry['url']) and failures.get(entry['url'], 0) < MAX_ATTEMPTS]
+    if limit:
+        pending = pending[:limit]
+
+    done_before = len(entries) - len(pending)
+    print(f"   {done_before} already stored or given up, {len(pending)} to fetch")
+
+    completed = checkpoint.get('completed', 0)
+    start = time.perf_counter()
+    processed = 0
+
+    for offset in range(0, len(pending), batch_size):
+        batch = pending[offset:offset + batch_size]
+        batch_start = time.perf_counter()
+
+        scraped = scraper.scrape_transcripts(batch)
+        # Single-threaded between batches, so the workers can be forked
+        parsed_batch = parser.parse_many(scraped, workers=workers, start_method='fork')
+        for url, transcript_data, parsed in zip(batch, scraped, parsed_batch):
+            if transcript_data and parsed:
+                store.put(url, transcript_data, parsed)
+                failures.pop(url, None)
+                completed += 1
+            else:
+                failures[url] = failures.get(url, 0) + 1
+            processed += 1
+
+        # Checkpoint after every batch; stored transcripts are already durable
+        store.set_checkpoint(checkpoint_name, {'completed': completed, 'failures': failures})
+
+        elapsed = time.perf_counter() - start
+        batch_rate = len(batch) / (time.perf_counter() - batch_start)
+        print(f"   [{offset + len(batch)}/{len(pending)}] batch {batch_rate:.2f} docs/sec, "
+              f"overall {processed / elapsed:.2f} docs/sec, {len(failures)} failing")
+
+    elapsed = time.perf_counter() - start
+    rate = processed / elapsed if elapsed else 0.0
+    print(f"   ✅ {ticker}: {processed} processed in {elapsed:.1f}s ({rate:.2f} docs/sec), "
+          f"{len(failures)} failing")
+    return processed, elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--ticker', action='append', help='Ticker to backfill (repeatable, default NVDA)')
+    arg_parser.add_argument('--since', help='Also crawl monthly sitemaps from this month (YYYY-MM)')
+    arg_parser.add_argument('--batch-size', type=int, default=4)
+    arg_parser.add_argument('--limit', type=int, default=0, help='Max transcripts to fetch per ticker this run')
+    arg_parser.add_argument('--retry-failed', action='store_true', help='Forget previous failures and retry them')
+    arg_parser.add_argument('--workers', type=int, default=None,
+                            help='Processes parsing each batch (default $PARSE_WORKERS or one per CPU)')
+    arg_parser.add_argument('--cache-dir', default=None, help='Defaults to $CACHE_DIR or ./cache')
+    args = arg_parser.parse_args()
+
+    load_dotenv()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    cache_dir = args.cache_dir or os.getenv('CACHE_DIR', './cache')
+    workers = args.workers or int(os.getenv('PARSE_WORKERS', 0)) or os.cpu_count()
+    scraper = create_scraper(cache_dir)
+    # Parse through the same cache /api/analyze reads, so backfilled transcripts are never re-parsed
+    parser = ParseCache(os.getenv('PARSE_CACHE_DIR', os.path.join(cache_dir, 'parsed')), ParserCascade())
+    store = TranscriptStore(os.getenv('TRANSCRIPT_STORE_DIR', os.path.join(cache_dir, 'transcripts')))
+
+    print("=" * 80)
+    print("TRANSCRIPT BACKFILL")
+    print("=" * 80)
+
+    total_docs, total_time = 0, 0.0
+    try:
+        for ticker in [t.upper() for t in (args.ticker or ['NVDA'])]:
+            docs, elapsed = backfill_ticker(ticker, scraper, parser, store, args.since,
+                                            args.batch_size, args.limit, args.retry_failed, workers)
+            total_docs += docs
+            total_time += elapsed
+    except KeyboardInterrupt:
+        print("\n⏸  Interrupted - progress is saved, re-run the same command to resume")
+
+    if total_time:
+        print(f"\nTotal: {total_docs} docs in {total_time:.1f}s ({total_docs / total_time:.2f} docs/sec)")
+    stats = parser.stats()
+    print(f"Parse cache: {stats['hits']} hits, {stats['misses']} misses (parser {stats['fingerprint']})")
+    for name, strategy in parser.parser.stats().items():
+        print(f"   {name:<12} {strategy['runs']} runs, {strategy['hit_rate']:.0%} passed checks, "
+              f"{strategy['selected']} used, {strategy['mean_ms']:.1f} ms mean")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark the scraper's HTML extractor backends on saved transcript pages
+
+Usage:
+    python scripts/benchmark_extractors.py saved_pages/ [--repeat 5]
+    python scripts/benchmark_extractors.py --page-store ./cache/pages
+"""
+import sys
+import argparse
+import logging
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.scraper import MotleyFoolScraper
+from services.extractors import EXTRACTORS, LXML_AVAILABLE, get_extractor
+
+
+def load_pages(paths, page_store_dir=None):
+    """Return (name, body) pairs from .html files, directories and/or a page store"""
+    pages = []
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.glob('*.html')) if path.is_dir() else [path]
+        for file in files:
+            pages.append((file.name, file.read_bytes()))
+
+    if page_store_dir:
+        from services.page_store import PageStore
+        store = PageStore(page_store_dir)
+        for key in store.cache.iterkeys():
+            if isinstance(key, str) and key.startswith('page:'):
+                entry = store.cache[key]
+                body = store.get_body(entry['content_hash'])
+                if body is not None:
+                    pages.append((entry['url'], body))
+
+    return pages
+
+
+def measure(scraper, name, body, repeat):
+    """Best-of-N parse time and peak Python heap for one extraction"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = scraper._extract_transcript(name, body)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    scraper._extract_transcript(name, body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, min(timings), peak
+
+
+def run_benchmark(pages, repeat):
+    backends = [name for name in EXTRACTORS if name != 'lxml' or LXML_AVAILABLE]
+    scrapers = {name: MotleyFoolScraper(extractor=get_extractor(name)) for name in backends}
+
+    print("=" * 80)
+    print("EXTRACTOR BENCHMARK")
+    print("=" * 80)
+    print(f"Pages: {len(pages)}   Backends: {', '.join(backends)}   Repeat: {repeat}")
+
+    totals = {name: [0.0, 0] for name in backends}
+    mismatches = 0
+
+    for page_name, body in pages:
+        print(f"\n{page_name} ({len(body) / 1024:.1f} KB)")
+        reference_text = None
+
+        for backend in backends:
+            result, elapsed, peak = measure(scrapers[backend], page_name, body, repeat)
+            full_text = result['full_text'] if result else None
+            totals[backend][0] += elapsed
+            totals[backend][1] = max(totals[backend][1], peak)
+
+            if reference_text is None:
+                reference_text = full_text
+                status = 'reference'
+            else:
+                identical = full_text == reference_text
+                mismatches += 0 if identical else 1
+                status = 'identical' if identical else 'MISMATCH'
+
+            print(f"  {backend:<12} {elapsed * 1000:9.1f} ms   peak {peak / 1024 / 1024:7.2f} MB   {status}")
+
+    print("\n" + "-" * 80)
+    baseline = totals[backends[0]][0]
+    for backend in backends:
+        elapsed, peak = totals[backend]
+        speedup = baseline / elapsed if elapsed else 0.0
+        print(f"{backend:<12} total {elapsed * 1000:9.1f} ms   max peak {peak / 1024 / 1024:7.2f} MB   {speedup:5.2f}x")
+    print("Note: peak memory is the Python heap (tracemalloc); lxml's C-level buffers are not included.")
+
+    if mismatches:
+        print(f"\n❌ {mismatches} page(s) produced different full_text")
+    else:
+        print("\n✅ All backends produced identical full_text")
+    return mismatches
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('paths', nargs='*', help='Saved .html pages or directories of them')
+    arg_parser.add_argument('--page-store', help='Also benchmark every page in this PageStore directory')
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.INFO)
+    pages = load_pages(args.paths, args.page_store)
+    if not pages:
+        arg_parser.error('no pages found')
+
+    sys.exit(1 if run_benchmark(pages, args.repeat) else 0)
+
+
+if __name__ == "__main__":
+    main()
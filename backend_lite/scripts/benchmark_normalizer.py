@@ -0,0 +1,222 @@
+"""
+Check the precompiled text normalizers against the original re.sub chains and time both
+
+The legacy_* functions are the cleanup code the scraper, parser and
+sentiment analyzer ran before services/text_normalizer.py, kept verbatim as
+the reference.
+
+Usage:
+    python scripts/benchmark_normalizer.py saved_pages/ [--repeat 5]
+    python scripts/benchmark_normalizer.py --page-store ./cache/pages
+"""
+import re
+import sys
+import time
+import argparse
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.extractors import HtmlParserExtractor, find_largest_text_block
+from services.parser import TranscriptParser
+from services.text_normalizer import SCRAPED_TEXT, RAW_TEXT, BOILERPLATE, SEGMENT_CONTENT, SENTIMENT_TEXT
+
+
+def legacy_scraped_text(full_text):
+    full_text = re.sub(r'\n{3,}', '\n\n', full_text)
+    full_text = re.sub(r'[ \t]+', ' ', full_text)
+    return full_text
+
+
+def legacy_raw_text(text):
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'Image\s+source:?[^\n]*', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'Advertisement[^\n]*', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = re.sub(r'^\s+|\s+$', '', text, flags=re.MULTILINE)
+    return text.strip()
+
+
+def legacy_boilerplate(text):
+    boilerplate_patterns = [
+        r'The Motley Fool\.\s*',
+        r'Nvidia\s*\(\s*NVDA\s*[+-]?\d*\.?\d*%?\s*\)',
+        r'Q\d+\s+\d{4}\s+Earnings\s+Call',
+        r'[A-Z][a-z]+\s+\d{1,2},\s+\d{4}',
+        r'\d{1,2}:\d{2}\s+[ap]\.m\.\s+ET',
+        r'Image\s+source[^\n]*',
+        r'Call\s+Participants',
+        r'Prepared\s+Remarks',
+        r'Questions\s+and\s+Answers',
+        r'Operator\s*Good\s+afternoon\.[^.]*conference\s+operator[^.]*\.',
+    ]
+    for pattern in boilerplate_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    return text.strip()
+
+
+def legacy_segment_content(content):
+    title_patterns = [
+        r'^[A-Z][a-z\s,]+(?:Director|Officer|President|CEO|CFO)[^\n]*\n',
+        r'^Thanks?,?\s+[A-Z][a-z]+\.\s*',
+        r'^\s*[\w\s]+,\s+[\w\s]+\s*\n',
+    ]
+    for pattern in title_patterns:
+        content = re.sub(pattern, '', content, flags=re.MULTILINE)
+    content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
+    content = re.sub(r'^\s+|\s+$', '', content)
+    return content
+
+
+def legacy_sentiment_text(text):
+    patterns_to_remove = [
+        r'\([A-Z]{2,5}\s*[+-]?\d*\.?\d*%?\)',
+        r'Q\d+\s+\d{4}',
+        r'\b\d{1,2}:\d{2}\s*[ap]\.?m\.?\b',
+        r'\b[A-Z][a-z]+\s+\d{1,2},\s+\d{4}\b',
+    ]
+    for pattern in patterns_to_remove:
+        text = re.sub(pattern, ' ', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+STAGES = [
+    ('scraper', legacy_scraped_text, SCRAPED_TEXT),
+    ('raw_text', legacy_raw_text, RAW_TEXT),
+    ('boilerplate', legacy_boilerplate, BOILERPLATE),
+    ('segment_content', legacy_segment_content, SEGMENT_CONTENT),
+    ('sentiment', legacy_sentiment_text, SENTIMENT_TEXT),
+]
+
+
+def load_pages(paths, page_store_dir=None):
+    """Return (name, body) pairs from .html files, directories and/or a page store"""
+    pages = []
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.glob('*.html')) if path.is_dir() else [path]
+        for file in files:
+            pages.append((file.name, file.read_bytes()))
+
+    if page_store_dir:
+        from services.page_store import PageStore
+        store = PageStore(page_store_dir)
+        for key in store.cache.iterkeys():
+            if isinstance(key, str) and key.startswith('page:'):
+                entry = store.cache[key]
+                body = store.get_body(entry['content_hash'])
+                if body is not None:
+                    pages.append((entry['url'], body))
+
+    return pages
+
+
+def stage_inputs(body, parser):
+    """The text each stage sees for one page, as the pipeline would produce it"""
+    soup = HtmlParserExtractor().parse_full(body)
+    article = soup.select_one("div[class*='article-body']") or find_largest_text_block(soup)
+    if not article:
+        return None
+
+    raw = article.get_text(separator='\n', strip=True)
+    full_text = legacy_scraped_text(raw)
+    cleaned = legacy_raw_text(full_text)
+    sectioned = legacy_boilerplate(cleaned)
+    parts = parser.speaker_pattern.split(sectioned)
+    contents = [parts[i + 1] for i in range(1, len(parts) - 1, 2)]
+    segments = [legacy_segment_content(content) for content in contents]
+
+    return {
+        'scraper': [raw],
+        'raw_text': [full_text],
+        'boilerplate': [cleaned],
+        'segment_content': contents,
+        'sentiment': segments + [' '.join(segments[:3])],
+    }
+
+
+def best_time(function, texts, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            function(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmark(pages, repeat):
+    parser = TranscriptParser()
+
+    print("=" * 80)
+    print("TEXT NORMALIZER BENCHMARK")
+    print("=" * 80)
+    print(f"Pages: {len(pages)}   Repeat: {repeat}")
+
+    inputs = {name: [] for name, _, _ in STAGES}
+    for page_name, body in pages:
+        page_inputs = stage_inputs(body, parser)
+        if page_inputs is None:
+            print(f"  ⚠️  {page_name}: no article found, skipped")
+            continue
+        for name, texts in page_inputs.items():
+            inputs[name].extend(texts)
+
+    mismatches = 0
+    legacy_total = new_total = 0.0
+    fired = {}
+
+    print(f"\n{'stage':<16} {'texts':>6} {'legacy ms':>11} {'new ms':>10} {'speedup':>8}   output")
+    for name, legacy, normalizer in STAGES:
+        texts = inputs[name]
+        different = sum(1 for text in texts if legacy(text) != normalizer.normalize(text))
+        mismatches += different
+
+        legacy_time = best_time(legacy, texts, repeat)
+        new_time = best_time(normalizer.normalize, texts, repeat)
+        legacy_total += legacy_time
+        new_total += new_time
+
+        for text in texts:
+            normalizer.normalize(text, fired.setdefault(name, {}))
+
+        speedup = legacy_time / new_time if new_time else 0.0
+        status = 'identical' if not different else f'{different} MISMATCH'
+        print(f"{name:<16} {len(texts):>6} {legacy_time * 1000:>11.2f} {new_time * 1000:>10.2f} "
+              f"{speedup:>7.2f}x   {status}")
+
+    print("-" * 80)
+    speedup = legacy_total / new_total if new_total else 0.0
+    print(f"{'total':<16} {'':>6} {legacy_total * 1000:>11.2f} {new_total * 1000:>10.2f} {speedup:>7.2f}x")
+
+    print("\nRules fired:")
+    for name, counts in fired.items():
+        summary = ', '.join(f"{rule}={count}" for rule, count in sorted(counts.items(), key=lambda kv: -kv[1]))
+        print(f"  {name:<16} {summary or '-'}")
+
+    if mismatches:
+        print(f"\n❌ {mismatches} text(s) normalized differently")
+    else:
+        print("\n✅ Normalizers match the legacy re.sub chains")
+    return mismatches
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('paths', nargs='*', help='Saved .html pages or directories of them')
+    arg_parser.add_argument('--page-store', help='Also use every page in this PageStore directory')
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.INFO)
+    pages = load_pages(args.paths, args.page_store)
+    if not pages:
+        arg_parser.error('no pages found')
+
+    sys.exit(1 if run_benchmark(pages, args.repeat) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Measure how TranscriptParser and each of its regexes scale with transcript size on synthetic input
+
+For every quirk profile and size (10KB to 10MB by default) a seeded
+synthetic transcript is generated and parsed. Reported per size: parse
+time, peak traced allocation, and the time of every pattern the parser
+runs, applied to the whole text the way the parser applies it. A
+log-log fit of time against size gives each pattern's growth exponent;
+anything above --threshold is flagged as super-linear. Patterns projected
+to exceed --budget seconds at the next size are skipped from then on.
+
+Usage:
+    python scripts/benchmark_parser_scaling.py
+    python scripts/benchmark_parser_scaling.py --sizes 10KB,100KB,1MB --quirks letters_only --quirks none
+"""
+import re
+import sys
+import math
+import time
+import argparse
+import logging
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.parser import TranscriptParser
+from services.roster import PARTICIPANTS_HEADING
+from services.text_normalizer import RAW_TEXT, BOILERPLATE, SEGMENT_CONTENT, SENTIMENT_TEXT
+from services.transcript_generator import QUIRKS, TranscriptGenerator
+
+DEFAULT_SIZES = '10KB,100KB,1MB,10MB'
+DEFAULT_PROFILES = [
+    'none',
+    'boilerplate,split_roles,heading_variants,participants,whitespace',
+    'letters_only',
+    'single_line,no_qa_heading',
+]
+# Timings below this are dominated by noise and left out of the growth fit
+MIN_FIT_SECONDS = 0.001
+
+
+def parse_size(text):
+    units = {'KB': 1_000, 'MB': 1_000_000}
+    text = text.strip().upper()
+    for unit, factor in units.items():
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * factor)
+    return int(text)
+
+
+def format_size(chars):
+    return f"{chars / 1_000_000:g}MB" if chars >= 1_000_000 else f"{chars / 1_000:g}KB"
+
+
+def parser_patterns(parser):
+    """(name, function(text, text_lower)) for every regex the parser runs over transcript text"""
+    patterns = []
+    for table in ('prepared_remarks_patterns', 'qa_start_patterns', 'executive_patterns'):
+        for index, pattern in enumerate(getattr(parser, table)):
+            regex = re.compile(pattern, re.IGNORECASE)
+            patterns.append((f"{table}[{index}]", lambda text, lower, regex=regex: regex.search(lower)))
+
+    patterns.append(('speaker_pattern', lambda text, lower: parser.speaker_pattern.split(text)))
+    patterns.append(('participants_heading', lambda text, lower: PARTICIPANTS_HEADING.search(text)))
+
+    for profile_name, normalizer in (('raw_text', RAW_TEXT), ('boilerplate', BOILERPLATE),
+                                     ('segment_content', SEGMENT_CONTENT), ('sentiment', SENTIMENT_TEXT)):
+        for rule, regex, replacement in normalizer._compiled:
+            patterns.append((f"{profile_name}.{rule.name}",
+                             lambda text, lower, regex=regex, replacement=replacement: regex.subn(replacement, text)))
+    return patterns
+
+
+def best_time(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def growth_exponent(points):
+    """Least-squares slope of log(time) against log(size), or None with under two usable points"""
+    points = [(size, seconds) for size, seconds in points if seconds is not None and seconds >= MIN_FIT_SECONDS]
+    if len(points) < 2:
+        return None
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(seconds) for _, seconds in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance if variance else None
+
+
+def run_profile(profile, sizes, seed, repeat, budget, threshold):
+    quirks = [] if profile == 'none' else profile.split(',')
+    parser = TranscriptParser()
+    patterns = parser_patterns(parser)
+    generator = TranscriptGenerator(seed)
+
+    print(f"\nProfile: {profile}")
+    print(f"{'size':>8} {'parse ms':>10} {'ms/MB':>9} {'peak MB':>9} {'mgmt':>6} {'qa':>6}   slowest pattern")
+
+    parse_points = []
+    pattern_points = {name: [] for name, _ in patterns}
+    skipped = {}
+
+    for size in sizes:
+        transcript = generator.generate(size, quirks=quirks)
+        text = transcript['full_text']
+        lower = text.lower()
+        runs = repeat if size <= 1_000_000 else 1
+
+        elapsed = best_time(lambda: parser.parse(transcript), runs)
+        tracemalloc.start()
+        parsed = parser.parse(transcript)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        parse_points.append((len(text), elapsed))
+
+        timings = {}
+        for name, function in patterns:
+            points = pattern_points[name]
+            if name in skipped:
+                points.append((len(text), None))
+                continue
+            if points and points[-1][1]:
+                exponent = growth_exponent(points) or 1.0
+                projected = points[-1][1] * (len(text) / points[-1][0]) ** max(exponent, 1.0)
+                if projected > budget:
+                    skipped[name] = projected
+                    points.append((len(text), None))
+                    continue
+            timings[name] = best_time(lambda: function(text, lower), runs)
+            points.append((len(text), timings[name]))
+
+        slowest = max(timings, key=timings.get) if timings else '-'
+        slowest_text = f"{slowest} ({timings[slowest] * 1000:.1f} ms)" if timings else '-'
+        print(f"{format_size(size):>8} {elapsed * 1000:>10.1f} {elapsed * 1000 / (len(text) / 1e6):>9.1f} "
+              f"{peak / 1e6:>9.1f} {len(parsed['management_remarks']):>6} {len(parsed['qa_session']):>6}   {slowest_text}")
+
+    flagged = []
+    parse_exponent = growth_exponent(parse_points)
+    if parse_exponent is not None and parse_exponent > threshold:
+        flagged.append(('TranscriptParser.parse', parse_exponent))
+
+    print(f"\n  {'pattern':<36} " + ' '.join(f"{format_size(size):>9}" for size in sizes) + f" {'growth':>7}")
+    for name, points in pattern_points.items():
+        exponent = growth_exponent(points)
+        if exponent is not None and exponent > threshold:
+            flagged.append((name, exponent))
+        cells = ' '.join(f"{seconds * 1000:>7.1f}ms" if seconds is not None else f"{'skipped':>9}"
+                         for _, seconds in points)
+        growth = f"n^{exponent:.2f}" if exponent is not None else '-'
+        marker = '  ⚠️' if exponent is not None and exponent > threshold else ''
+        print(f"  {name:<36} {cells} {growth:>7}{marker}")
+
+    print(f"\n  parse growth: {'n^%.2f' % parse_exponent if parse_exponent is not None else '-'}")
+    for name, projected in skipped.items():
+        print(f"  ⏭  {name} skipped above budget (projected {projected:.0f}s)")
+    return flagged
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--sizes', default=DEFAULT_SIZES, help=f"Comma-separated sizes (default {DEFAULT_SIZES})")
+    arg_parser.add_argument('--quirks', action='append',
+                            help=f"Comma-separated quirk profile, or 'none' (repeatable). Quirks: {', '.join(QUIRKS)}")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Best-of-N timing for sizes up to 1MB')
+    arg_parser.add_argument('--budget', type=float, default=30.0, help='Skip a pattern projected to take longer (s)')
+    arg_parser.add_argument('--threshold', type=float, default=1.25, help='Growth exponent flagged as super-linear')
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    sizes = sorted(parse_size(size) for size in args.sizes.split(','))
+
+    print("=" * 80)
+    print("PARSER SCALING BENCHMARK")
+    print("=" * 80)
+    print(f"Sizes: {', '.join(format_size(size) for size in sizes)}   Seed: {args.seed}   "
+          f"Threshold: n^{args.threshold}")
+
+    flagged = []
+    for profile in args.quirks or DEFAULT_PROFILES:
+        flagged += [(profile, name, exponent) for name, exponent in
+                    run_profile(profile, sizes, args.seed, args.repeat, args.budget, args.threshold)]
+
+    print("\n" + "=" * 80)
+    if flagged:
+        print(f"❌ {len(flagged)} super-linear pattern(s):")
+        for profile, name, exponent in flagged:
+            print(f"   {name:<36} n^{exponent:.2f}   [{profile}]")
+    else:
+        print("✅ Parse time and every pattern scale linearly")
+    sys.exit(1 if flagged else 0)
+
+
+if __name__ == "__main__":
+    main()
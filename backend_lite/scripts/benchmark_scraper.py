@@ -0,0 +1,91 @@
+"""
+Deterministic scrape + parse throughput benchmark against recorded fixtures
+
+Starts a local ReplayServer with the given latency/error profile, then runs
+discovery, concurrent scraping and parsing through it. No network is used.
+
+Usage:
+    python scripts/benchmark_scraper.py fixtures/ --quarters 4 --runs 3 --latency 0.2 --rate 10
+"""
+import sys
+import time
+import argparse
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.scraper import MotleyFoolScraper
+from services.parser import TranscriptParser
+from services.pipeline import PipelineContext
+from services.replay import ReplayServer, configure_session
+
+
+def run_once(upstream, ticker, quarters, rate, workers):
+    scraper = MotleyFoolScraper()
+    scraper.rate_limiter.rate = rate
+    scraper.MAX_WORKERS = workers
+    configure_session(scraper.session, mode='upstream', upstream=upstream,
+                      **scraper.transport.adapter_kwargs)
+
+    start = time.perf_counter()
+    urls = scraper.find_transcript_urls(ticker, quarters)
+    discovered = time.perf_counter()
+
+    context = PipelineContext(ticker, quarters)
+    context.load(scraper, TranscriptParser(), urls)
+    finished = time.perf_counter()
+
+    return {
+        'discovery': discovered - start,
+        'scrape_parse': finished - discovered,
+        'total': finished - start,
+        'documents': len(context.transcripts)
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('fixture_dir')
+    arg_parser.add_argument('--ticker', default='NVDA')
+    arg_parser.add_argument('--quarters', type=int, default=4)
+    arg_parser.add_argument('--runs', type=int, default=3)
+    arg_parser.add_argument('--workers', type=int, default=MotleyFoolScraper.MAX_WORKERS)
+    arg_parser.add_argument('--rate', type=float, default=1.0 / MotleyFoolScraper.RATE_LIMIT_DELAY,
+                            help='Requests per second allowed per host')
+    arg_parser.add_argument('--latency', type=float, default=0.0)
+    arg_parser.add_argument('--jitter', type=float, default=0.0)
+    arg_parser.add_argument('--error-rate', type=float, default=0.0)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    server = ReplayServer(args.fixture_dir, latency=args.latency, jitter=args.jitter,
+                          error_rate=args.error_rate, seed=args.seed).start()
+
+    print("=" * 80)
+    print("SCRAPER THROUGHPUT BENCHMARK (offline)")
+    print("=" * 80)
+    print(f"Fixtures: {len(server.fixtures.index)}   Workers: {args.workers}   Rate: {args.rate}/s   "
+          f"Latency: {args.latency}s ±{args.jitter}s   Error rate: {args.error_rate:.0%}")
+
+    try:
+        totals = []
+        for run in range(1, args.runs + 1):
+            result = run_once(server.url, args.ticker, args.quarters, args.rate, args.workers)
+            totals.append(result)
+            docs_per_sec = result['documents'] / result['total'] if result['total'] else 0.0
+            print(f"  run {run}: {result['documents']} docs   discovery {result['discovery']:.2f}s   "
+                  f"scrape+parse {result['scrape_parse']:.2f}s   {docs_per_sec:.2f} docs/sec")
+    finally:
+        server.stop()
+
+    documents = sum(r['documents'] for r in totals)
+    elapsed = sum(r['total'] for r in totals)
+    print("-" * 80)
+    print(f"Overall: {documents} docs in {elapsed:.2f}s = {documents / elapsed if elapsed else 0.0:.2f} docs/sec "
+          f"({server.requests_served} HTTP requests served)")
+
+
+if __name__ == "__main__":
+    main()
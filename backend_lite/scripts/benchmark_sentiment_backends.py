@@ -0,0 +1,144 @@
+"""
+Benchmark FinBERT inference backends (fp32, dynamic int8, ONNX Runtime) on a fixed segment set
+
+Segments come from seeded synthetic transcripts, so every run scores the
+same texts. Per backend: load time (the first run includes exporting the
+artifact into MODEL_CACHE_DIR), single-text latency, batched throughput,
+and agreement of labels and probabilities with fp32.
+
+Usage:
+    python scripts/benchmark_sentiment_backends.py
+    python scripts/benchmark_sentiment_backends.py --backends fp32,int8 --segments 256 --batch-size 32
+"""
+import os
+import sys
+import time
+import argparse
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.inference_backends import BACKENDS, ONNXRUNTIME_AVAILABLE
+from services.parser import TranscriptParser
+from services.sentiment_analyzer import SentimentAnalyzer
+from services.text_normalizer import SENTIMENT_TEXT
+from services.transcript_generator import TranscriptGenerator
+
+LATENCY_SAMPLES = 16
+
+
+def segment_texts(count, seed):
+    """The first count cleaned segments of a seeded synthetic corpus"""
+    parser = TranscriptParser()
+    texts = []
+    for transcript in TranscriptGenerator(seed).corpus(max(1, count // 20), target_chars=50_000, quirks=[]):
+        parsed = parser.parse(transcript)
+        texts += [SENTIMENT_TEXT.normalize(segment.content)
+                  for segment in parsed['management_remarks'] + parsed['qa_session']]
+    return texts[:count]
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def run_backend(name, texts, batch_size, repeat, model_cache_dir):
+    start = time.perf_counter()
+    analyzer = SentimentAnalyzer(batch_size=batch_size, backend=name, model_cache_dir=model_cache_dir)
+    load_seconds = time.perf_counter() - start
+    if analyzer.model is None:
+        return None
+
+    analyzer.analyze_segments(texts[:batch_size])  # warm-up
+
+    latencies = []
+    for text in texts[:LATENCY_SAMPLES]:
+        start = time.perf_counter()
+        analyzer.analyze_segments([text])
+        latencies.append(time.perf_counter() - start)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = analyzer.analyze_segments(texts)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        'backend': analyzer.model.name,
+        'load_seconds': load_seconds,
+        'p50_ms': percentile(latencies, 0.5) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'throughput': len(texts) / min(timings),
+        'results': results
+    }
+
+
+def agreement(results, reference):
+    """Share of identical labels and mean absolute probability difference"""
+    same = sum(result['sentiment'] == ref['sentiment'] for result, ref in zip(results, reference))
+    diff = sum(abs(result['scores'][label] - ref['scores'][label])
+               for result, ref in zip(results, reference) for label in SentimentAnalyzer.LABELS)
+    return same / len(reference), diff / (len(reference) * len(SentimentAnalyzer.LABELS))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--backends', default=','.join(BACKENDS), help='Comma-separated, fp32 always runs')
+    arg_parser.add_argument('--segments', type=int, default=128)
+    arg_parser.add_argument('--batch-size', type=int, default=16)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--min-agreement', type=float, default=0.95, help='Label agreement with fp32 to pass')
+    arg_parser.add_argument('--model-cache-dir', default=os.getenv('MODEL_CACHE_DIR', './model_cache'))
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    backends = ['fp32'] + [name for name in args.backends.split(',') if name and name != 'fp32']
+    texts = segment_texts(args.segments, args.seed)
+
+    print("=" * 80)
+    print("SENTIMENT BACKEND BENCHMARK")
+    print("=" * 80)
+    print(f"{len(texts)} segments, batch size {args.batch_size}, best of {args.repeat}; "
+          f"onnxruntime {'available' if ONNXRUNTIME_AVAILABLE else 'not installed'}")
+    print(f"\n{'backend':<8} {'load s':>8} {'p50 ms':>8} {'p95 ms':>8} {'seg/s':>8} {'speedup':>8} "
+          f"{'labels':>8} {'mean |dp|':>10}")
+
+    reference = None
+    failed = []
+    for name in backends:
+        if name not in BACKENDS:
+            print(f"{name:<8} ❌ unknown backend")
+            failed.append(name)
+            continue
+        run = run_backend(name, texts, args.batch_size, args.repeat, args.model_cache_dir)
+        if run is None:
+            print(f"{name:<8} ❌ model could not be loaded")
+            failed.append(name)
+            if name == 'fp32':
+                break
+            continue
+        if run['backend'] != name:
+            print(f"{name:<8} ⚠️  fell back to {run['backend']}")
+            continue
+
+        reference = reference or run
+        labels, diff = agreement(run['results'], reference['results'])
+        if labels < args.min_agreement:
+            failed.append(name)
+        print(f"{name:<8} {run['load_seconds']:>8.1f} {run['p50_ms']:>8.1f} {run['p95_ms']:>8.1f} "
+              f"{run['throughput']:>8.1f} {run['throughput'] / reference['throughput']:>7.2f}x "
+              f"{labels:>8.1%} {diff:>10.4f}")
+
+    print("\n" + "=" * 80)
+    if failed:
+        print(f"❌ Failed or below {args.min_agreement:.0%} label agreement: {', '.join(failed)}")
+    else:
+        print(f"✅ Every backend agrees with fp32 on at least {args.min_agreement:.0%} of labels")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Record transcript pages as fixtures, or serve them from a local stand-in for fool.com
+
+Usage:
+    # Record the quote page, archive and latest transcripts (needs network)
+    python scripts/replay_server.py record fixtures/ --ticker NVDA --quarters 4
+
+    # Serve them offline with 200ms +-50ms latency and 5% injected 503s
+    python scripts/replay_server.py serve fixtures/ --port 8765 --latency 0.2 --jitter 0.05 --error-rate 0.05
+
+    # Point the backend at the stand-in
+    SCRAPER_HTTP_MODE=upstream SCRAPER_UPSTREAM=http://127.0.0.1:8765 python app.py
+"""
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.scraper import MotleyFoolScraper
+from services.replay import ReplayServer, configure_session
+
+
+def record(fixture_dir, ticker, quarters):
+    """Fetch discovery pages and transcripts live, saving every response"""
+    scraper = MotleyFoolScraper()
+    configure_session(scraper.session, mode='record', fixture_dir=fixture_dir,
+                      **scraper.transport.adapter_kwargs)
+
+    urls = scraper.find_transcript_urls(ticker, quarters)
+    results = scraper.scrape_transcripts(urls)
+
+    print(f"Recorded {sum(1 for r in results if r)}/{len(urls)} transcripts into {fixture_dir}")
+    for url, result in zip(urls, results):
+        print(f"  {'✅' if result else '❌'} {url}")
+
+
+def serve(fixture_dir, host, port, latency, jitter, error_rate, error_status, seed):
+    server = ReplayServer(fixture_dir, host=host, port=port, latency=latency, jitter=jitter,
+                          error_rate=error_rate, error_status=error_status, seed=seed)
+    print(f"Serving {len(server.fixtures.index)} fixtures from {fixture_dir} on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help='Record live pages as fixtures')
+    record_parser.add_argument('fixture_dir')
+    record_parser.add_argument('--ticker', default='NVDA')
+    record_parser.add_argument('--quarters', type=int, default=4)
+
+    serve_parser = commands.add_parser('serve', help='Serve recorded fixtures over HTTP')
+    serve_parser.add_argument('fixture_dir')
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    serve_parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency, in seconds')
+    serve_parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests that fail')
+    serve_parser.add_argument('--error-status', type=int, default=503)
+    serve_parser.add_argument('--seed', type=int, default=None)
+
+    args = arg_parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    if args.command == 'record':
+        record(args.fixture_dir, args.ticker, args.quarters)
+    else:
+        serve(args.fixture_dir, args.host, args.port, args.latency, args.jitter,
+              args.error_rate, args.error_status, args.seed)
+
+
+if __name__ == "__main__":
+    main()
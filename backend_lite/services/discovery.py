@@ -0,0 +1,114 @@
+"""
+Persistent index of discovered earnings call transcript URLs
+"""
+import re
+import logging
+from datetime import datetime
+from typing import List, Dict, Optional
+import diskcache as dc
+
+logging.basicConfig(level=logging.INFO)
+
+# e.g. /earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/
+TRANSCRIPT_URL_PATTERN = re.compile(
+    r'/call-transcripts/(?P<pub_year>\d{4})/(?P<pub_month>\d{1,2})/(?P<pub_day>\d{1,2})/'
+    r'(?P<slug>[a-z0-9.-]*?-(?P<ticker>[a-z.]+)-q(?P<quarter>[1-4])-(?P<year>\d{4})-earnings-call-transcript)'
+)
+
+
+def parse_transcript_url(url: str) -> Optional[Dict]:
+    """Ticker, fiscal quarter/year and publish date from a transcript URL slug"""
+    match = TRANSCRIPT_URL_PATTERN.search(url.lower())
+    if not match:
+        return None
+
+    return {
+        'ticker': match.group('ticker').upper(),
+        'quarter': int(match.group('quarter')),
+        'year': int(match.group('year')),
+        'published': f"{match.group('pub_year')}-{int(match.group('pub_month')):02d}-{int(match.group('pub_day')):02d}"
+    }
+
+
+def latest_transcripts(entries, num_quarters: int) -> List[Dict]:
+    """Newest entries first by fiscal (year, quarter), one per quarter"""
+    by_quarter = {}
+    for entry in entries:
+        quarter_key = (entry['year'], entry['quarter'])
+        # Prefer the latest publication if a quarter was indexed under two URLs
+        if quarter_key not in by_quarter or entry['published'] > by_quarter[quarter_key]['published']:
+            by_quarter[quarter_key] = entry
+
+    ordered = sorted(by_quarter.values(),
+                     key=lambda e: (e['year'], e['quarter'], e['published']),
+                     reverse=True)
+    return ordered[:num_quarters]
+
+
+class TranscriptIndex:
+    """Known transcripts per ticker: (ticker, quarter, year, url, first_seen)
+
+    The index only grows; a refresh adds URLs it has not seen before and
+    leaves existing entries (and their first_seen) untouched. Listing pages
+    are re-crawled once the ticker's TTL has expired.
+    """
+
+    def __init__(self, directory: str, ttl: int = 6 * 3600):
+        self.logger = logging.getLogger(__name__)
+        self.cache = dc.Cache(directory)
+        self.ttl = ttl
+
+    def entries(self, ticker: str) -> Dict[str, Dict]:
+        """All indexed transcripts for a ticker, keyed by URL"""
+        return self.cache.get(f'transcripts:{ticker.upper()}', {})
+
+    def add(self, ticker: str, urls: List[str], source: str) -> int:
+        """Index any new URLs for this ticker, returning how many were added"""
+        ticker = ticker.upper()
+        key = f'transcripts:{ticker}'
+
+        with self.cache.transact():
+            entries = self.cache.get(key, {})
+            added = 0
+            for url in urls:
+                if url in entries:
+                    continue
+
+                info = parse_transcript_url(url)
+                if not info or info['ticker'] != ticker:
+                    continue
+
+                entries[url] = {
+                    **info,
+                    'url': url,
+                    'source': source,
+                    'first_seen': datetime.now().isoformat()
+                }
+                added += 1
+
+            if added:
+                self.cache.set(key, entries)
+
+        if added:
+            self.logger.info(f"Indexed {added} new {ticker} transcripts from {source}")
+        return added
+
+    def is_stale(self, ticker: str) -> bool:
+        return f'refreshed:{ticker.upper()}' not in self.cache
+
+    def mark_refreshed(self, ticker: str) -> None:
+        self.cache.set(f'refreshed:{ticker.upper()}', datetime.now().isoformat(), expire=self.ttl)
+
+    def is_crawled(self, listing_url: str) -> bool:
+        """Whether a listing page that never changes (e.g. a past sitemap month) was already read"""
+        return f'crawled:{listing_url}' in self.cache
+
+    def mark_crawled(self, listing_url: str) -> None:
+        self.cache.set(f'crawled:{listing_url}', datetime.now().isoformat())
+
+    def latest(self, ticker: str, num_quarters: int) -> List[Dict]:
+        """Most recent transcripts first, one per fiscal quarter"""
+        return latest_transcripts(self.entries(ticker).values(), num_quarters)
+
+    def latest_urls(self, ticker: str, num_quarters: int) -> List[str]:
+        return [entry['url'] for entry in self.latest(ticker, num_quarters)]
@@ -0,0 +1,417 @@
+"""
+HTML parsing backends for the transcript scraper
+"""
+import re
+import logging
+from bisect import bisect_left
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString, CData
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logging.basicConfig(level=logging.INFO)
+
+ARTICLE_BODY_SELECTOR = "div[class*='article-body']"
+
+# String types get_text() includes by default (comments, scripts and styles are skipped)
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+# Article headings that start a section, and the label given to turns under them
+SECTION_HEADINGS = [
+    ('prepared_remarks', re.compile(r'prepared\s+remarks', re.IGNORECASE)),
+    ('qa', re.compile(r'questions?\s*(?:&|and)\s*answers?', re.IGNORECASE)),
+    ('participants', re.compile(r'call\s+participants', re.IGNORECASE)),
+]
+HEADING_TAGS = {'h2', 'h3'}
+BLOCK_TAGS = {'p'} | HEADING_TAGS
+BOLD_TAGS = {'strong', 'b'}
+MAX_SPEAKER_HEADER_LENGTH = 200
+
+
+class HtmlParserExtractor:
+    """Full-document parse with the pure-Python html.parser (reference behaviour)"""
+
+    name = 'html.parser'
+    features = 'html.parser'
+
+    def parse_transcript_page(self, content: bytes) -> BeautifulSoup:
+        """Tree containing at least the page's h1 and article body"""
+        return BeautifulSoup(content, self.features)
+
+    def parse_quote_page(self, content: bytes) -> BeautifulSoup:
+        """Tree containing the quote page's transcript links"""
+        return BeautifulSoup(content, self.features)
+
+    def parse_full(self, content: bytes) -> BeautifulSoup:
+        return BeautifulSoup(content, self.features)
+
+
+class LxmlExtractor(HtmlParserExtractor):
+    """C-accelerated lxml parse that only builds the subtrees the scraper reads
+
+    The h1 and the article-body div are parsed with SoupStrainers, so the
+    navigation, recommendation widgets and scripts around the transcript never
+    become BeautifulSoup objects. Text is still produced by get_text on the
+    same elements, which keeps full_text identical to the html.parser path.
+    """
+
+    name = 'lxml'
+    features = 'lxml'
+
+    title_strainer = SoupStrainer('h1')
+    article_strainer = SoupStrainer('div', class_=re.compile('article-body'))
+    quote_strainer = SoupStrainer(['a', 'section'])
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def parse_transcript_page(self, content: bytes) -> BeautifulSoup:
+        article_soup = BeautifulSoup(content, self.features, parse_only=self.article_strainer)
+        if not article_soup.select_one(ARTICLE_BODY_SELECTOR):
+            # The scraper's fallback selectors need the whole document
+            self.logger.info("No article-body container, falling back to a full lxml parse")
+            return self.parse_full(content)
+
+        title_soup = BeautifulSoup(content, self.features, parse_only=self.title_strainer)
+        title = title_soup.find('h1')
+        if title:
+            article_soup.insert(0, title.extract())
+        return article_soup
+
+    def parse_quote_page(self, content: bytes) -> BeautifulSoup:
+        return BeautifulSoup(content, self.features, parse_only=self.quote_strainer)
+
+
+class SpeakerTurnBuilder:
+    """Groups the article's headings and paragraphs into speaker turns
+
+    A paragraph that starts in bold and has nothing but an optional
+    "-- role" after it is a speaker header ("<p><strong>Jensen Huang --
+    President and CEO</strong></p>"); the paragraphs that follow belong to
+    that speaker until the next header. Headings switch the section label.
+    """
+
+    def __init__(self):
+        self.turns: List[Dict] = []
+        self.section: Optional[str] = None
+        self._current: Optional[Dict] = None
+        self._paragraphs: List[str] = []
+
+    def heading(self, text: str) -> None:
+        for label, pattern in SECTION_HEADINGS:
+            if pattern.search(text):
+                self._close_turn()
+                self.section = label
+                return
+
+    def paragraph(self, text: str, lead: str) -> None:
+        """Add a paragraph; lead is its bold text up to the first non-bold text"""
+        if not text:
+            return
+
+        if lead and len(text) <= MAX_SPEAKER_HEADER_LENGTH and (
+                text == lead or text[len(lead):].lstrip().startswith('--')):
+            self._close_turn()
+            name, _, role = text.partition('--')
+            self._current = {'speaker': name.strip(), 'role': role.strip(' -'), 'section': self.section}
+        elif self._current is not None:
+            self._paragraphs.append(text)
+
+    def finish(self) -> List[Dict]:
+        self._close_turn()
+        return self.turns
+
+    def _close_turn(self) -> None:
+        if self._current is not None and self._paragraphs and self._current['section'] != 'participants':
+            self.turns.append({**self._current, 'content': '\n'.join(self._paragraphs)})
+        self._current = None
+        self._paragraphs = []
+
+
+class BlockTextCollector:
+    """Text of the article's current paragraph or heading, handed to a SpeakerTurnBuilder when it ends
+
+    A <p> cannot contain blocks, so the next paragraph or heading ends an
+    open one even where html.parser nested them; every text node belongs to
+    exactly one block. Text nodes are joined with spaces before whitespace is
+    collapsed, so words on either side of a <br> or a tag never run together.
+    """
+
+    def __init__(self, builder: SpeakerTurnBuilder):
+        self.builder = builder
+        self.tag: Optional[str] = None
+        self._parts: List[str] = []
+        self._lead_length: Optional[int] = None
+
+    def start(self, tag: str) -> bool:
+        """Open a block for a p/h2/h3 start tag; False when it stays inside the open heading"""
+        if self.tag == 'p':
+            self.end()
+        if self.tag is not None:
+            return False
+        self.tag = tag
+        self._parts = []
+        self._lead_length = None
+        return True
+
+    def text(self, text: str, bold: bool) -> None:
+        if self.tag is None:
+            return
+        if self._lead_length is None and text.strip() and not bold:
+            self._lead_length = len(self._parts)
+        self._parts.append(text)
+
+    def end(self) -> None:
+        if self.tag is None:
+            return
+        text = ' '.join(' '.join(self._parts).split())
+        if self.tag in HEADING_TAGS:
+            self.builder.heading(text)
+        else:
+            self.builder.paragraph(text, ' '.join(' '.join(self._parts[:self._lead_length]).split()))
+        self.tag = None
+
+
+def _in_bold(node, block: Tag) -> bool:
+    for parent in node.parents:
+        if parent is block:
+            return False
+        if parent.name in BOLD_TAGS:
+            return True
+    return False
+
+
+def extract_speaker_turns(article: Tag) -> List[Dict]:
+    """Speaker turns ({'speaker', 'role', 'section', 'content'}) from an article's markup in one pass
+
+    Blocks are read in document order exactly as StreamingArticleParser
+    reads them, so both give the same turns for the same page.
+    """
+    builder = SpeakerTurnBuilder()
+    blocks = BlockTextCollector(builder)
+    block: Optional[Tag] = None
+
+    stack = [(article, iter(article.contents))]
+    while stack:
+        node, children = stack[-1]
+        child = next(children, None)
+
+        if child is None:
+            stack.pop()
+            if node is block:
+                blocks.end()
+                block = None
+        elif isinstance(child, Tag):
+            if child.name in BLOCK_TAGS and blocks.start(child.name):
+                block = child
+            if child.name not in StreamingArticleParser.SKIP_TAGS:
+                stack.append((child, iter(child.contents)))
+        elif type(child) in TEXT_STRING_TYPES and block is not None:
+            blocks.text(child, _in_bold(child, block))
+
+    return builder.finish()
+
+
+class StreamingArticleParser(HTMLParser):
+    """Incremental parser that collects the first h1 and article-body text as bytes arrive
+
+    Strings are stripped and kept in document order exactly as
+    get_text(separator='\n', strip=True) would produce them, with comments,
+    scripts and styles skipped. Paragraphs and headings inside the article
+    are also fed to a SpeakerTurnBuilder, so `turns` matches
+    extract_speaker_turns on the same article. `done` turns true once the
+    article-body div has closed and a title was seen, so the caller can stop
+    reading.
+    """
+
+    SKIP_TAGS = {'script', 'style', 'template'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title: Optional[str] = None
+        self.article_parts: List[str] = []
+        self.found_article = False
+        self.article_closed = False
+        self._title_parts: List[str] = []
+        self._h1_depth = 0
+        self._article_depth = 0
+        self._skip_depth = 0
+        self._pending: List[str] = []
+        self.turns: List[Dict] = []
+        self._turn_builder = SpeakerTurnBuilder()
+        self._blocks = BlockTextCollector(self._turn_builder)
+        # Article div depth the open block started at; closing that div closes the block
+        self._block_depth = 0
+        self._bold_depth = 0
+
+    @property
+    def done(self) -> bool:
+        return self.article_closed and self.title is not None
+
+    @property
+    def article_text(self) -> str:
+        return '\n'.join(self.article_parts)
+
+    def _flush(self) -> None:
+        """One string node ends at every markup event; strip it as get_text would"""
+        if not self._pending:
+            return
+        text = ''.join(self._pending)
+        self._pending = []
+        self._blocks.text(text, self._bold_depth > 0)
+        text = text.strip()
+        if not text:
+            return
+        if self._h1_depth:
+            self._title_parts.append(text)
+        if self._article_depth:
+            self.article_parts.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == 'h1' and (self._h1_depth or self.title is None):
+            self._h1_depth += 1
+        elif tag == 'div':
+            if self._article_depth:
+                self._article_depth += 1
+            elif not self.found_article and 'article-body' in (dict(attrs).get('class') or ''):
+                self.found_article = True
+                self._article_depth = 1
+        elif self._article_depth and tag in BLOCK_TAGS:
+            if self._blocks.start(tag):
+                self._block_depth = self._article_depth
+                self._bold_depth = 0
+        elif self._blocks.tag and tag in BOLD_TAGS:
+            self._bold_depth += 1
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'h1' and self._h1_depth:
+            self._h1_depth -= 1
+            if not self._h1_depth:
+                self.title = ''.join(self._title_parts)
+        elif tag == 'div' and self._article_depth:
+            self._article_depth -= 1
+            if self._blocks.tag and self._article_depth < self._block_depth:
+                # The div an unclosed block was opened in has ended, and the block with it
+                self._blocks.end()
+            if not self._article_depth:
+                self.article_closed = True
+                self.turns = self._turn_builder.finish()
+        elif tag == self._blocks.tag:
+            self._blocks.end()
+        elif self._blocks.tag and tag in BOLD_TAGS:
+            self._bold_depth = max(0, self._bold_depth - 1)
+
+    def handle_data(self, data):
+        if not self._skip_depth and (self._h1_depth or self._article_depth):
+            self._pending.append(data)
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+
+def index_text_spans(root: Tag, tag_name: str = 'div') -> Tuple[List[Tuple[Tag, int, int, int, int]], str]:
+    """Index the stripped text of every tag_name element in a single traversal
+
+    Returns (spans, lowered_text). lowered_text is the concatenation of the
+    document's stripped strings, lowercased, exactly as get_text(strip=True)
+    would join them. Each span is (tag, start, end, lower_start, lower_end),
+    where end - start equals len(tag.get_text(strip=True)) and
+    lowered_text[lower_start:lower_end] is that text lowercased.
+    """
+    spans = []
+    lower_parts = []
+    length = lower_length = 0
+
+    stack = [(root, length, lower_length, iter(root.contents))]
+    while stack:
+        node, start, lower_start, children = stack[-1]
+        child = next(children, None)
+
+        if child is None:
+            stack.pop()
+            if node.name == tag_name:
+                spans.append((node, start, length, lower_start, lower_length))
+        elif isinstance(child, Tag):
+            stack.append((child, length, lower_length, iter(child.contents)))
+        elif type(child) in TEXT_STRING_TYPES:
+            text = child.strip()
+            if text:
+                lowered = text.lower()
+                lower_parts.append(lowered)
+                length += len(text)
+                lower_length += len(lowered)
+
+    return spans, ''.join(lower_parts)
+
+
+def find_largest_text_block(root: Tag, min_length: int = 5000, phrase: str = 'earnings call') -> Optional[Tag]:
+    """Longest div with more than min_length characters of text containing phrase
+
+    Linear replacement for calling get_text() on every div: text lengths come
+    from index_text_spans, and phrase containment is a bisect over the
+    phrase's positions in the document text.
+    """
+    spans, lowered_text = index_text_spans(root)
+
+    occurrences = []
+    position = lowered_text.find(phrase)
+    while position >= 0:
+        occurrences.append(position)
+        position = lowered_text.find(phrase, position + 1)
+
+    if not occurrences:
+        return None
+
+    best, best_length, best_start = None, min_length, 0
+    for tag, start, end, lower_start, lower_end in spans:
+        text_length = end - start
+        if text_length <= min_length or text_length < best_length:
+            continue
+        # Ties go to the first div in document order, as a find_all('div') scan would pick. Spans
+        # are in post-order, so an equal span starting at the same offset is an enclosing div.
+        if text_length == best_length and best is not None and start > best_start:
+            continue
+
+        i = bisect_left(occurrences, lower_start)
+        if i < len(occurrences) and occurrences[i] + len(phrase) <= lower_end:
+            best, best_length, best_start = tag, text_length, start
+
+    return best
+
+
+EXTRACTORS = {
+    HtmlParserExtractor.name: HtmlParserExtractor,
+    LxmlExtractor.name: LxmlExtractor,
+}
+
+
+def get_extractor(name: Optional[str] = None) -> HtmlParserExtractor:
+    """Return the named extractor, defaulting to lxml when it is installed"""
+    if not name:
+        name = LxmlExtractor.name if LXML_AVAILABLE else HtmlParserExtractor.name
+
+    if name not in EXTRACTORS:
+        raise ValueError(f"Unknown extractor backend: {name}")
+
+    if name == LxmlExtractor.name and not LXML_AVAILABLE:
+        logging.getLogger(__name__).warning("lxml is not installed, using html.parser")
+        name = HtmlParserExtractor.name
+
+    return EXTRACTORS[name]()
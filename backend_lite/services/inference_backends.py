@@ -0,0 +1,168 @@
+"""
+CPU/GPU inference backends for the FinBERT sentiment model
+"""
+import os
+import inspect
+import logging
+import tempfile
+from typing import Dict, Optional
+import torch
+from transformers import AutoConfig, AutoModelForSequenceClassification
+
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+logging.basicConfig(level=logging.INFO)
+
+
+class TorchBackend:
+    """The model as published, fp32 PyTorch (reference behaviour; the only one that uses a GPU)"""
+
+    name = 'fp32'
+    # Export settings the artifact and the logits depend on, none for the published model
+    settings = ''
+
+    def __init__(self, model_name: str, cache_dir: Optional[str] = None, device: str = 'cpu'):
+        """cache_dir holds exported artifacts; published weights come from the Hugging Face cache"""
+        self.logger = logging.getLogger(__name__)
+        self.model_name = model_name
+        self.cache_dir = cache_dir
+        self.device = torch.device(device)
+        # Hub commit of the published weights; None for a local model directory
+        self.revision = getattr(AutoConfig.from_pretrained(model_name), '_commit_hash', None)
+        self.model = self._load()
+
+    @property
+    def fingerprint(self) -> str:
+        """Model name, revision and backend, everything but the input that the logits depend on"""
+        return f"{self.model_name}@{self.revision or 'local'}:{self.name}{self.settings}"
+
+    def _load(self):
+        model = AutoModelForSequenceClassification.from_pretrained(self.model_name, revision=self.revision)
+        model.to(self.device)
+        model.eval()
+        return model
+
+    def logits(self, inputs: Dict[str, torch.Tensor]) -> torch.Tensor:
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        return self.model(**inputs).logits
+
+    def artifact_path(self, extension: str) -> str:
+        """Where this backend's export of the loaded model revision lives under the model cache
+
+        A new revision or different export settings get a new file, so stale
+        weights are never loaded under a fresh fingerprint.
+        """
+        directory = os.path.join(self.cache_dir or '.', 'exported', self.model_name.replace('/', '--'),
+                                 self.revision or 'local')
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{self.name}{self.settings}.{extension}")
+
+    def _save_atomically(self, path: str, write) -> None:
+        # Several server workers may export at once; only complete files are renamed into place
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.logger.info(f"Exported {self.name} model to {path}")
+
+
+class QuantizedTorchBackend(TorchBackend):
+    """Dynamic int8 quantization of every Linear layer, weights quantized once and cached
+
+    Activations stay fp32 and are quantized on the fly, so no calibration
+    data is needed. The quantized state dict is saved under the model cache
+    and later loaded into a model built from the config alone.
+    """
+
+    name = 'int8'
+    settings = '-dynamic-qint8-linear'
+
+    def __init__(self, model_name: str, cache_dir: Optional[str] = None, device: str = 'cpu'):
+        # Quantized kernels are CPU-only
+        super().__init__(model_name, cache_dir, 'cpu')
+
+    @staticmethod
+    def _quantize(model):
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    def _load(self):
+        path = self.artifact_path('pt')
+        if os.path.exists(path):
+            config = AutoConfig.from_pretrained(self.model_name, revision=self.revision)
+            model = self._quantize(AutoModelForSequenceClassification.from_config(config).eval())
+            # Written by this backend; weights_only cannot unpickle the qint8 packed params
+            model.load_state_dict(torch.load(path, weights_only=False))
+        else:
+            model = self._quantize(super()._load())
+            self._save_atomically(path, lambda tmp_path: torch.save(model.state_dict(), tmp_path))
+        model.eval()
+        return model
+
+
+class OnnxBackend(TorchBackend):
+    """The model exported once to ONNX and run by onnxruntime's CPU execution provider"""
+
+    name = 'onnx'
+    OPSET_VERSION = 14
+    settings = f'-opset{OPSET_VERSION}'
+    INPUT_NAMES = ('input_ids', 'attention_mask', 'token_type_ids')
+
+    def __init__(self, model_name: str, cache_dir: Optional[str] = None, device: str = 'cpu'):
+        super().__init__(model_name, cache_dir, 'cpu')
+
+    def _load(self):
+        path = self.artifact_path('onnx')
+        if not os.path.exists(path):
+            self._export(super()._load(), path)
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        return onnxruntime.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+
+    def _export(self, model, path: str) -> None:
+        example = {name: torch.ones(1, 8, dtype=torch.long) for name in self.INPUT_NAMES}
+        dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in self.INPUT_NAMES}
+        dynamic_axes['logits'] = {0: 'batch'}
+
+        # Newer torch defaults to the dynamo exporter (needs onnxscript); keep the TorchScript one
+        options = {'dynamo': False} if 'dynamo' in inspect.signature(torch.onnx.export).parameters else {}
+
+        def write(tmp_path):
+            with torch.inference_mode():
+                torch.onnx.export(model, (example,), tmp_path, input_names=list(self.INPUT_NAMES),
+                                  output_names=['logits'], dynamic_axes=dynamic_axes, opset_version=self.OPSET_VERSION,
+                                  **options)
+        self._save_atomically(path, write)
+
+    def logits(self, inputs: Dict[str, torch.Tensor]) -> torch.Tensor:
+        feed = {name: inputs[name].cpu().numpy() for name in self.INPUT_NAMES if name in inputs}
+        return torch.from_numpy(self.model.run(['logits'], feed)[0])
+
+
+BACKENDS = {
+    TorchBackend.name: TorchBackend,
+    QuantizedTorchBackend.name: QuantizedTorchBackend,
+    OnnxBackend.name: OnnxBackend,
+}
+
+
+def get_inference_backend(name: Optional[str], model_name: str, cache_dir: Optional[str] = None,
+                          device: str = 'cpu') -> TorchBackend:
+    """Load the named backend (default fp32), exporting its artifact into cache_dir on first use"""
+    name = name or TorchBackend.name
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown inference backend: {name}")
+
+    if name == OnnxBackend.name and not ONNXRUNTIME_AVAILABLE:
+        logging.getLogger(__name__).warning("onnxruntime is not installed, using fp32")
+        name = TorchBackend.name
+
+    return BACKENDS[name](model_name, cache_dir, device)
@@ -0,0 +1,138 @@
+"""
+Multi-pattern keyword matching (Aho-Corasick) for speaker classification and boilerplate detection
+"""
+import os
+import json
+import logging
+from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set
+
+logging.basicConfig(level=logging.INFO)
+
+# Default keyword groups; KEYWORDS_FILE (JSON, group -> list) replaces individual groups
+DEFAULT_KEYWORDS: Dict[str, List[str]] = {
+    # Speaker labels that are not real speakers
+    'skip_speaker': [
+        'operator', 'contents', 'image source', 'prepared remarks',
+        'questions and answers', 'call participants'
+    ],
+    'executive_speaker': [
+        'jensen', 'huang', 'colette', 'kress', 'stewart', 'stecker',
+        'chief executive officer', 'chief financial officer', 'president',
+        'executive vice president', 'ceo', 'cfo'
+    ],
+    'analyst_speaker': [
+        'analyst', 'research', 'capital', 'securities', 'bank',
+        'morgan', 'goldman', 'barclays', 'jpmorgan', 'credit suisse'
+    ],
+    # Operator/call-logistics content the parser drops
+    'call_boilerplate': [
+        'good afternoon', 'conference operator', 'welcome everyone',
+        'all lines have been placed on mute', 'prevent any background noise',
+        'operator instructions', 'please go ahead', 'thank you operator'
+    ],
+    # Operator/metadata phrases the sentiment analyzer does not score
+    'segment_boilerplate': [
+        'the motley fool', 'earnings call', 'conference operator', 'good afternoon',
+        'welcome everyone', 'my name is', 'operator', 'image source'
+    ],
+    # Business/financial terms typical of executive remarks
+    'business_terms': [
+        'revenue', 'quarter', 'growth', 'performance', 'results',
+        'business', 'market', 'customers', 'products', 'outlook',
+        'datacenter', 'gaming', 'automotive', 'ai', 'artificial intelligence'
+    ],
+}
+
+
+class KeywordMatcher:
+    """All keyword groups compiled into one Aho-Corasick automaton
+
+    scan() walks the lowercased text once and returns every keyword that
+    occurs in it as a substring, the same test as `keyword in text.lower()`.
+    Classifiers then intersect those hits with a group. Transitions are
+    fully resolved at build time, so the scan is one dict lookup per
+    character however many keywords are configured.
+    """
+
+    def __init__(self, groups: Dict[str, Sequence[str]]):
+        self.groups: Dict[str, FrozenSet[str]] = {
+            name: frozenset(keyword.lower() for keyword in keywords if keyword)
+            for name, keywords in groups.items()
+        }
+        self.keywords = sorted(set().union(*self.groups.values()))
+        self._build()
+
+    def _build(self) -> None:
+        # Trie of all keywords
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Set[str]] = [set()]
+        for keyword in self.keywords:
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append(set())
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].add(keyword)
+
+        # Breadth-first: failure links, inherited outputs and the full transition table
+        fail = [0] * len(goto)
+        transitions: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] |= outputs[fail[state]]
+            transitions[state] = {**transitions[fail[state]], **goto[state]}
+            for char, child in goto[state].items():
+                fail[child] = transitions[fail[state]].get(char, 0)
+                queue.append(child)
+
+        self._transitions = transitions
+        self._outputs = [frozenset(output) if output else None for output in outputs]
+
+    def scan(self, text: str) -> Set[str]:
+        """Every configured keyword occurring in text (case-insensitive)"""
+        hits = set()
+        transitions = self._transitions
+        outputs = self._outputs
+        state = 0
+        for char in text.lower():
+            state = transitions[state].get(char, 0)
+            output = outputs[state]
+            if output:
+                hits |= output
+        return hits
+
+    def has_any(self, hits: Set[str], group: str) -> bool:
+        return not self.groups[group].isdisjoint(hits)
+
+    def count(self, hits: Set[str], group: str) -> int:
+        """Number of distinct keywords of a group among the hits"""
+        return len(self.groups[group] & hits)
+
+
+def load_keyword_groups(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """Default keyword groups with any groups from a JSON file replacing them"""
+    groups = dict(DEFAULT_KEYWORDS)
+    if path:
+        with open(path, 'r') as f:
+            overrides = json.load(f)
+        unknown = set(overrides) - set(DEFAULT_KEYWORDS)
+        if unknown:
+            raise ValueError(f"Unknown keyword groups in {path}: {sorted(unknown)}")
+        groups.update(overrides)
+        logging.getLogger(__name__).info(f"Loaded keyword groups {sorted(overrides)} from {path}")
+    return groups
+
+
+_matcher: Optional[KeywordMatcher] = None
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """Process-wide matcher, compiled on first use from the defaults and $KEYWORDS_FILE"""
+    global _matcher
+    if _matcher is None:
+        _matcher = KeywordMatcher(load_keyword_groups(os.getenv('KEYWORDS_FILE')))
+    return _matcher
@@ -0,0 +1,86 @@
+"""
+Persistent content-addressed store for raw transcript pages
+"""
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+import diskcache as dc
+
+logging.basicConfig(level=logging.INFO)
+
+
+class PageStore:
+    """Raw HTML pages keyed by URL, with bodies stored once per content hash
+
+    Each URL entry keeps the validators (ETag / Last-Modified) needed for a
+    conditional GET, plus the sha256 of the body. Extracted transcripts are
+    stored against the same hash, so an unchanged page never needs re-parsing.
+    """
+
+    def __init__(self, directory: str):
+        self.logger = logging.getLogger(__name__)
+        self.cache = dc.Cache(directory)
+
+    @staticmethod
+    def content_hash(body: bytes) -> str:
+        return hashlib.sha256(body).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Stored metadata for a URL (etag, last_modified, content_hash, fetched_at)"""
+        return self.cache.get(f'page:{url}')
+
+    def get_body(self, content_hash: str) -> Optional[bytes]:
+        return self.cache.get(f'body:{content_hash}')
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified"""
+        entry = self.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url: str, body: bytes, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, partial: bool = False) -> str:
+        """Store a freshly downloaded page and return its content hash
+
+        A partial body (a stream closed once the article ended) is only
+        hashed: it is not the page, so neither it nor the full response's
+        validators are kept, and the URL is never revalidated against it.
+        """
+        digest = self.content_hash(body)
+        body_key = f'body:{digest}'
+        if partial:
+            etag = last_modified = None
+        elif body_key not in self.cache:
+            self.cache.set(body_key, body)
+
+        self.cache.set(f'page:{url}', {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': digest,
+            'partial': partial,
+            'fetched_at': datetime.now().isoformat()
+        })
+        return digest
+
+    def touch(self, url: str) -> None:
+        """Record a successful revalidation (304) for a URL"""
+        entry = self.get(url)
+        if entry:
+            entry['fetched_at'] = datetime.now().isoformat()
+            self.cache.set(f'page:{url}', entry)
+
+    def get_extracted(self, content_hash: str) -> Optional[Dict]:
+        """Transcript previously extracted from the body with this hash"""
+        return self.cache.get(f'extracted:{content_hash}')
+
+    def put_extracted(self, content_hash: str, transcript_data: Dict) -> None:
+        self.cache.set(f'extracted:{content_hash}', transcript_data)
@@ -0,0 +1,96 @@
+"""
+Persistent cache of parsed transcripts keyed by document hash and parser fingerprint
+"""
+import json
+import hashlib
+import logging
+from typing import Dict, List, Optional, Sequence
+import diskcache as dc
+
+from services.segments import deserialize_parsed, serialize_parsed
+
+logging.basicConfig(level=logging.INFO)
+
+
+class ParseCache:
+    """Drop-in for TranscriptParser.parse that parses each document once per parser version
+
+    Entries are keyed by the sha256 of the transcript text (and its speaker
+    turns, when the scraper provided them) plus the parser's fingerprint, so
+    editing a pattern table makes every old entry unreachable while scraped
+    pages and transcripts stay cached. Entries hold plain dicts; Segment
+    records are rebuilt on read.
+    """
+
+    def __init__(self, directory: str, parser):
+        self.logger = logging.getLogger(__name__)
+        self.cache = dc.Cache(directory)
+        self.parser = parser
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def document_hash(transcript_data: Dict) -> str:
+        digest = hashlib.sha256(transcript_data['full_text'].encode('utf-8'))
+        if transcript_data.get('turns'):
+            digest.update(json.dumps(transcript_data['turns'], sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def key(self, transcript_data: Dict) -> str:
+        return f'parsed:{self.parser.fingerprint}:{self.document_hash(transcript_data)}'
+
+    def parse(self, transcript_data: Dict) -> Optional[Dict]:
+        if not transcript_data or not transcript_data.get('full_text'):
+            return self.parser.parse(transcript_data)
+
+        parsed = self._lookup(transcript_data)
+        if parsed is None:
+            parsed = self.parser.parse(transcript_data)
+            self._store(transcript_data, parsed)
+        return parsed
+
+    def parse_many(self, transcripts: Sequence[Dict], workers: Optional[int] = None,
+                   chunksize: Optional[int] = None, start_method: Optional[str] = None) -> List[Optional[Dict]]:
+        """parse() for every transcript, in input order; only the cache misses go to the parser's worker pool"""
+        transcripts = list(transcripts)
+        results = [self._lookup(transcript_data) if transcript_data and transcript_data.get('full_text') else None
+                   for transcript_data in transcripts]
+        misses = [i for i, transcript_data in enumerate(transcripts)
+                  if results[i] is None and transcript_data and transcript_data.get('full_text')]
+
+        parsed_misses = self.parser.parse_many([transcripts[i] for i in misses], workers, chunksize,
+                                               start_method) if misses else []
+        for i, parsed in zip(misses, parsed_misses):
+            self._store(transcripts[i], parsed)
+            results[i] = parsed
+        return results
+
+    def _lookup(self, transcript_data: Dict) -> Optional[Dict]:
+        stored = self.cache.get(self.key(transcript_data))
+        if stored is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.logger.info(f"Parse cache hit for {transcript_data.get('url')}")
+        # The same text may be served under another URL or title
+        return deserialize_parsed({
+            **stored,
+            'quarter': transcript_data.get('quarter'),
+            'year': transcript_data.get('year'),
+            'title': transcript_data.get('title'),
+            'url': transcript_data.get('url')
+        })
+
+    def _store(self, transcript_data: Dict, parsed: Optional[Dict]) -> None:
+        if parsed:
+            self.cache.set(self.key(transcript_data), serialize_parsed(parsed))
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'fingerprint': self.parser.fingerprint,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -1,9 +1,20 @@
 """
 Improved Transcript Parser for segmenting earnings calls
 """
+import os
 import re
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from services.keyword_matcher import get_keyword_matcher
+from services import roster as roster_rules
+from services.roster import ParticipantRoster
+from services.segments import QAIndex, Segment, SegmentedTranscript
+from services.text_normalizer import RAW_TEXT, BOILERPLATE, SEGMENT_CONTENT
 
 logging.basicConfig(level=logging.INFO)
 
@@ -11,9 +22,15 @@ logging.basicConfig(level=logging.INFO)
 class TranscriptParser:
     """Parse transcripts into management remarks and Q&A sections"""
     
+    # Bump when parsing logic changes in a way the pattern tables don't capture
+    VERSION = 3
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
+        # Speaker and boilerplate keyword lists, compiled into one matcher
+        self.keywords = get_keyword_matcher()
+        
         # Patterns for finding prepared remarks section
         self.prepared_remarks_patterns = [
             r'prepared\s+remarks?:?',
@@ -45,49 +62,90 @@ class TranscriptParser:
         # Speaker patterns - more flexible
         self.speaker_pattern = re.compile(r'^([A-Z][A-Za-z\s\-\.\,]+?)(?:\s*--|\s*:|\s*\|)', re.MULTILINE)
         
+        # Section patterns compiled once, with their source kept for logging
+        self._prepared_remarks_regexes = self._compile(self.prepared_remarks_patterns)
+        self._qa_start_regexes = self._compile(self.qa_start_patterns)
+        self._executive_regexes = self._compile(self.executive_patterns)
+        
+        self.fingerprint = self._fingerprint()
+    
+    @staticmethod
+    def _compile(patterns: List[str]) -> List[Tuple[str, re.Pattern]]:
+        return [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in patterns]
+        
+    def _fingerprint(self) -> str:
+        """Hash of the version and every pattern table and keyword list the output depends on"""
+        tables = [
+            self.VERSION,
+            self.prepared_remarks_patterns,
+            self.qa_start_patterns,
+            self.executive_patterns,
+            (self.speaker_pattern.pattern, self.speaker_pattern.flags),
+            RAW_TEXT.rules, BOILERPLATE.rules, SEGMENT_CONTENT.rules,
+            sorted((name, sorted(keywords)) for name, keywords in self.keywords.groups.items()),
+            [pattern.pattern for pattern in (roster_rules.PARTICIPANTS_HEADING, roster_rules.PARTICIPANT_SEPARATOR,
+                                             roster_rules.ROLE_WORDS, roster_rules.NAME_PATTERN)],
+        ]
+        return hashlib.sha256(repr(tables).encode('utf-8')).hexdigest()[:16]
+        
     def parse(self, transcript_data: Dict) -> Dict:
         """Parse transcript into structured sections"""
-        if not transcript_data:
+        if not transcript_data or not transcript_data.get('full_text'):
             return None
             
+        self.logger.info(f"Parsing transcript for Q{transcript_data.get('quarter')} {transcript_data.get('year')}")
+        
+        # Speaker turns read from the page markup need no regex re-segmentation
+        if transcript_data.get('turns'):
+            parsed = self.parse_structured(transcript_data)
+            if parsed:
+                return parsed
+            self.logger.warning("Structured turns yielded no segments, falling back to text parsing")
+        
+        return self.parse_text(transcript_data)
+    
+    def parse_many(self, transcripts: Sequence[Dict], workers: Optional[int] = None,
+                   chunksize: Optional[int] = None, start_method: Optional[str] = None) -> List[Optional[Dict]]:
+        """parse() for every transcript, fanned out to worker processes; results are in input order"""
+        return parse_in_processes(self, 'parse', transcripts, workers, chunksize, start_method)
+    
+    def parse_structured(self, transcript_data: Dict) -> Optional[Dict]:
+        """Segments from the scraper's speaker turns only; None when there are none"""
+        turns = transcript_data.get('turns')
+        if not turns:
+            return None
+        
+        roster = self._build_roster(transcript_data.get('full_text', ''))
+        fired = {}
+        management_remarks, qa_session = self._parse_turns(turns, roster, fired)
+        if not (management_remarks or qa_session):
+            return None
+        return self._build_result(transcript_data, management_remarks, qa_session, fired, 'turns')
+    
+    def parse_text(self, transcript_data: Dict) -> Optional[Dict]:
+        """Segments found by the section and speaker patterns in full_text"""
         full_text = transcript_data.get('full_text', '')
         if not full_text:
             return None
-            
-        self.logger.info(f"Parsing transcript for Q{transcript_data.get('quarter')} {transcript_data.get('year')}")
+        roster = self._build_roster(full_text)
         
-        # Clean up the text first
-        full_text = self._clean_raw_text(full_text)
+        # Clean up the text first, counting which normalization rules fired
+        fired = {}
+        full_text = self._clean_raw_text(full_text, fired)
         
-        # Find the prepared remarks section
-        prepared_remarks_start = self._find_prepared_remarks_start(full_text)
-        qa_start = self._find_qa_start(full_text)
-        
-        if prepared_remarks_start >= 0 and qa_start > prepared_remarks_start:
-            # Extract sections properly
-            prepared_remarks_text = full_text[prepared_remarks_start:qa_start].strip()
-            qa_text = full_text[qa_start:].strip()
-            
-            self.logger.info(f"Found prepared remarks section at position {prepared_remarks_start}")
-            self.logger.info(f"Found Q&A section at position {qa_start}")
-        elif qa_start > 0:
-            # If we found Q&A but not prepared remarks, use everything before Q&A
-            prepared_remarks_text = full_text[:qa_start].strip()
-            qa_text = full_text[qa_start:].strip()
-            
-            self.logger.info(f"Using text before Q&A as prepared remarks")
-        else:
-            # Fallback: split by heuristic
-            split_pos = int(len(full_text) * 0.6)
-            prepared_remarks_text = full_text[:split_pos].strip()
-            qa_text = full_text[split_pos:].strip()
-            
-            self.logger.warning(f"Using heuristic split for sections")
+        # Find the prepared remarks and Q&A sections
+        prepared_remarks_start, qa_start, section_split = self._find_sections(full_text)
+        prepared_remarks_text = full_text[prepared_remarks_start:qa_start].strip()
+        qa_text = full_text[qa_start:].strip()
         
         # Parse speakers and segments
-        management_remarks = self._parse_management_segments(prepared_remarks_text)
-        qa_session = self._parse_qa_segments(qa_text)
+        management_remarks = self._parse_management_segments(prepared_remarks_text, fired, roster)
+        qa_session = self._parse_qa_segments(qa_text, fired, roster)
         
+        return self._build_result(transcript_data, management_remarks, qa_session, fired, section_split)
+    
+    def _build_result(self, transcript_data: Dict, management_remarks: List[Segment], qa_session: List[Segment],
+                      normalization: Optional[Dict[str, int]] = None, section_split: Optional[str] = None) -> Dict:
         return {
             'quarter': transcript_data.get('quarter'),
             'year': transcript_data.get('year'),
@@ -95,35 +153,199 @@ class TranscriptParser:
             'url': transcript_data.get('url'),
             'management_remarks': management_remarks,
             'qa_session': qa_session,
-            'total_segments': len(management_remarks) + len(qa_session)
+            'qa_exchanges': QAIndex(qa_session),
+            'total_segments': len(management_remarks) + len(qa_session),
+            'normalization': normalization or {},
+            'section_split': section_split
         }
         
-    def _clean_raw_text(self, text: str) -> str:
-        """Clean raw HTML/text before processing"""
-        # Remove common HTML artifacts and metadata
-        text = re.sub(r'<[^>]+>', '', text)  # Remove HTML tags
-        text = re.sub(r'Image\s+source:?[^\n]*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Advertisement[^\n]*', '', text, flags=re.IGNORECASE)
+    def parse_spans(self, transcript_data: Dict) -> Optional[SegmentedTranscript]:
+        """Offset-based variant of parse: segments are spans over one normalized buffer
         
-        # Clean up whitespace
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        text = re.sub(r'^\s+|\s+$', '', text, flags=re.MULTILINE)
+        Only the buffer and the span arrays are kept. Each candidate segment is
+        cleaned transiently to apply parse()'s filters, and its text is
+        materialized again only when a consumer reads it.
+        """
+        if not transcript_data:
+            return None
         
-        return text.strip()
+        full_text = transcript_data.get('full_text', '')
+        if not full_text:
+            return None
+        
+        roster = self._build_roster(full_text)
+        turns = transcript_data.get('turns')
+        if turns:
+            fired = {}
+            management_remarks, qa_session = self._parse_turns(turns, roster, fired)
+            if management_remarks or qa_session:
+                document = self._spans_from_segments(transcript_data, management_remarks, qa_session)
+                document.normalization = fired
+                document.section_split = 'turns'
+                return document
+        
+        # Build the buffer as the two boilerplate-free sections, so speaker
+        # headers are found exactly where parse() finds them. Intermediate
+        # copies are dropped as soon as possible to keep the peak low.
+        fired = {}
+        full_text = self._clean_raw_text(full_text, fired)
+        prepared_remarks_start, qa_start, section_split = self._find_sections(full_text)
+        prepared_remarks_text = full_text[prepared_remarks_start:qa_start].strip()
+        qa_text = full_text[qa_start:].strip()
+        del full_text
+        
+        prepared_remarks_text = self._clean_boilerplate(prepared_remarks_text, fired)
+        qa_text = self._clean_boilerplate(qa_text, fired)
+        buffer = f"{prepared_remarks_text}\n{qa_text}"
+        qa_offset = len(prepared_remarks_text) + 1
+        del prepared_remarks_text, qa_text
+        
+        document = SegmentedTranscript(buffer, quarter=transcript_data.get('quarter'), year=transcript_data.get('year'),
+                                       title=transcript_data.get('title'), url=transcript_data.get('url'))
+        document.normalization = fired
+        document.section_split = section_split
+        self._add_section_spans(document, 'prepared_remarks', 0, qa_offset - 1, roster)
+        self._add_section_spans(document, 'qa', qa_offset, len(buffer), roster)
+        
+        self.logger.info(f"Indexed {len(document)} segment spans over a {len(buffer)} character buffer")
+        return document
+    
+    def _build_roster(self, full_text: str) -> ParticipantRoster:
+        """Call participants of this transcript, used to type speakers before any keyword heuristics"""
+        roster = ParticipantRoster.from_text(full_text)
+        if roster:
+            self.logger.info(f"Call participants roster has {len(roster)} entries")
+        return roster
+    
+    def _find_sections(self, full_text: str) -> Tuple[int, int, str]:
+        """Offsets where the prepared remarks and the Q&A start, and how they were found"""
+        prepared_remarks_start = self._find_prepared_remarks_start(full_text)
+        qa_start = self._find_qa_start(full_text)
+        
+        if prepared_remarks_start >= 0 and qa_start > prepared_remarks_start:
+            self.logger.info(f"Found prepared remarks section at position {prepared_remarks_start}")
+            self.logger.info(f"Found Q&A section at position {qa_start}")
+            return prepared_remarks_start, qa_start, 'sections'
+        
+        if qa_start > 0:
+            # If we found Q&A but not prepared remarks, use everything before Q&A
+            self.logger.info(f"Using text before Q&A as prepared remarks")
+            return 0, qa_start, 'qa_only'
+        
+        # Fallback: split by heuristic
+        self.logger.warning(f"Using heuristic split for sections")
+        split_pos = int(len(full_text) * 0.6)
+        return 0, split_pos, 'heuristic'
+    
+    def _add_section_spans(self, document: SegmentedTranscript, section: str, start: int, end: int,
+                           roster: Optional[ParticipantRoster] = None) -> None:
+        """Spans between consecutive speaker headers in buffer[start:end], filtered as parse() does"""
+        added = 0
+        header = None
+        for next_header in self.speaker_pattern.finditer(document.text, start, end):
+            if header is not None:
+                added += self._add_span(document, section, header, next_header.start(), roster)
+            header = next_header
+        if header is not None:
+            added += self._add_span(document, section, header, end, roster)
+        
+        if not added and section == 'prepared_remarks' and document.text[start:end].strip():
+            # Same fallback as parse(): the executive paragraphs joined into one segment
+            executive_content = self._extract_executive_content(document.text[start:end])
+            if executive_content:
+                document.append(executive_content, 'Management', section, 'executive')
+    
+    def _add_span(self, document: SegmentedTranscript, section: str, header, end: int,
+                  roster: Optional[ParticipantRoster] = None) -> bool:
+        speaker = header.group(1).strip()
+        content = document.text[header.end():end].strip()
+        
+        if section == 'qa':
+            if not self._is_meaningful_content(content):
+                return False
+            cleaned_content = SEGMENT_CONTENT.normalize(content, document.normalization)
+            if len(cleaned_content.split()) <= 15:
+                return False
+            speaker_type = self._classify_speaker(speaker, content, roster)
+        else:
+            if not (self._is_meaningful_speaker(speaker) and self._is_meaningful_content(content)):
+                return False
+            cleaned_content = SEGMENT_CONTENT.normalize(content, document.normalization)
+            if len(cleaned_content.split()) <= 30:
+                return False
+            speaker_type = 'executive' if self._is_executive(speaker, roster) else 'other'
+        
+        document.add(header.end(), end, speaker, section, speaker_type)
+        return True
+    
+    def _spans_from_segments(self, transcript_data: Dict, management_remarks: List[Segment],
+                             qa_session: List[Segment]) -> SegmentedTranscript:
+        """Spans over the already-clean contents of structured speaker turns"""
+        segments = [('prepared_remarks', segment) for segment in management_remarks] + \
+                   [('qa', segment) for segment in qa_session]
+        document = SegmentedTranscript('\n\n'.join(segment.content for _, segment in segments),
+                                       clean_on_read=False, quarter=transcript_data.get('quarter'),
+                                       year=transcript_data.get('year'), title=transcript_data.get('title'),
+                                       url=transcript_data.get('url'))
+        offset = 0
+        for section, segment in segments:
+            end = offset + len(segment.content)
+            document.add(offset, end, segment.speaker, section, segment.speaker_type)
+            offset = end + 2
+        return document
+    
+    def _parse_turns(self, turns: List[Dict], roster: Optional[ParticipantRoster] = None,
+                     fired: Optional[Dict[str, int]] = None) -> Tuple[List[Segment], List[Segment]]:
+        """Segments from the scraper's speaker turns, applying the same cleaning and filters as the text path"""
+        # Without a Q&A heading, the Q&A starts at the first turn that opens it
+        if not any(turn.get('section') == 'qa' for turn in turns):
+            qa_index = next((i for i, turn in enumerate(turns) if self._find_qa_start(turn['content']) >= 0),
+                            len(turns))
+            turns = [{**turn, 'section': 'qa' if i >= qa_index else 'prepared_remarks'}
+                     for i, turn in enumerate(turns)]
+        
+        management_remarks = []
+        qa_session = []
+        for turn in turns:
+            speaker = turn['speaker']
+            # Ads, image credits and title lines sit inside turns as they do in full_text
+            content = self._clean_boilerplate(self._clean_raw_text(turn['content'], fired), fired)
+            # Role text ("Analyst", "Chief Financial Officer") helps classification
+            speaker_label = f"{speaker} -- {turn['role']}" if turn.get('role') else speaker
+            
+            if not self._is_meaningful_content(content):
+                continue
+            cleaned_content = self._clean_content(content, fired)
+            word_count = len(cleaned_content.split())
+            
+            if turn.get('section') == 'qa':
+                if word_count > 15:
+                    qa_session.append(Segment(speaker, cleaned_content,
+                                              self._classify_speaker(speaker_label, content, roster), word_count))
+            elif self._is_meaningful_speaker(speaker) and word_count > 30:
+                speaker_type = 'executive' if self._is_executive(speaker_label, roster) else 'other'
+                management_remarks.append(Segment(speaker, cleaned_content, speaker_type, word_count))
+        
+        self.logger.info(f"Extracted {len(management_remarks)} management and {len(qa_session)} Q&A segments from speaker turns")
+        return management_remarks, qa_session
+    
+    def _clean_raw_text(self, text: str, fired: Optional[Dict[str, int]] = None) -> str:
+        """Clean raw HTML/text before processing: tags, image credits, ads and whitespace"""
+        return RAW_TEXT.normalize(text, fired)
         
     def _find_prepared_remarks_start(self, text: str) -> int:
         """Find the start position of prepared remarks section"""
         text_lower = text.lower()
         
-        for pattern in self.prepared_remarks_patterns:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
+        for pattern, regex in self._prepared_remarks_regexes:
+            match = regex.search(text_lower)
             if match:
                 self.logger.info(f"Found prepared remarks section with pattern: {pattern}")
                 return match.end()
         
         # If no explicit "Prepared Remarks" found, look for the first executive speaker
-        for pattern in self.executive_patterns:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
+        for pattern, regex in self._executive_regexes:
+            match = regex.search(text_lower)
             if match:
                 # Find the start of this paragraph/section
                 start = text.rfind('\n', 0, match.start())
@@ -136,20 +358,21 @@ class TranscriptParser:
         """Find the start position of Q&A section"""
         text_lower = text.lower()
         
-        for pattern in self.qa_start_patterns:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
+        for pattern, regex in self._qa_start_regexes:
+            match = regex.search(text_lower)
             if match:
                 self.logger.info(f"Found Q&A section with pattern: {pattern}")
                 return match.start()
         
         return -1
     
-    def _parse_management_segments(self, text: str) -> List[Dict]:
+    def _parse_management_segments(self, text: str, fired: Optional[Dict[str, int]] = None,
+                                   roster: Optional[ParticipantRoster] = None) -> List[Segment]:
         """Parse management/prepared remarks section"""
         segments = []
         
         # Clean up the text first
-        text = self._clean_boilerplate(text)
+        text = self._clean_boilerplate(text, fired)
         
         # Split by speaker patterns
         parts = self.speaker_pattern.split(text)
@@ -162,37 +385,30 @@ class TranscriptParser:
                 
                 # Skip operator and boilerplate speakers
                 if self._is_meaningful_speaker(speaker) and self._is_meaningful_content(content):
-                    cleaned_content = self._clean_content(content)
+                    cleaned_content = self._clean_content(content, fired)
+                    word_count = len(cleaned_content.split())
                     
-                    if cleaned_content and len(cleaned_content.split()) > 30:  # Meaningful length
-                        segments.append({
-                            'speaker': speaker,
-                            'content': cleaned_content,
-                            'word_count': len(cleaned_content.split()),
-                            'speaker_type': 'executive' if self._is_executive(speaker) else 'other'
-                        })
+                    if word_count > 30:  # Meaningful length
+                        speaker_type = 'executive' if self._is_executive(speaker, roster) else 'other'
+                        segments.append(Segment(speaker, cleaned_content, speaker_type, word_count))
         
         # If no speaker patterns found but we have text, try to extract executive content
         if not segments and text.strip():
             # Look for executive content without clear speaker markers
             executive_content = self._extract_executive_content(text)
             if executive_content:
-                segments.append({
-                    'speaker': 'Management',
-                    'content': executive_content,
-                    'word_count': len(executive_content.split()),
-                    'speaker_type': 'executive'
-                })
+                segments.append(Segment('Management', executive_content, 'executive'))
         
         self.logger.info(f"Extracted {len(segments)} management segments")
         return segments
     
-    def _parse_qa_segments(self, text: str) -> List[Dict]:
+    def _parse_qa_segments(self, text: str, fired: Optional[Dict[str, int]] = None,
+                           roster: Optional[ParticipantRoster] = None) -> List[Segment]:
         """Parse Q&A section into segments"""
         segments = []
         
         # Clean up the text first
-        text = self._clean_boilerplate(text)
+        text = self._clean_boilerplate(text, fired)
         
         # Split by speaker patterns
         parts = self.speaker_pattern.split(text)
@@ -205,78 +421,54 @@ class TranscriptParser:
                 
                 # Skip very short segments and operator instructions
                 if self._is_meaningful_content(content):
-                    cleaned_content = self._clean_content(content)
+                    cleaned_content = self._clean_content(content, fired)
+                    word_count = len(cleaned_content.split())
                     
-                    if cleaned_content and len(cleaned_content.split()) > 15:
-                        speaker_type = self._classify_speaker(speaker, content)
-                        
-                        segments.append({
-                            'speaker': speaker,
-                            'content': cleaned_content,
-                            'word_count': len(cleaned_content.split()),
-                            'speaker_type': speaker_type
-                        })
+                    if word_count > 15:
+                        speaker_type = self._classify_speaker(speaker, content, roster)
+                        segments.append(Segment(speaker, cleaned_content, speaker_type, word_count))
         
         self.logger.info(f"Extracted {len(segments)} Q&A segments")
         return segments
     
     def _is_meaningful_speaker(self, speaker: str) -> bool:
         """Check if speaker is meaningful (not operator, etc.)"""
-        speaker_lower = speaker.lower()
-        
         # Skip operators and boilerplate
-        skip_speakers = [
-            'operator', 'contents', 'image source', 'prepared remarks',
-            'questions and answers', 'call participants'
-        ]
-        
-        return not any(skip in speaker_lower for skip in skip_speakers)
+        return not self.keywords.has_any(self.keywords.scan(speaker), 'skip_speaker')
     
     def _is_meaningful_content(self, content: str) -> bool:
         """Check if content is meaningful for analysis"""
-        content_lower = content.lower()
-        
-        # Skip common boilerplate content
-        boilerplate_indicators = [
-            'good afternoon', 'conference operator', 'welcome everyone',
-            'all lines have been placed on mute', 'prevent any background noise',
-            'operator instructions', 'please go ahead', 'thank you operator'
-        ]
-        
         # If content is too short or mostly boilerplate
         if len(content.split()) < 10:
             return False
             
-        boilerplate_count = sum(1 for indicator in boilerplate_indicators if indicator in content_lower)
-        return boilerplate_count < 2
+        return self.keywords.count(self.keywords.scan(content), 'call_boilerplate') < 2
     
-    def _is_executive(self, speaker: str) -> bool:
+    def _is_executive(self, speaker: str, roster: Optional[ParticipantRoster] = None) -> bool:
         """Check if speaker is an executive"""
-        speaker_lower = speaker.lower()
-        
-        executive_indicators = [
-            'jensen', 'huang', 'colette', 'kress', 'stewart', 'stecker',
-            'chief executive officer', 'chief financial officer', 'president',
-            'executive vice president', 'ceo', 'cfo'
-        ]
+        if roster:
+            speaker_type = roster.speaker_type(speaker)
+            if speaker_type:
+                return speaker_type == 'executive'
         
-        return any(indicator in speaker_lower for indicator in executive_indicators)
+        return self.keywords.has_any(self.keywords.scan(speaker), 'executive_speaker')
     
-    def _classify_speaker(self, speaker: str, content: str) -> str:
+    def _classify_speaker(self, speaker: str, content: str, roster: Optional[ParticipantRoster] = None) -> str:
         """Classify speaker as executive, analyst, or other"""
-        speaker_lower = speaker.lower()
+        # Listed participants are typed by their roster role
+        if roster:
+            speaker_type = roster.speaker_type(speaker)
+            if speaker_type:
+                return speaker_type
+        
+        hits = self.keywords.scan(speaker)
         
         # Check if executive
-        if self._is_executive(speaker):
+        if self.keywords.has_any(hits, 'executive_speaker'):
             return 'executive'
         
         # Check if analyst
-        analyst_indicators = [
-            'analyst', 'research', 'capital', 'securities', 'bank', 
-            'morgan', 'goldman', 'barclays', 'jpmorgan', 'credit suisse'
-        ]
-        
-        if any(indicator in speaker_lower for indicator in analyst_indicators):
+        if self.keywords.has_any(hits, 'analyst_speaker'):
             return 'analyst'
         
         # Heuristic: shorter segments are often questions from analysts
@@ -293,57 +485,61 @@ class TranscriptParser:
         executive_content = []
         for para in paragraphs:
             if len(para.split()) > 30:  # Substantial content
-                para_lower = para.lower()
-                
-                # Look for business/financial language typical of executive remarks
-                executive_indicators = [
-                    'revenue', 'quarter', 'growth', 'performance', 'results',
-                    'business', 'market', 'customers', 'products', 'outlook',
-                    'datacenter', 'gaming', 'automotive', 'ai', 'artificial intelligence'
-                ]
-                
-                indicator_count = sum(1 for indicator in executive_indicators if indicator in para_lower)
-                
-                if indicator_count >= 2:  # At least 2 business terms
+                if self._count_business_terms(para) >= 2:  # At least 2 business terms
                     executive_content.append(para.strip())
         
         return '\n\n'.join(executive_content[:3])  # Return first 3 meaningful paragraphs
     
-    def _clean_boilerplate(self, text: str) -> str:
+    def _count_business_terms(self, para: str) -> int:
+        """Business/financial terms typical of executive remarks found in a paragraph"""
+        return self.keywords.count(self.keywords.scan(para), 'business_terms')
+    
+    def _clean_boilerplate(self, text: str, fired: Optional[Dict[str, int]] = None) -> str:
         """Remove common boilerplate text that doesn't contain sentiment"""
-        # Remove common boilerplate patterns
-        boilerplate_patterns = [
-            r'The Motley Fool\.\s*',
-            r'Nvidia\s*\(\s*NVDA\s*[+-]?\d*\.?\d*%?\s*\)',
-            r'Q\d+\s+\d{4}\s+Earnings\s+Call',
-            r'[A-Z][a-z]+\s+\d{1,2},\s+\d{4}',
-            r'\d{1,2}:\d{2}\s+[ap]\.m\.\s+ET',
-            r'Image\s+source[^\n]*',
-            r'Call\s+Participants',
-            r'Prepared\s+Remarks',
-            r'Questions\s+and\s+Answers',
-            r'Operator\s*Good\s+afternoon\.[^.]*conference\s+operator[^.]*\.',
-        ]
-        
-        for pattern in boilerplate_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        return text.strip()
+        return BOILERPLATE.normalize(text, fired)
     
-    def _clean_content(self, content: str) -> str:
+    def _clean_content(self, content: str, fired: Optional[Dict[str, int]] = None) -> str:
         """Clean content of titles, metadata, and formatting issues"""
-        # Remove title patterns that often get mixed in
-        title_patterns = [
-            r'^[A-Z][a-z\s,]+(?:Director|Officer|President|CEO|CFO)[^\n]*\n',
-            r'^Thanks?,?\s+[A-Z][a-z]+\.\s*',
-            r'^\s*[\w\s]+,\s+[\w\s]+\s*\n',  # Remove title lines
-        ]
-        
-        for pattern in title_patterns:
-            content = re.sub(pattern, '', content, flags=re.MULTILINE)
-        
-        # Clean up excessive whitespace and newlines
-        content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
-        content = re.sub(r'^\s+|\s+$', '', content)
-        
-        return content
+        return SEGMENT_CONTENT.normalize(content, fired)
+
+
+# Per-process copy of the parser, set once by the pool initializer
+_worker_parser = None
+
+
+def _init_worker(parser) -> None:
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _call_worker(method: str, transcript_data: Dict):
+    return getattr(_worker_parser, method)(transcript_data)
+
+
+def parse_in_processes(parser, method: str, transcripts: Sequence[Dict], workers: Optional[int] = None,
+                       chunksize: Optional[int] = None, start_method: Optional[str] = None) -> List:
+    """parser.<method>(transcript) for each transcript on a process pool, in input order
+
+    Each worker receives the parser once, through the pool initializer, with
+    its patterns and keyword automaton already compiled; documents are then
+    sent in chunks (by default about four per worker) to amortize the
+    round-trips. With one worker, or one document, everything runs in-process.
+
+    Workers start from a forkserver (spawn where that is unavailable) with a
+    pickled parser, since forking the server process, with its scraper
+    threads and loaded models, can deadlock the child. start_method='fork'
+    skips the pickling and is meant for single-threaded CLIs.
+    """
+    transcripts = list(transcripts)
+    workers = min(workers or os.cpu_count() or 1, len(transcripts))
+    if workers <= 1:
+        return [getattr(parser, method)(transcript_data) for transcript_data in transcripts]
+
+    chunksize = chunksize or max(1, len(transcripts) // (workers * 4))
+    available = multiprocessing.get_all_start_methods()
+    if start_method not in available:
+        start_method = 'forkserver' if 'forkserver' in available else 'spawn'
+    context = multiprocessing.get_context(start_method)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(parser,)) as executor:
+        return list(executor.map(partial(_call_worker, method), transcripts, chunksize=chunksize))
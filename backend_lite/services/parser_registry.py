@@ -0,0 +1,155 @@
+"""
+Registry of transcript parsing strategies run as a quality-gated cascade
+"""
+import time
+import hashlib
+import logging
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from services.parser import TranscriptParser, parse_in_processes
+from services.parser_new import TranscriptParser as LegacyTranscriptParser
+from services.segments import QAIndex, Segment
+
+logging.basicConfig(level=logging.INFO)
+
+
+class ParserCascade:
+    """Runs registered parsing strategies cheapest first, stopping at the first result that passes the quality checks
+
+    Default order:
+      structured - speaker turns read from the page markup
+      regex      - TranscriptParser's section and speaker patterns over full_text
+      legacy     - the older heuristics in parser_new (broader Q&A headings)
+
+    A result is rejected when it has no Q&A or no management segments, or
+    when the Q&A boundary came from the 60% length split. If every strategy
+    is rejected, the result with the fewest issues wins, the cheaper one on
+    ties. Latency and acceptance are counted per strategy. Has the same
+    parse() interface as TranscriptParser, so it can sit behind a ParseCache.
+    """
+
+    def __init__(self, parser: Optional[TranscriptParser] = None):
+        self.logger = logging.getLogger(__name__)
+        self.parser = parser or TranscriptParser()
+        self.legacy_parser = LegacyTranscriptParser()
+        self.strategies: List[Tuple[str, Callable[[Dict], Optional[Dict]]]] = []
+        self._stats: Dict[str, Dict] = {}
+
+        self.register('structured', self.parser.parse_structured)
+        self.register('regex', self.parser.parse_text)
+        self.register('legacy', self._parse_legacy)
+        self.fingerprint = self._fingerprint()
+
+    def register(self, name: str, strategy: Callable[[Dict], Optional[Dict]]) -> None:
+        """Append a strategy; it returns a parse result or None when it does not apply"""
+        self.strategies.append((name, strategy))
+        self._stats[name] = self._new_stats()
+
+    @staticmethod
+    def _new_stats() -> Dict:
+        return {'runs': 0, 'accepted': 0, 'selected': 0, 'seconds': 0.0}
+
+    def _fingerprint(self) -> str:
+        legacy = self.legacy_parser
+        tables = [self.parser.fingerprint, [name for name, _ in self.strategies],
+                  legacy.prepared_remarks_patterns, legacy.qa_start_patterns, legacy.executive_patterns,
+                  legacy.speaker_pattern.pattern]
+        return hashlib.sha256(repr(tables).encode('utf-8')).hexdigest()[:16]
+
+    def parse(self, transcript_data: Dict) -> Optional[Dict]:
+        if not transcript_data or not transcript_data.get('full_text'):
+            return None
+
+        candidates = []
+        for name, strategy in self.strategies:
+            stats = self._stats[name]
+            start = time.perf_counter()
+            failed = False
+            try:
+                parsed = strategy(transcript_data)
+            except Exception as e:
+                self.logger.error(f"Parser strategy {name} failed: {e}")
+                parsed, failed = None, True
+            # A strategy that does not apply (no speaker turns) has done no parsing to count
+            if parsed is None and not failed:
+                continue
+            stats['seconds'] += time.perf_counter() - start
+            stats['runs'] += 1
+            if parsed is None:
+                continue
+
+            issues = self.quality_issues(parsed)
+            candidates.append((len(issues), len(candidates), name, parsed, issues))
+            if not issues:
+                stats['accepted'] += 1
+                break
+            self.logger.info(f"Parser strategy {name} rejected: {', '.join(issues)}")
+
+        if not candidates:
+            return None
+
+        _, _, name, parsed, issues = min(candidates, key=lambda candidate: candidate[:2])
+        self._stats[name]['selected'] += 1
+        if issues:
+            self.logger.warning(f"No parser strategy passed quality checks, using {name} ({', '.join(issues)})")
+        return {**parsed, 'parser_strategy': name, 'quality_issues': issues}
+
+    def parse_many(self, transcripts: Sequence[Dict], workers: Optional[int] = None,
+                   chunksize: Optional[int] = None, start_method: Optional[str] = None) -> List[Optional[Dict]]:
+        """parse() for every transcript on worker processes, in input order; worker stats are merged into this cascade's"""
+        results = []
+        for parsed, counts in parse_in_processes(self, '_parse_counted', transcripts, workers, chunksize,
+                                                     start_method):
+            for name, strategy_counts in counts.items():
+                for key, value in strategy_counts.items():
+                    self._stats[name][key] += value
+            results.append(parsed)
+        return results
+
+    def _parse_counted(self, transcript_data: Dict) -> Tuple[Optional[Dict], Dict[str, Dict]]:
+        """parse() plus the stats of just this call, leaving the running totals untouched"""
+        totals, self._stats = self._stats, {name: self._new_stats() for name in self._stats}
+        try:
+            return self.parse(transcript_data), self._stats
+        finally:
+            self._stats = totals
+
+    @staticmethod
+    def quality_issues(parsed: Dict) -> List[str]:
+        issues = []
+        if parsed.get('section_split') == 'heuristic':
+            issues.append('heuristic_split')
+        if not parsed['qa_session']:
+            issues.append('no_qa_segments')
+        if not parsed['management_remarks']:
+            issues.append('no_management_segments')
+        return issues
+
+    def _parse_legacy(self, transcript_data: Dict) -> Optional[Dict]:
+        legacy = self.legacy_parser
+        parsed = legacy.parse(transcript_data)
+        if not parsed:
+            return None
+
+        # parser_new does not report how it split; repeat its Q&A search to tell
+        qa_start = legacy._find_qa_start(legacy._clean_raw_text(transcript_data['full_text']))
+        qa_session = [Segment.from_dict(segment) for segment in parsed['qa_session']]
+        return {
+            **parsed,
+            'management_remarks': [Segment.from_dict(segment) for segment in parsed['management_remarks']],
+            'qa_session': qa_session,
+            'qa_exchanges': QAIndex(qa_session),
+            'normalization': {},
+            'section_split': 'qa_only' if qa_start > 0 else 'heuristic'
+        }
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per strategy: runs (inputs it applied to), accepted (passed the checks), selected, hit_rate and mean latency"""
+        return {
+            name: {
+                **stats,
+                'hit_rate': stats['accepted'] / stats['runs'] if stats['runs'] else 0.0,
+                'mean_ms': 1000 * stats['seconds'] / stats['runs'] if stats['runs'] else 0.0
+            }
+            for name, stats in self._stats.items()
+        }
@@ -0,0 +1,104 @@
+"""
+Request-scoped pipeline context shared by the analysis stages
+"""
+import logging
+from typing import List, Dict, Optional
+
+logging.basicConfig(level=logging.INFO)
+
+
+class TranscriptContext:
+    """State for one transcript as it moves through scrape, parse and analysis"""
+
+    def __init__(self, url: str, transcript_data: Dict, parsed: Dict):
+        self.url = url
+        self.transcript_data = transcript_data
+        self.parsed = parsed
+        self.management_sentiment = None
+        self.qa_sentiment = None
+        self.focuses = []
+
+    @property
+    def quarter(self) -> Optional[int]:
+        return self.parsed['quarter']
+
+    @property
+    def year(self) -> Optional[int]:
+        return self.parsed['year']
+
+    def to_result(self) -> Dict:
+        """Per-quarter result in the shape the tone analyzer and API expect"""
+        return {
+            'quarter': self.quarter,
+            'year': self.year,
+            'transcript_url': self.url,
+            'management_sentiment': self.management_sentiment,
+            'qa_sentiment': self.qa_sentiment,
+            'prepared_remarks_count': len(self.parsed['management_remarks']),
+            'qa_count': len(self.parsed['qa_session']),
+            'transcript_data': self.parsed  # Include parsed transcript for tone analysis
+        }
+
+
+class PipelineContext:
+    """Memo of scraped and parsed transcripts for a single request
+
+    Each URL is fetched and parsed exactly once; every later stage reads from
+    the same TranscriptContext so results stay aligned with their source.
+    """
+
+    def __init__(self, ticker: str, num_quarters: int):
+        self.logger = logging.getLogger(__name__)
+        self.ticker = ticker
+        self.num_quarters = num_quarters
+        self.transcript_urls: List[str] = []
+        self.transcripts: List[TranscriptContext] = []
+        self.failed_urls: List[str] = []
+
+    def load(self, scraper, parser, transcript_urls: List[str], store=None, workers: int = 1) -> List[TranscriptContext]:
+        """Scrape and parse every URL once, keeping only transcripts that succeeded
+
+        URLs already ingested into a TranscriptStore (e.g. by the backfill CLI)
+        are read from it instead of being scraped. parser is a TranscriptParser
+        or a ParseCache wrapping one; with workers > 1 the transcripts are
+        parsed on that many processes.
+        """
+        self.transcript_urls = transcript_urls
+        self.transcripts = []
+        self.failed_urls = []
+
+        stored = {}
+        if store is not None:
+            for url in transcript_urls:
+                record = store.get(url)
+                if record and record.get('transcript_data'):
+                    stored[url] = record['transcript_data']
+
+        to_scrape = [url for url in transcript_urls if url not in stored]
+        scraped = dict(zip(to_scrape, scraper.scrape_transcripts(to_scrape)))
+        if stored:
+            self.logger.info(f"Using {len(stored)} stored transcripts, scraping {len(to_scrape)}")
+
+        loaded = []
+        for url in transcript_urls:
+            transcript_data = stored.get(url) or scraped.get(url)
+            if not transcript_data:
+                self.logger.warning(f"Skipping transcript that could not be scraped: {url}")
+                self.failed_urls.append(url)
+                continue
+            loaded.append((url, transcript_data))
+
+        parsed_all = parser.parse_many([transcript_data for _, transcript_data in loaded], workers=workers)
+        for (url, transcript_data), parsed in zip(loaded, parsed_all):
+            if not parsed:
+                self.logger.warning(f"Skipping transcript that could not be parsed: {url}")
+                self.failed_urls.append(url)
+                continue
+
+            self.transcripts.append(TranscriptContext(url, transcript_data, parsed))
+
+        return self.transcripts
+
+    def results(self) -> List[Dict]:
+        """Per-quarter results for every loaded transcript"""
+        return [ctx.to_result() for ctx in self.transcripts]
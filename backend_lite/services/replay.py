@@ -0,0 +1,266 @@
+"""
+Record/replay HTTP layer and a local stand-in server for offline scraping
+"""
+import io
+import os
+import json
+import time
+import random
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logging.basicConfig(level=logging.INFO)
+
+# Only headers that matter to the scraper are kept in fixtures
+RECORDED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Retry-After')
+
+
+class FixtureStore:
+    """Recorded responses on disk: index.json plus one body file per URL"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.index_path = os.path.join(directory, 'index.json')
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def key(url: str) -> str:
+        """Fixtures are keyed by path and query so any host can serve them"""
+        parts = urlsplit(url)
+        return urlunsplit(('', '', parts.path or '/', parts.query, ''))
+
+    def __contains__(self, url: str) -> bool:
+        return self.key(url) in self.index
+
+    def get(self, url: str) -> Optional[Tuple[Dict, bytes]]:
+        entry = self.index.get(self.key(url))
+        if not entry:
+            return None
+
+        with open(os.path.join(self.directory, entry['file']), 'rb') as f:
+            return entry, f.read()
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        key = self.key(url)
+        filename = hashlib.sha1(key.encode()).hexdigest() + '.html'
+        os.makedirs(self.directory, exist_ok=True)
+
+        with self._lock:
+            with open(os.path.join(self.directory, filename), 'wb') as f:
+                f.write(body)
+
+            self.index[key] = {
+                'url': url,
+                'file': filename,
+                'status': status,
+                'headers': {name: headers[name] for name in RECORDED_HEADERS if name in headers},
+                'recorded_at': datetime.now().isoformat()
+            }
+            with open(self.index_path, 'w') as f:
+                json.dump(self.index, f, indent=2, sort_keys=True)
+
+
+def build_response(request: requests.PreparedRequest, status: int, headers: Dict[str, str],
+                   body: bytes) -> requests.Response:
+    """A fully-read requests.Response, usable with .content and .iter_content"""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = io.BytesIO(body)
+    response._content = body
+    response._content_consumed = True
+    response.url = request.url
+    response.request = request
+    response.reason = 'OK' if status < 400 else 'Error'
+    return response
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Passes requests to the network and saves the responses as fixtures
+
+    Only successful responses replace a recorded fixture, so one flaky
+    upstream call cannot overwrite a good page with an error; an error is
+    kept only for a URL that has nothing recorded yet.
+    """
+
+    def __init__(self, fixtures: FixtureStore, **kwargs):
+        super().__init__(**kwargs)
+        self.fixtures = fixtures
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if 200 <= response.status_code < 300 or (response.status_code != 304 and request.url not in self.fixtures):
+            self.fixtures.put(request.url, response.status_code, response.headers, response.content)
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Answers every request from recorded fixtures without touching the network"""
+
+    def __init__(self, fixtures: FixtureStore, **kwargs):
+        super().__init__(**kwargs)
+        self.fixtures = fixtures
+
+    def send(self, request, **kwargs):
+        recorded = self.fixtures.get(request.url)
+        if recorded is None:
+            return build_response(request, 404, {'Content-Type': 'text/plain'},
+                                  f"No fixture recorded for {request.url}".encode())
+
+        entry, body = recorded
+        return build_response(request, entry['status'], entry['headers'], body)
+
+
+class UpstreamAdapter(HTTPAdapter):
+    """Sends requests for any host to a fixed upstream, e.g. the local ReplayServer"""
+
+    def __init__(self, upstream: str, **kwargs):
+        super().__init__(**kwargs)
+        self.upstream = urlsplit(upstream)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = urlunsplit((self.upstream.scheme, self.upstream.netloc,
+                                  parts.path, parts.query, parts.fragment))
+        return super().send(request, **kwargs)
+
+
+def configure_session(session: requests.Session, mode: str = 'live', fixture_dir: Optional[str] = None,
+                      upstream: Optional[str] = None, **adapter_kwargs) -> requests.Session:
+    """Mount the adapter for a scraper HTTP mode: live, record, replay or upstream"""
+    if mode == 'live':
+        return session
+
+    if mode in ('record', 'replay'):
+        if not fixture_dir:
+            raise ValueError(f"HTTP mode '{mode}' needs a fixture directory")
+        adapter_class = RecordingAdapter if mode == 'record' else ReplayAdapter
+        adapter = adapter_class(FixtureStore(fixture_dir), **adapter_kwargs)
+    elif mode == 'upstream':
+        if not upstream:
+            raise ValueError("HTTP mode 'upstream' needs an upstream URL")
+        adapter = UpstreamAdapter(upstream, **adapter_kwargs)
+    else:
+        raise ValueError(f"Unknown scraper HTTP mode: {mode}")
+
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def configure_session_from_env(session: requests.Session, **adapter_kwargs) -> requests.Session:
+    """configure_session for SCRAPER_HTTP_MODE, SCRAPER_FIXTURE_DIR and SCRAPER_UPSTREAM"""
+    return configure_session(session, mode=os.getenv('SCRAPER_HTTP_MODE', 'live'),
+                             fixture_dir=os.getenv('SCRAPER_FIXTURE_DIR'), upstream=os.getenv('SCRAPER_UPSTREAM'),
+                             **adapter_kwargs)
+
+
+class ReplayServer:
+    """Local HTTP server serving recorded fixtures with injected latency and errors
+
+    latency and jitter are in seconds; error_rate is the fraction of requests
+    answered with error_status instead of the fixture. ETag revalidation is
+    honoured so conditional GETs behave like the real site.
+    """
+
+    def __init__(self, fixture_dir: str, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, seed: Optional[int] = None):
+        self.logger = logging.getLogger(__name__)
+        self.fixtures = FixtureStore(fixture_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, format, *args):
+                server.logger.debug(format % args)
+
+        return Handler
+
+    def handle(self, handler: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.requests_served += 1
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            inject_error = self.error_rate and self.random.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+
+        if inject_error:
+            self._send(handler, self.error_status, {'Content-Type': 'text/plain', 'Retry-After': '1'},
+                       b'Injected error')
+            return
+
+        recorded = self.fixtures.get(handler.path)
+        if recorded is None:
+            self._send(handler, 404, {'Content-Type': 'text/plain'}, b'No fixture recorded')
+            return
+
+        entry, body = recorded
+        etag = entry['headers'].get('ETag') or f'"{hashlib.sha1(body).hexdigest()}"'
+        if handler.headers.get('If-None-Match') == etag:
+            self._send(handler, 304, {'ETag': etag}, b'')
+            return
+
+        self._send(handler, entry['status'], {**entry['headers'], 'ETag': etag}, body)
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, headers: Dict[str, str], body: bytes) -> None:
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        if body:
+            handler.wfile.write(body)
+
+    def start(self) -> 'ReplayServer':
+        """Serve from a background thread (for tests and benchmarks)"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Replay server listening on {self.url}")
+        return self
+
+    def serve_forever(self) -> None:
+        self.logger.info(f"Replay server listening on {self.url}")
+        self.httpd.serve_forever()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
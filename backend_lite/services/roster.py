@@ -0,0 +1,131 @@
+"""
+Call participants roster: who is on the call and on which side, read once per transcript
+"""
+import re
+import logging
+from typing import Dict, List, NamedTuple, Optional
+
+logging.basicConfig(level=logging.INFO)
+
+PARTICIPANTS_HEADING = re.compile(r'^\s*call\s+participants\s*:?\s*$', re.IGNORECASE | re.MULTILINE)
+
+# "Name -- Role", "Name -- Firm -- Analyst" or, in newer pages, "Role — Name"
+SEPARATOR_TOKENS = ('--', '—')
+PARTICIPANT_SEPARATOR = re.compile(r'\s*(?:--|—)\s*')
+ROLE_WORDS = re.compile(r'\b(?:officer|president|director|analyst|relations|chair(?:man|woman)?|ceo|cfo|coo|'
+                        r'head|manager|treasurer|controller|counsel|founder|partner)\b', re.IGNORECASE)
+NAME_PATTERN = re.compile(r"^[A-Z][\w.'\-]*(?:\s+[\w.'\-]+){0,5}$")
+MAX_PARTICIPANT_LINE = 200
+
+
+class Participant(NamedTuple):
+    """One roster entry"""
+    name: str
+    role: str
+    firm: Optional[str]
+    speaker_type: str  # 'executive' (company side) or 'analyst'
+
+
+class ParticipantRoster:
+    """Speaker label -> Participant for one transcript
+
+    Built from the "Call participants" block of the transcript text. Labels
+    are matched on their name part (before any "--"), case- and
+    punctuation-insensitively, falling back to first and last name so
+    "Colette Kress" finds "Colette M. Kress". Every label's result is
+    memoized, so each distinct speaker is resolved once per transcript.
+    """
+
+    def __init__(self, participants: List[Participant]):
+        self.logger = logging.getLogger(__name__)
+        self.participants: List[Participant] = []
+        self._by_key: Dict[str, Participant] = {}
+        for participant in participants:
+            keys = self._keys(participant.name)
+            if keys and keys[0] in self._by_key:
+                continue
+            self.participants.append(participant)
+            for key in keys:
+                self._by_key.setdefault(key, participant)
+        self._resolved: Dict[str, Optional[Participant]] = {}
+
+    @classmethod
+    def from_text(cls, text: str) -> 'ParticipantRoster':
+        """Roster from the lines after the first "Call participants" heading, empty if there is none"""
+        heading = PARTICIPANTS_HEADING.search(text)
+        if not heading:
+            return cls([])
+
+        # Entries run until the first line that is not one; "Name\n-- Role"
+        # (bold name, plain role) is joined back into a single entry
+        participants = []
+        entry = None
+        for line in text[heading.end():].splitlines():
+            line = line.strip()
+            if not line or line.lower() == 'operator':
+                continue
+            if entry is not None and (line.startswith(SEPARATOR_TOKENS) or entry.endswith(SEPARATOR_TOKENS)):
+                entry = f"{entry} {line}"
+                continue
+            if entry is not None:
+                participant = cls._parse_line(entry)
+                if participant is None:
+                    entry = None
+                    break
+                participants.append(participant)
+            entry = line
+
+        if entry is not None:
+            participant = cls._parse_line(entry)
+            if participant is not None:
+                participants.append(participant)
+        return cls(participants)
+
+    @staticmethod
+    def _parse_line(line: str) -> Optional[Participant]:
+        if len(line) > MAX_PARTICIPANT_LINE:
+            return None
+        parts = [part for part in PARTICIPANT_SEPARATOR.split(line) if part]
+        if len(parts) < 2:
+            return None
+
+        name, role = parts[0], parts[-1]
+        if ROLE_WORDS.search(name) and not ROLE_WORDS.search(role):
+            name, role = role, name
+        if not NAME_PATTERN.match(name):
+            return None
+
+        firm = ' -- '.join(parts[1:-1]) or None
+        speaker_type = 'analyst' if re.search(r'\banalyst\b', role, re.IGNORECASE) else 'executive'
+        return Participant(name, role, firm, speaker_type)
+
+    @staticmethod
+    def _keys(name: str) -> List[str]:
+        words = name.lower().replace('.', ' ').replace(',', ' ').split()
+        if not words:
+            return []
+        keys = [' '.join(words)]
+        if len(words) > 2:
+            keys.append(f"{words[0]} {words[-1]}")
+        return keys
+
+    def resolve(self, label: str) -> Optional[Participant]:
+        """Participant for a speaker label ("Jensen Huang" or "Jensen Huang -- CEO"), if on the roster"""
+        if label in self._resolved:
+            return self._resolved[label]
+
+        participant = None
+        if self._by_key:
+            for key in self._keys(label.partition('--')[0]):
+                participant = self._by_key.get(key)
+                if participant:
+                    break
+        self._resolved[label] = participant
+        return participant
+
+    def speaker_type(self, label: str) -> Optional[str]:
+        participant = self.resolve(label)
+        return participant.speaker_type if participant else None
+
+    def __len__(self) -> int:
+        return len(self.participants)
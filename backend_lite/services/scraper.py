@@ -1,13 +1,24 @@
 """
 Lightweight Motley Fool Earnings Call Transcript Scraper
 """
+import os
 import re
-import time
+import codecs
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import requests
-from bs4 import BeautifulSoup
+
+from services.rate_limiter import HostRateLimiter
+from services.transport import HttpTransport
+from services.replay import configure_session_from_env
+from services.page_store import PageStore
+from services.text_normalizer import SCRAPED_TEXT
+from services.discovery import TranscriptIndex, latest_transcripts, parse_transcript_url
+from services.extractors import (
+    HtmlParserExtractor, StreamingArticleParser, extract_speaker_turns, find_largest_text_block, get_extractor
+)
 
 logging.basicConfig(level=logging.INFO)
 
@@ -17,140 +28,330 @@ class MotleyFoolScraper:
     
     BASE_URL = "https://www.fool.com"
     NVIDIA_QUOTE_URL = "https://www.fool.com/quote/nasdaq/nvidia/nvda/"
+    TRANSCRIPTS_ARCHIVE_URL = "https://www.fool.com/earnings-call-transcripts/"
+    SITEMAP_URL_TEMPLATE = "https://www.fool.com/sitemap/{year}/{month:02d}"
+    QUOTE_URLS = {'NVDA': NVIDIA_QUOTE_URL}
+    # Last resort when discovery finds nothing (e.g. fool.com unreachable on a cold index)
+    FALLBACK_TRANSCRIPT_URLS = {
+        'NVDA': [
+            "https://www.fool.com/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/",
+            "https://www.fool.com/earnings/call-transcripts/2024/08/28/nvidia-nvda-q2-2025-earnings-call-transcript/",
+            "https://www.fool.com/earnings/call-transcripts/2024/05/22/nvidia-nvda-q1-2025-earnings-call-transcript/",
+            "https://www.fool.com/earnings/call-transcripts/2024/02/21/nvidia-nvda-q4-2024-earnings-call-transcript/"
+        ]
+    }
     RATE_LIMIT_DELAY = 1.0
+    RATE_LIMIT_BURST = 1
+    MAX_WORKERS = 4
+    POOL_SIZE = 10
+    STREAM_CHUNK_SIZE = 16384
     
-    def __init__(self):
+    def __init__(self, page_store: Optional[PageStore] = None,
+                 extractor: Optional[HtmlParserExtractor] = None,
+                 transcript_index: Optional[TranscriptIndex] = None,
+                 streaming: bool = False):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         self.logger = logging.getLogger(__name__)
+        # Shared by all worker threads so concurrent fetches still respect the per-host rate
+        self.rate_limiter = HostRateLimiter(1.0 / self.RATE_LIMIT_DELAY, self.RATE_LIMIT_BURST)
+        # Pooled keep-alive connections, retries with backoff and a per-host circuit breaker
+        self.transport = HttpTransport(self.session, self.rate_limiter, pool_size=self.POOL_SIZE)
+        # Optional raw page store for conditional GETs and skipping re-extraction
+        self.page_store = page_store
+        # HTML parsing backend (lxml partial parse when available)
+        self.extractor = extractor or get_extractor()
+        # Optional persistent discovery index for "last N quarters" lookups
+        self.transcript_index = transcript_index
+        # Stream transcript pages and stop reading once the article body has ended
+        self.streaming = streaming
     
     def find_transcript_urls(self, ticker: str, num_quarters: int = 4) -> List[str]:
-        """Find earnings call transcript URLs for NVIDIA"""
+        """Find the latest earnings call transcript URLs for a ticker, newest first"""
         self.logger.info(f"Searching for {ticker} transcript URLs")
+        ticker = ticker.upper()
         
-        try:
-            # Get NVIDIA quote page
-            response = self.session.get(self.NVIDIA_QUOTE_URL, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find transcript links
-            transcript_urls = []
-            
-            # Look for earnings call transcript links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                text = link.get_text(strip=True).lower()
-                
-                if 'earnings-call-transcript' in href and ('nvidia' in text or 'nvda' in text):
-                    full_url = href if href.startswith('http') else self.BASE_URL + href
-                    if full_url not in transcript_urls:
-                        transcript_urls.append(full_url)
-            
-            # Also check the transcripts section
-            transcripts_section = soup.find('section', {'data-testid': 'transcripts'})
-            if transcripts_section:
-                for link in transcripts_section.find_all('a', href=True):
-                    href = link['href']
-                    if 'earnings-call-transcript' in href:
-                        full_url = href if href.startswith('http') else self.BASE_URL + href
-                        if full_url not in transcript_urls:
-                            transcript_urls.append(full_url)
-            
-            # Sort by date (most recent first)
-            transcript_urls = transcript_urls[:num_quarters]
+        if self.transcript_index is not None:
+            # Index lookup; listing pages are only re-crawled once the TTL expires
+            if self.transcript_index.is_stale(ticker):
+                self.refresh_transcript_index(ticker)
+            transcript_urls = self.transcript_index.latest_urls(ticker, num_quarters)
+        else:
+            urls_by_source, _ = self._discover_transcript_links(ticker)
+            entries = {}
+            for urls in urls_by_source.values():
+                for url in urls:
+                    info = parse_transcript_url(url)
+                    if info and info['ticker'] == ticker:
+                        entries[url] = {**info, 'url': url}
+            transcript_urls = [entry['url'] for entry in latest_transcripts(entries.values(), num_quarters)]
+        
+        if not transcript_urls:
+            fallback = self.FALLBACK_TRANSCRIPT_URLS.get(ticker, [])[:num_quarters]
+            self.logger.warning(f"No {ticker} transcripts discovered, using {len(fallback)} known fallback URLs")
+            return fallback
+        
+        self.logger.info(f"Found {len(transcript_urls)} transcript URLs")
+        return transcript_urls
+    
+    def refresh_transcript_index(self, ticker: str, sitemap_months: Optional[List[Tuple[int, int]]] = None) -> int:
+        """Add newly listed transcripts to the index from listing pages and sitemap months"""
+        ticker = ticker.upper()
+        urls_by_source, succeeded = self._discover_transcript_links(ticker)
+        
+        added = 0
+        for source, urls in urls_by_source.items():
+            added += self.transcript_index.add(ticker, urls, source=source)
+        
+        current_month = (datetime.now().year, datetime.now().month)
+        for year, month in sitemap_months or []:
+            sitemap_url = self.SITEMAP_URL_TEMPLATE.format(year=year, month=month)
+            if self.transcript_index.is_crawled(sitemap_url):
+                continue
             
-            self.logger.info(f"Found {len(transcript_urls)} transcript URLs")
-            return transcript_urls
+            try:
+                urls = self._fetch_sitemap_links(sitemap_url)
+            except Exception as e:
+                self.logger.error(f"Error reading sitemap {sitemap_url}: {e}")
+                continue
             
-        except Exception as e:
-            self.logger.error(f"Error finding transcript URLs: {e}")
-            # Return some example URLs as fallback
-            return [
-                "https://www.fool.com/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/",
-                "https://www.fool.com/earnings/call-transcripts/2024/08/28/nvidia-nvda-q2-2025-earnings-call-transcript/",
-                "https://www.fool.com/earnings/call-transcripts/2024/05/22/nvidia-nvda-q1-2025-earnings-call-transcript/",
-                "https://www.fool.com/earnings/call-transcripts/2024/02/21/nvidia-nvda-q4-2024-earnings-call-transcript/"
-            ][:num_quarters]
+            added += self.transcript_index.add(ticker, urls, source=sitemap_url)
+            # Past months are final; the current month keeps growing
+            if (year, month) < current_month:
+                self.transcript_index.mark_crawled(sitemap_url)
+        
+        # Only start the TTL once a listing page was actually read, so failures retry
+        if succeeded:
+            self.transcript_index.mark_refreshed(ticker)
+        
+        return added
+    
+    def _discover_transcript_links(self, ticker: str) -> Tuple[Dict[str, List[str]], bool]:
+        """Transcript links on the ticker's quote page and the transcripts archive"""
+        listing_urls = [url for url in (self.QUOTE_URLS.get(ticker), self.TRANSCRIPTS_ARCHIVE_URL) if url]
+        
+        urls_by_source = {}
+        succeeded = False
+        for listing_url in listing_urls:
+            try:
+                urls_by_source[listing_url] = self._fetch_transcript_links(listing_url)
+                succeeded = True
+            except Exception as e:
+                self.logger.error(f"Error finding transcript URLs on {listing_url}: {e}")
+        
+        return urls_by_source, succeeded
+    
+    def _fetch_transcript_links(self, listing_url: str) -> List[str]:
+        """Absolute transcript URLs linked from an HTML listing page"""
+        response = self.transport.get(listing_url)
+        response.raise_for_status()
+        
+        soup = self.extractor.parse_quote_page(response.content)
+        
+        transcript_urls = []
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if 'earnings-call-transcript' in href:
+                full_url = href if href.startswith('http') else self.BASE_URL + href
+                if full_url not in transcript_urls:
+                    transcript_urls.append(full_url)
+        
+        return transcript_urls
+    
+    def _fetch_sitemap_links(self, sitemap_url: str) -> List[str]:
+        """Transcript URLs listed in a sitemap document"""
+        response = self.transport.get(sitemap_url)
+        response.raise_for_status()
+        
+        locations = re.findall(r'<loc>\s*([^<\s]+)\s*</loc>', response.text)
+        return [url for url in locations if 'earnings-call-transcript' in url]
+    
+    def scrape_transcripts(self, urls: List[str], max_workers: Optional[int] = None) -> List[Optional[Dict]]:
+        """Scrape several transcripts concurrently, returning results in input order"""
+        if not urls:
+            return []
+        
+        workers = min(max_workers or self.MAX_WORKERS, len(urls))
+        self.logger.info(f"Scraping {len(urls)} transcripts with {workers} workers")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.scrape_transcript, urls))
     
     def scrape_transcript(self, url: str) -> Optional[Dict]:
         """Scrape a single transcript"""
         self.logger.info(f"Scraping transcript from: {url}")
         
         try:
-            time.sleep(self.RATE_LIMIT_DELAY)
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            stream_parser = StreamingArticleParser() if self.streaming else None
+            content, content_hash = self._fetch_page(url, stream_parser)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Unchanged page: reuse the transcript extracted from this exact body
+            if self.page_store and content_hash:
+                cached = self.page_store.get_extracted(content_hash)
+                if cached:
+                    self.logger.info(f"Page unchanged, reusing extracted transcript for: {url}")
+                    return {**cached, 'url': url}
             
-            # Extract title
-            title = soup.find('h1')
-            title_text = title.get_text(strip=True) if title else "Unknown Title"
-            
-            # Extract quarter and year from title
-            quarter_match = re.search(r'Q(\d)\s+(\d{4})', title_text)
-            if quarter_match:
-                quarter = int(quarter_match.group(1))
-                year = int(quarter_match.group(2))
+            if stream_parser and stream_parser.done:
+                transcript_data = self._build_transcript(url, stream_parser.title, stream_parser.article_text,
+                                                        stream_parser.turns)
             else:
-                # Try alternate format
-                date_match = re.search(r'(\d{4})', title_text)
-                year = int(date_match.group(1)) if date_match else datetime.now().year
-                quarter = 1  # Default
-            
-            # Extract article content - try multiple selectors
-            article = None
-            
-            # First try the specific article body selector
-            article = soup.select_one("div[class*='article-body']")
-            
-            if not article:
-                # Try other selectors
-                selectors = [
-                    ('div', {'class': 'tailwind-article-body'}),
-                    ('article', {}),
-                    ('div', {'class': 'article-content'}),
-                    ('main', {})
-                ]
-                
-                for tag, attrs in selectors:
-                    article = soup.find(tag, attrs)
-                    if article:
-                        break
+                transcript_data = self._extract_transcript(url, content)
+            if transcript_data and self.page_store and content_hash:
+                self.page_store.put_extracted(content_hash, transcript_data)
             
-            if not article:
-                # Try to find any large text block
-                all_divs = soup.find_all('div')
-                for div in all_divs:
-                    text = div.get_text(strip=True)
-                    if len(text) > 5000 and 'earnings call' in text.lower():
-                        article = div
-                        break
-            
-            if not article:
-                self.logger.error("Could not find article content")
-                return None
-            
-            # Get all text content
-            full_text = article.get_text(separator='\n', strip=True)
-            
-            # Clean up the text
-            full_text = re.sub(r'\n{3,}', '\n\n', full_text)
-            full_text = re.sub(r'[ \t]+', ' ', full_text)
-            
-            return {
-                'url': url,
-                'title': title_text,
-                'quarter': quarter,
-                'year': year,
-                'full_text': full_text,
-                'scraped_at': datetime.now().isoformat()
-            }
+            return transcript_data
             
         except Exception as e:
             self.logger.error(f"Error scraping transcript: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _fetch_page(self, url: str, stream_parser: Optional[StreamingArticleParser] = None) -> Tuple[bytes, Optional[str]]:
+        """Fetch a page, revalidating against the page store when one is configured
+        
+        With a stream_parser the body is fed to it chunk by chunk and the
+        connection is closed as soon as the article has ended; the returned
+        content is then only the prefix that was read, and the page store
+        keeps just its hash (for the extracted transcript), not the body.
+        """
+        headers = self.page_store.conditional_headers(url) if self.page_store else {}
+        stream = stream_parser is not None
+        
+        response = self.transport.get(url, headers=headers, stream=stream)
+        
+        if response.status_code == 304 and self.page_store:
+            # A 304 has no body; release its (possibly streamed) connection to the pool
+            response.close()
+            entry = self.page_store.get(url)
+            body = self.page_store.get_body(entry['content_hash']) if entry else None
+            if body is not None:
+                self.logger.info(f"Not modified since last fetch: {url}")
+                self.page_store.touch(url)
+                return body, entry['content_hash']
+            
+            # Validators survived but the body was evicted - fetch it in full
+            response = self.transport.get(url, stream=stream)
+        
+        try:
+            response.raise_for_status()
+            content = self._read_streaming(response, stream_parser) if stream else response.content
+        finally:
+            response.close()
+        
+        if not self.page_store:
+            return content, None
+        
+        content_hash = self.page_store.put(
+            url,
+            content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            # A stream stopped at the end of the article holds only a prefix
+            partial=stream and stream_parser.done
+        )
+        return content, content_hash
+    
+    def _read_streaming(self, response: requests.Response, stream_parser: StreamingArticleParser) -> bytes:
+        """Feed the body to the parser until the article ends, returning the bytes read"""
+        content_type = response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if 'charset' in content_type else 'utf-8'
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        
+        chunks = []
+        for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            stream_parser.feed(decoder.decode(chunk))
+            if stream_parser.done:
+                break
+        
+        if stream_parser.done:
+            self.logger.info(f"Article complete after {sum(len(c) for c in chunks) / 1024:.0f} KB, closing stream")
+        else:
+            stream_parser.feed(decoder.decode(b'', final=True))
+            stream_parser.close()
+        
+        return b''.join(chunks)
+    
+    def _extract_transcript(self, url: str, content: bytes) -> Optional[Dict]:
+        """Extract title, quarter, year and article text from a transcript page"""
+        soup = self.extractor.parse_transcript_page(content)
+        
+        # Extract title
+        title = soup.find('h1')
+        title_text = title.get_text(strip=True) if title else "Unknown Title"
+        
+        # Extract article content - try multiple selectors
+        article = None
+        
+        # First try the specific article body selector
+        article = soup.select_one("div[class*='article-body']")
+        
+        if not article:
+            # Try other selectors
+            selectors = [
+                ('div', {'class': 'tailwind-article-body'}),
+                ('article', {}),
+                ('div', {'class': 'article-content'}),
+                ('main', {})
+            ]
+            
+            for tag, attrs in selectors:
+                article = soup.find(tag, attrs)
+                if article:
+                    break
+        
+        if not article:
+            # Try to find the largest text block mentioning the call
+            article = find_largest_text_block(soup)
+        
+        if not article:
+            self.logger.error("Could not find article content")
+            return None
+        
+        # Get all text content, plus speaker turns from the article's markup
+        return self._build_transcript(url, title_text, article.get_text(separator='\n', strip=True),
+                                      extract_speaker_turns(article))
+    
+    def _build_transcript(self, url: str, title_text: str, full_text: str, turns: List[Dict]) -> Dict:
+        """Transcript record from the page title, raw article text and speaker turns"""
+        # Extract quarter and year from title
+        quarter_match = re.search(r'Q(\d)\s+(\d{4})', title_text)
+        if quarter_match:
+            quarter = int(quarter_match.group(1))
+            year = int(quarter_match.group(2))
+        else:
+            # Try alternate format
+            date_match = re.search(r'(\d{4})', title_text)
+            year = int(date_match.group(1)) if date_match else datetime.now().year
+            quarter = 1  # Default
+        
+        # Clean up the text
+        full_text = SCRAPED_TEXT.normalize(full_text)
+        
+        return {
+            'url': url,
+            'title': title_text,
+            'quarter': quarter,
+            'year': year,
+            'full_text': full_text,
+            'turns': turns,
+            'scraped_at': datetime.now().isoformat()
+        }
+
+
+def create_scraper(cache_dir: str) -> MotleyFoolScraper:
+    """Scraper configured from the environment, sharing the app's on-disk stores"""
+    scraper = MotleyFoolScraper(
+        page_store=PageStore(os.getenv('PAGE_STORE_DIR', os.path.join(cache_dir, 'pages'))),
+        extractor=get_extractor(os.getenv('SCRAPER_EXTRACTOR')),
+        streaming=os.getenv('SCRAPER_STREAMING', 'False') == 'True',
+        transcript_index=TranscriptIndex(
+            os.getenv('DISCOVERY_INDEX_DIR', os.path.join(cache_dir, 'discovery')),
+            ttl=int(os.getenv('DISCOVERY_TTL', 6 * 3600))
+        )
+    )
+    # live (default), record/replay against SCRAPER_FIXTURE_DIR, or upstream to a local replay server
+    configure_session_from_env(scraper.session, **scraper.transport.adapter_kwargs)
+    return scraper
@@ -0,0 +1,337 @@
+"""
+Segment records: compact parsed segments and the offset-based span model
+"""
+import re
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from services.keyword_matcher import get_keyword_matcher
+from services.text_normalizer import SEGMENT_CONTENT
+
+SECTIONS = ('prepared_remarks', 'qa')
+SPEAKER_TYPES = ('executive', 'analyst', 'other')
+
+# Words and individual punctuation marks, as BERT's basic tokenizer splits them;
+# a lower bound on the model's word-piece count
+BASIC_TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+
+class Segment:
+    """One speaker segment with the features consumers need, computed once at parse time
+
+    Read-only mapping access (segment['content'], segment.get('speaker_type'))
+    is kept for callers written against the original segment dicts.
+    """
+
+    __slots__ = ('speaker', 'content', 'speaker_type', 'word_count', 'token_count',
+                 'content_lower', 'boilerplate_hits', 'is_boilerplate')
+
+    DICT_KEYS = ('speaker', 'content', 'word_count', 'speaker_type', 'token_count')
+
+    def __init__(self, speaker: str, content: str, speaker_type: str, word_count: Optional[int] = None):
+        self.speaker = speaker
+        self.content = content
+        self.speaker_type = speaker_type
+        self.word_count = len(content.split()) if word_count is None else word_count
+        self.token_count = len(BASIC_TOKEN_PATTERN.findall(content))
+        self.content_lower = content.lower()
+        keywords = get_keyword_matcher()
+        self.boilerplate_hits = keywords.count(keywords.scan(self.content_lower), 'segment_boilerplate')
+        # Too short, or more than one boilerplate phrase
+        self.is_boilerplate = self.word_count < 20 or self.boilerplate_hits > 1
+
+    @property
+    def is_executive(self) -> bool:
+        return self.speaker_type == 'executive'
+
+    @property
+    def is_analyst(self) -> bool:
+        return self.speaker_type == 'analyst'
+
+    def to_dict(self) -> Dict:
+        """Plain dict for JSON responses and caches"""
+        return {key: getattr(self, key) for key in self.DICT_KEYS}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Segment':
+        return cls(data['speaker'], data['content'], data['speaker_type'], data.get('word_count'))
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.DICT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.DICT_KEYS else default
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Segment):
+            return NotImplemented
+        return (self.speaker, self.content, self.speaker_type, self.word_count) == \
+               (other.speaker, other.content, other.speaker_type, other.word_count)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Segment({self.speaker!r}, {self.speaker_type}, {self.word_count} words)"
+
+
+def serialize_parsed(parsed: Dict) -> Dict:
+    """Copy of a parse result with Segment records and the Q&A index turned into plain dicts"""
+    serialized = {
+        **parsed,
+        'management_remarks': [segment.to_dict() for segment in parsed['management_remarks']],
+        'qa_session': [segment.to_dict() for segment in parsed['qa_session']]
+    }
+    if parsed.get('qa_exchanges') is not None:
+        serialized['qa_exchanges'] = parsed['qa_exchanges'].to_dict()
+    return serialized
+
+
+def deserialize_parsed(parsed: Dict) -> Dict:
+    """Inverse of serialize_parsed; the Q&A index is rebuilt for entries stored without one"""
+    qa_session = [Segment.from_dict(segment) for segment in parsed['qa_session']]
+    return {
+        **parsed,
+        'management_remarks': [Segment.from_dict(segment) for segment in parsed['management_remarks']],
+        'qa_session': qa_session,
+        'qa_exchanges': QAIndex.from_dict(parsed['qa_exchanges']) if parsed.get('qa_exchanges')
+                        else QAIndex(qa_session)
+    }
+
+
+class Exchange:
+    """One analyst question and the executive answers that follow it, as positions in qa_session"""
+
+    __slots__ = ('questions', 'answers', 'analyst_id', 'executive_ids')
+
+    def __init__(self, questions: List[int], answers: List[int], analyst_id: int, executive_ids: List[int]):
+        self.questions = questions  # a question split over consecutive analyst segments has several
+        self.answers = answers
+        self.analyst_id = analyst_id
+        self.executive_ids = executive_ids
+
+    def to_dict(self) -> Dict:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"Exchange(questions={self.questions}, answers={self.answers})"
+
+
+class QAIndex:
+    """Q&A exchanges of one transcript: analyst question -> the executive answers that follow
+
+    Built in a single pass over qa_session. Speakers are interned, and
+    every executive segment's position is listed in order, so "the first N
+    answers" is a slice and a segment's exchange is an array lookup.
+    Executive segments before the first question are answers without an
+    exchange; segments of other speakers belong to no exchange.
+    """
+
+    __slots__ = ('speakers', 'speaker_ids', 'exchanges', 'answers', 'exchange_ids')
+
+    def __init__(self, qa_session: Sequence = ()):
+        self.speakers: List[str] = []
+        self.speaker_ids = array('l')
+        self.exchanges: List[Exchange] = []
+        self.answers: List[int] = []
+        self.exchange_ids = array('l')  # per segment, -1 when not part of an exchange
+
+        lookup: Dict[str, int] = {}
+        current = None
+        for position, segment in enumerate(qa_session):
+            speaker_id = lookup.get(segment.speaker)
+            if speaker_id is None:
+                speaker_id = lookup[segment.speaker] = len(self.speakers)
+                self.speakers.append(segment.speaker)
+            self.speaker_ids.append(speaker_id)
+
+            if segment.speaker_type == 'analyst':
+                if current is None or current.answers:
+                    current = Exchange([], [], speaker_id, [])
+                    self.exchanges.append(current)
+                current.questions.append(position)
+            elif segment.speaker_type == 'executive':
+                self.answers.append(position)
+                if current is not None:
+                    current.answers.append(position)
+                    if speaker_id not in current.executive_ids:
+                        current.executive_ids.append(speaker_id)
+            else:
+                self.exchange_ids.append(-1)
+                continue
+            self.exchange_ids.append(len(self.exchanges) - 1 if current is not None else -1)
+
+    def exchange_of(self, position: int) -> Optional[Exchange]:
+        """The exchange a qa_session segment belongs to"""
+        exchange_id = self.exchange_ids[position]
+        return self.exchanges[exchange_id] if exchange_id >= 0 else None
+
+    def speaker(self, speaker_id: int) -> str:
+        return self.speakers[speaker_id]
+
+    def to_dict(self) -> Dict:
+        return {
+            'speakers': self.speakers,
+            'speaker_ids': self.speaker_ids.tolist(),
+            'exchanges': [exchange.to_dict() for exchange in self.exchanges],
+            'answers': self.answers,
+            'exchange_ids': self.exchange_ids.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'QAIndex':
+        index = cls()
+        index.speakers = list(data['speakers'])
+        index.speaker_ids = array('l', data['speaker_ids'])
+        index.exchanges = [Exchange(**exchange) for exchange in data['exchanges']]
+        index.answers = list(data['answers'])
+        index.exchange_ids = array('l', data['exchange_ids'])
+        return index
+
+    def __len__(self) -> int:
+        return len(self.exchanges)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, QAIndex):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"QAIndex({len(self.exchanges)} exchanges, {len(self.answers)} answers)"
+
+
+class SegmentSpan:
+    """Lightweight view of one segment; content is sliced and cleaned only when read"""
+
+    __slots__ = ('transcript', 'index')
+
+    def __init__(self, transcript: 'SegmentedTranscript', index: int):
+        self.transcript = transcript
+        self.index = index
+
+    @property
+    def start(self) -> int:
+        return self.transcript.starts[self.index]
+
+    @property
+    def end(self) -> int:
+        return self.transcript.ends[self.index]
+
+    @property
+    def speaker(self) -> str:
+        return self.transcript.speakers[self.transcript.speaker_ids[self.index]]
+
+    @property
+    def section(self) -> str:
+        return SECTIONS[self.transcript.sections[self.index]]
+
+    @property
+    def speaker_type(self) -> str:
+        return SPEAKER_TYPES[self.transcript.types[self.index]]
+
+    @property
+    def content(self) -> str:
+        return self.transcript.content(self.index)
+
+    def __repr__(self) -> str:
+        return f"SegmentSpan({self.start}, {self.end}, {self.speaker!r}, {self.section}, {self.speaker_type})"
+
+
+class SegmentedTranscript:
+    """A transcript as (start, end, speaker_id, section, type) spans over a single text buffer
+
+    Spans live in parallel typed arrays and speakers are interned, so the
+    per-segment cost is a few machine words regardless of segment length.
+    When clean_on_read is set, the span covers uncleaned segment text and
+    the per-segment cleanup the dict parser applies is run on the slice when
+    content is requested; nothing is cached. Spans added with append() hold
+    text that is already final and are read back verbatim.
+    """
+
+    __slots__ = ('text', 'clean_on_read', 'quarter', 'year', 'title', 'url', 'normalization', 'section_split',
+                 'speakers', '_speaker_lookup', 'starts', 'ends', 'speaker_ids', 'sections', 'types', 'verbatim')
+
+    def __init__(self, text: str, clean_on_read: bool = True, quarter: Optional[int] = None,
+                 year: Optional[int] = None, title: Optional[str] = None, url: Optional[str] = None):
+        self.text = text
+        self.clean_on_read = clean_on_read
+        self.quarter = quarter
+        self.year = year
+        self.title = title
+        self.url = url
+        self.normalization: Dict[str, int] = {}
+        # How the sections were found, as in TranscriptParser.parse's result
+        self.section_split: Optional[str] = None
+        self.speakers: List[str] = []
+        self._speaker_lookup: Dict[str, int] = {}
+        self.starts = array('l')
+        self.ends = array('l')
+        self.speaker_ids = array('l')
+        self.sections = array('b')
+        self.types = array('b')
+        self.verbatim = array('b')
+
+    def add(self, start: int, end: int, speaker: str, section: str, speaker_type: str,
+            verbatim: bool = False) -> int:
+        speaker_id = self._speaker_lookup.get(speaker)
+        if speaker_id is None:
+            speaker_id = self._speaker_lookup[speaker] = len(self.speakers)
+            self.speakers.append(speaker)
+
+        self.starts.append(start)
+        self.ends.append(end)
+        self.speaker_ids.append(speaker_id)
+        self.sections.append(SECTIONS.index(section))
+        self.types.append(SPEAKER_TYPES.index(speaker_type))
+        self.verbatim.append(verbatim)
+        return len(self.starts) - 1
+
+    def append(self, content: str, speaker: str, section: str, speaker_type: str) -> int:
+        """Add final content that is not a slice of the buffer, as a span over a copy at its end"""
+        start = len(self.text) + 1
+        self.text = f"{self.text}\n{content}"
+        return self.add(start, len(self.text), speaker, section, speaker_type, verbatim=True)
+
+    def content(self, index: int) -> str:
+        """Materialize one segment's text"""
+        text = self.text[self.starts[index]:self.ends[index]]
+        if self.clean_on_read and not self.verbatim[index]:
+            text = SEGMENT_CONTENT.normalize(text.strip())
+        return text
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> SegmentSpan:
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        return SegmentSpan(self, index % len(self))
+
+    def __iter__(self) -> Iterator[SegmentSpan]:
+        return (SegmentSpan(self, i) for i in range(len(self)))
+
+    def section(self, name: str) -> Iterator[SegmentSpan]:
+        code = SECTIONS.index(name)
+        return (SegmentSpan(self, i) for i in range(len(self)) if self.sections[i] == code)
+
+    def to_parsed(self) -> Dict:
+        """Materialize into the dict shape returned by TranscriptParser.parse"""
+        segments = {name: [] for name in SECTIONS}
+        for span in self:
+            segments[span.section].append(Segment(span.speaker, span.content, span.speaker_type))
+
+        return {
+            'quarter': self.quarter,
+            'year': self.year,
+            'title': self.title,
+            'url': self.url,
+            'management_remarks': segments['prepared_remarks'],
+            'qa_session': segments['qa'],
+            'total_segments': len(self),
+            'normalization': self.normalization,
+            'qa_exchanges': QAIndex(segments['qa']),
+            'section_split': self.section_split
+        }
@@ -2,9 +2,16 @@
 Lightweight FinBERT Sentiment Analysis
 """
 import logging
-from typing import List, Dict
+from itertools import islice
+from typing import List, Dict, Optional, Tuple
 import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from transformers import AutoTokenizer
+
+from services.inference_backends import BACKENDS, get_inference_backend
+from services.keyword_matcher import get_keyword_matcher
+from services.segments import QAIndex, Segment
+from services.sentiment_cache import SentimentCache
+from services.text_normalizer import SENTIMENT_TEXT
 
 logging.basicConfig(level=logging.INFO)
 
@@ -12,205 +19,314 @@ logging.basicConfig(level=logging.INFO)
 class SentimentAnalyzer:
     """FinBERT-based sentiment analysis for financial text"""
     
-    def __init__(self):
+    MAX_LENGTH = 512
+    # Tokens shared by consecutive windows in full coverage
+    WINDOW_OVERLAP = 64
+    # FinBERT labels, in logit order
+    LABELS = ('positive', 'negative', 'neutral')
+    COVERAGE_MODES = ('sample', 'full')
+    
+    MODEL_NAME = "ProsusAI/finbert"
+    
+    def __init__(self, batch_size: int = 16, coverage: str = 'sample', backend: Optional[str] = None,
+                 model_cache_dir: Optional[str] = None, cache_dir: Optional[str] = None):
+        """coverage='sample' scores the first three selected segments of a section as one
+        text truncated to MAX_LENGTH; 'full' scores every selected segment in windows.
+        backend is 'fp32' (default), 'int8' or 'onnx', see services/inference_backends.py.
+        cache_dir keeps every text's probabilities so it is only scored once per model"""
+        if coverage not in self.COVERAGE_MODES:
+            raise ValueError(f"Unknown sentiment coverage {coverage!r}, expected one of {self.COVERAGE_MODES}")
+        if backend and backend not in BACKENDS:
+            raise ValueError(f"Unknown sentiment backend {backend!r}, expected one of {tuple(BACKENDS)}")
         self.logger = logging.getLogger(__name__)
+        self.batch_size = batch_size
+        self.coverage = coverage
+        self.backend = backend
+        self.model_cache_dir = model_cache_dir
+        self.cache_dir = cache_dir
         self.model = None
         self.tokenizer = None
+        self.cache = None
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         self._load_models()
     
     def _load_models(self):
-        """Load FinBERT model"""
+        """Load the FinBERT tokenizer and the model under the configured inference backend"""
         try:
             # Load FinBERT for both management and Q&A sentiment
-            self.logger.info("Loading FinBERT model...")
-            model_name = "ProsusAI/finbert"
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
-            self.model.to(self.device)
-            self.model.eval()
-            self.logger.info("FinBERT model loaded successfully")
+            self.logger.info(f"Loading FinBERT model ({self.backend or 'fp32'})...")
+            self.tokenizer = AutoTokenizer.from_pretrained(self.MODEL_NAME, use_fast=True)
+            self.model = get_inference_backend(self.backend, self.MODEL_NAME, self.model_cache_dir,
+                                               str(self.device))
+            self.logger.info(f"FinBERT model loaded successfully ({self.model.name} backend)")
+            if self.cache_dir:
+                self.cache = SentimentCache(self.cache_dir, self.fingerprint)
             
         except Exception as e:
             self.logger.error(f"Error loading model: {e}")
             # Fallback to mock sentiment
             self.model = None
     
-    def analyze_management(self, segments: List[Dict]) -> Dict:
+    @property
+    def fingerprint(self) -> str:
+        """The loaded model and the windowing its results depend on"""
+        return f"{self.model.fingerprint}:{self.MAX_LENGTH}:{self.WINDOW_OVERLAP}"
+    
+    def analyze_management(self, segments: List[Segment]) -> Dict:
         """Analyze sentiment of management remarks"""
+        return self._analyze_sections([(self._management_segments(segments), segments)], ["Management Remarks"])[0]
+    
+    def analyze_qa(self, segments: List[Segment], qa_index: Optional[QAIndex] = None) -> Dict:
+        """Analyze sentiment of Q&A session using FinBERT"""
+        return self._analyze_sections([(self._qa_segments(segments, qa_index), segments)],
+                                      ["Q&A Session (FinBERT)"])[0]
+    
+    def analyze_transcripts(self, transcripts: List[Dict]) -> List[Tuple[Dict, Dict]]:
+        """(management, Q&A) sentiment for each parsed transcript, all scored in one batched run"""
+        sections, names = [], []
+        for parsed in transcripts:
+            label = f"Q{parsed.get('quarter')} {parsed.get('year')}"
+            sections.append((self._management_segments(parsed['management_remarks']), parsed['management_remarks']))
+            sections.append((self._qa_segments(parsed['qa_session'], parsed.get('qa_exchanges')), parsed['qa_session']))
+            names += [f"{label} Management Remarks", f"{label} Q&A Session"]
+        
+        results = self._analyze_sections(sections, names)
+        return list(zip(results[0::2], results[1::2]))
+    
+    def _management_segments(self, segments: List[Segment]) -> List[Segment]:
+        """Meaningful management remarks: the first three, or all of them in full coverage"""
         if not segments:
-            return {'sentiment': 'neutral', 'confidence': 0.0}
+            return []
         
         # Filter out segments that are too short or likely boilerplate
         meaningful_segments = [
             seg for seg in segments 
-            if seg['word_count'] > 50 and 
-            not self._is_boilerplate(seg['content'])
+            if seg.word_count > 50 and not seg.is_boilerplate
         ]
         
         if not meaningful_segments:
             # Fallback to original segments if filtering removed everything
             meaningful_segments = segments[:3]
         
-        # Combine meaningful management remarks (limit to avoid token overflow)
-        combined_text = ' '.join([seg['content'] for seg in meaningful_segments[:3]])
-        
-        # Further clean the text
-        combined_text = self._clean_for_sentiment(combined_text)
-        
-        return self._analyze_text(combined_text, "Management Remarks")
+        # Sampling combines three remarks to stay near the token limit
+        return meaningful_segments if self.coverage == 'full' else meaningful_segments[:3]
     
-    def analyze_qa(self, segments: List[Dict]) -> Dict:
-        """Analyze sentiment of Q&A session using FinBERT"""
+    def _qa_segments(self, segments: List[Segment], qa_index: Optional[QAIndex] = None) -> List[Segment]:
+        """Substantial executive answers: the first three, or all of them in full coverage"""
         if not segments:
-            return {'sentiment': 'neutral', 'confidence': 0.0}
+            return []
+        limit = None if self.coverage == 'full' else 3
         
-        # Focus on substantial executive responses
-        executive_responses = [
-            seg for seg in segments 
-            if seg.get('speaker_type') == 'executive' and 
-            seg['word_count'] > 30 and
-            not self._is_boilerplate(seg['content'])
-        ]
+        # Focus on substantial executive responses; the parser's exchange
+        # index lists them, so sampling stops after the first three
+        answers = (segments[i] for i in qa_index.answers) if qa_index is not None else \
+                  (seg for seg in segments if seg.is_executive)
+        executive_responses = list(islice(
+            (seg for seg in answers if seg.word_count > 30 and not seg.is_boilerplate), limit))
         
         if not executive_responses:
             # Fallback to any responses if no executive ones found
-            executive_responses = [seg for seg in segments if seg['word_count'] > 30][:3]
-        
-        if not executive_responses:
-            return {'sentiment': 'neutral', 'confidence': 0.0}
-        
-        # Combine meaningful Q&A responses (limit to avoid token overflow)
-        combined_text = ' '.join([seg['content'] for seg in executive_responses[:3]])
+            executive_responses = [seg for seg in segments if seg.word_count > 30][:limit]
         
-        # Clean the text
-        combined_text = self._clean_for_sentiment(combined_text)
-        
-        return self._analyze_qa_text(combined_text)
+        return executive_responses
     
     def _is_boilerplate(self, text: str) -> bool:
-        """Check if text is likely boilerplate/metadata rather than meaningful content"""
-        text_lower = text.lower()
-        boilerplate_indicators = [
-            'the motley fool',
-            'earnings call',
-            'conference operator',
-            'good afternoon',
-            'welcome everyone',
-            'my name is',
-            'operator',
-            'image source'
-        ]
-        
+        """Check if text is likely boilerplate/metadata rather than meaningful content
+
+        Parsed segments carry this as Segment.is_boilerplate; this is for other text.
+        """
         # If text is too short or contains too many boilerplate indicators
         if len(text.split()) < 20:
             return True
             
-        boilerplate_count = sum(1 for indicator in boilerplate_indicators if indicator in text_lower)
-        return boilerplate_count > 1
+        keywords = get_keyword_matcher()
+        return keywords.count(keywords.scan(text), 'segment_boilerplate') > 1
     
     def _clean_for_sentiment(self, text: str) -> str:
-        """Clean text specifically for sentiment analysis"""
-        # Remove remaining metadata patterns
-        import re
-        
-        # Remove patterns that don't contribute to sentiment
-        patterns_to_remove = [
-            r'\([A-Z]{2,5}\s*[+-]?\d*\.?\d*%?\)',  # Stock symbols and changes
-            r'Q\d+\s+\d{4}',  # Quarter references
-            r'\b\d{1,2}:\d{2}\s*[ap]\.?m\.?\b',  # Times
-            r'\b[A-Z][a-z]+\s+\d{1,2},\s+\d{4}\b',  # Dates
-        ]
-        
-        for pattern in patterns_to_remove:
-            text = re.sub(pattern, ' ', text, flags=re.IGNORECASE)
+        """Clean text specifically for sentiment analysis: tickers, quarters, times, dates, whitespace"""
+        fired = {}
+        text = SENTIMENT_TEXT.normalize(text, fired)
+        if fired:
+            self.logger.debug(f"Sentiment normalization rules fired: {fired}")
+        return text
+    
+    def _analyze_sections(self, sections: List[Tuple[List[Segment], List[Segment]]], names: List[str]) -> List[Dict]:
+        """Sentiment per (selected segments, all section segments), scored together
         
-        # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        Every result carries 'coverage', the share of the section's tokens
+        that reached the model.
+        """
+        if self.coverage == 'full':
+            results = self._analyze_windows([selected for selected, _ in sections])
+            covered = [sum(self._count_tokens([self._clean_for_sentiment(seg.content) for seg in selected]))
+                       for selected, _ in sections]
+        else:
+            # Sampling: the selected segments joined and truncated to MAX_LENGTH
+            texts = [self._clean_for_sentiment(' '.join(seg.content for seg in selected)) if selected else None
+                     for selected, _ in sections]
+            scored = iter(self.analyze_segments([text for text in texts if text is not None]))
+            results = [next(scored) if text is not None else None for text in texts]
+            covered = [min(count, self.MAX_LENGTH - 2) for count in self._count_tokens([text or '' for text in texts])]
         
-        return text
+        section_results = []
+        for result, tokens, (_, segments), name in zip(results, covered, sections, names):
+            if result is None:
+                section_results.append({'sentiment': 'neutral', 'confidence': 0.0, 'coverage': 0.0})
+                continue
+            total = sum(self._count_tokens([self._clean_for_sentiment(seg.content) for seg in segments]))
+            result = {**result, 'coverage': min(1.0, tokens / total) if total else 0.0}
+            self.logger.info(f"{name} sentiment: {result['sentiment']} (confidence: {result['confidence']:.2f}, "
+                             f"coverage: {result['coverage']:.0%})")
+            section_results.append(result)
+        return section_results
     
-    def _analyze_text(self, text: str, section_name: str) -> Dict:
-        """Analyze sentiment of text using FinBERT"""
+    def _count_tokens(self, texts: List[str]) -> List[int]:
+        """Model tokens per text, without special tokens or truncation; words when no tokenizer is loaded"""
+        if not texts:
+            return []
+        if not self.tokenizer:
+            return [len(text.split()) for text in texts]
+        return [len(ids) for ids in self.tokenizer(texts, add_special_tokens=False)['input_ids']]
+    
+    def analyze_segments(self, texts: List[str]) -> List[Dict]:
+        """Sentiment of every text, in input order, from as few forward passes as possible
+        
+        Texts found in the sentiment cache are not scored again; the rest
+        are tokenized in one call (truncated to MAX_LENGTH), each distinct
+        text once, and scored in length-sorted batches.
+        """
+        if not texts:
+            return []
         if not self.model:
             # Fallback mock sentiment
-            return self._mock_sentiment(text)
+            return [self._mock_sentiment(text) for text in texts]
         
         try:
-            # Truncate text to model's max length
-            max_length = 512
-            inputs = self.tokenizer(text, return_tensors="pt", truncation=True, 
-                                  max_length=max_length, padding=True)
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-                
-            # FinBERT labels: [positive, negative, neutral]
-            probs = predictions[0].cpu().numpy()
-            sentiment_labels = ['positive', 'negative', 'neutral']
-            max_idx = probs.argmax()
-            
-            sentiment = sentiment_labels[max_idx]
-            confidence = float(probs[max_idx])
-            
-            self.logger.info(f"{section_name} sentiment: {sentiment} (confidence: {confidence:.2f})")
-            
-            return {
-                'sentiment': sentiment,
-                'confidence': confidence,
-                'scores': {
-                    'positive': float(probs[0]),
-                    'negative': float(probs[1]),
-                    'neutral': float(probs[2])
-                }
-            }
+            probabilities = self._cached('truncated', texts)
+            misses = list(dict.fromkeys(text for text, probs in zip(texts, probabilities) if probs is None))
+            if misses:
+                encodings = self.tokenizer(misses, truncation=True, max_length=self.MAX_LENGTH)
+                features = [{key: values[i] for key, values in encodings.items()} for i in range(len(misses))]
+                scored = self._score(features)
+                self._store('truncated', misses, scored)
+                scored = dict(zip(misses, scored))
+                probabilities = [probs if probs is not None else scored[text] for text, probs in zip(texts, probabilities)]
+            return [self._sentiment_from_probs(probs) for probs in probabilities]
             
         except Exception as e:
             self.logger.error(f"Error in sentiment analysis: {e}")
-            return self._mock_sentiment(text)
+            return [self._mock_sentiment(text) for text in texts]
     
-    def _analyze_qa_text(self, text: str) -> Dict:
-        """Analyze Q&A sentiment using FinBERT"""
-        if not self.model:
-            # Fallback mock sentiment
-            return self._mock_sentiment(text)
+    def _analyze_windows(self, sections: List[List[Segment]]) -> List[Optional[Dict]]:
+        """Full coverage: every segment split into overlapping MAX_LENGTH windows, all scored in one run
+        
+        A section's probabilities are the mean over its windows weighted by
+        each window's token count. None for sections without segments.
+        """
+        texts, owners = [], []
+        for section_id, selected in enumerate(sections):
+            for seg in selected:
+                texts.append(self._clean_for_sentiment(seg.content))
+                owners.append(section_id)
+        if not texts:
+            return [None] * len(sections)
         
         try:
-            # Truncate text to model's max length
-            max_length = 512
-            inputs = self.tokenizer(text, return_tensors="pt", truncation=True, 
-                                   max_length=max_length, padding=True)
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-                
-            # FinBERT labels: [positive, negative, neutral]
-            probs = predictions[0].cpu().numpy()
-            sentiment_labels = ['positive', 'negative', 'neutral']
-            max_idx = probs.argmax()
-            
-            sentiment = sentiment_labels[max_idx]
-            confidence = float(probs[max_idx])
-            
-            self.logger.info(f"Q&A Session sentiment (FinBERT): {sentiment} (confidence: {confidence:.2f})")
-            
-            return {
-                'sentiment': sentiment,
-                'confidence': confidence,
-                'scores': {
-                    'positive': float(probs[0]),
-                    'negative': float(probs[1]),
-                    'neutral': float(probs[2])
-                }
-            }
-            
+            if not self.model:
+                raise RuntimeError("FinBERT model not loaded")
+            windows = self._score_windows(texts)
         except Exception as e:
-            self.logger.error(f"Error in Q&A sentiment analysis: {e}")
-            return self._mock_sentiment(text)
+            if self.model:
+                self.logger.error(f"Error in windowed sentiment analysis: {e}")
+            # Mock sentiment per segment, weighted by words
+            mocks = [self._mock_sentiment(text) for text in texts]
+            windows = [[(len(text.split()), [mock['scores'][label] for label in self.LABELS])]
+                       for text, mock in zip(texts, mocks)]
+        
+        sums = [[0.0] * len(self.LABELS) for _ in sections]
+        totals = [0] * len(sections)
+        for section_id, text_windows in zip(owners, windows):
+            for weight, probs in text_windows:
+                totals[section_id] += weight
+                for label, prob in enumerate(probs):
+                    sums[section_id][label] += weight * prob
+        
+        results = []
+        for section_sums, total, selected in zip(sums, totals, sections):
+            if not selected:
+                results.append(None)
+                continue
+            results.append(self._sentiment_from_probs([value / total if total else 0.0 for value in section_sums]))
+        return results
+    
+    def _score_windows(self, texts: List[str]) -> List[List[Tuple[int, List[float]]]]:
+        """(tokens, label probabilities) of every overlapping MAX_LENGTH window of each text
+        
+        Texts found in the sentiment cache are not tokenized again; the rest
+        are split in one tokenizer call, each distinct text once.
+        """
+        windows = self._cached('windows', texts)
+        misses = list(dict.fromkeys(text for text, text_windows in zip(texts, windows) if text_windows is None))
+        if misses:
+            encodings = self.tokenizer(misses, truncation=True, max_length=self.MAX_LENGTH,
+                                       stride=self.WINDOW_OVERLAP, return_overflowing_tokens=True)
+            window_texts = encodings.pop('overflow_to_sample_mapping')
+            features = [{key: values[i] for key, values in encodings.items()} for i in range(len(window_texts))]
+            special_tokens = self.tokenizer.num_special_tokens_to_add()
+            scored = [[] for _ in misses]
+            for text_id, feature, probs in zip(window_texts, features, self._score(features)):
+                scored[text_id].append((sum(feature['attention_mask']) - special_tokens, probs))
+            self._store('windows', misses, scored)
+            scored = dict(zip(misses, scored))
+            windows = [text_windows if text_windows is not None else scored[text]
+                       for text, text_windows in zip(texts, windows)]
+        self.logger.info(f"Scored {len(texts)} segments ({len(texts) - len(misses)} cached or repeated)")
+        return windows
+    
+    def _cached(self, kind: str, texts: List[str]) -> List[Optional[List]]:
+        return self.cache.get_many(kind, texts) if self.cache else [None] * len(texts)
+    
+    def _store(self, kind: str, texts: List[str], values: List[List]) -> None:
+        if self.cache:
+            self.cache.set_many(kind, texts, values)
+    
+    def _score(self, features: List[Dict]) -> List[List[float]]:
+        """Label probabilities per tokenized input, in input order
+        
+        Inputs are sorted by length and cut into batches of batch_size, each
+        padded only to its own longest member, so short answers are not
+        padded to the length of long remarks.
+        """
+        order = sorted(range(len(features)), key=lambda i: len(features[i]['input_ids']))
+        probabilities: List[Optional[List[float]]] = [None] * len(features)
+        with torch.inference_mode():
+            for start in range(0, len(order), self.batch_size):
+                batch = order[start:start + self.batch_size]
+                inputs = self.tokenizer.pad([features[i] for i in batch], return_tensors="pt")
+                batch_probs = torch.softmax(self.model.logits(dict(inputs)), dim=-1).cpu().tolist()
+                for i, probs in zip(batch, batch_probs):
+                    probabilities[i] = probs
+        
+        self.logger.info(f"Ran {len(features)} inputs in {(len(features) + self.batch_size - 1) // self.batch_size} batches")
+        return probabilities
+    
+    def _sentiment_from_probs(self, probs: List[float]) -> Dict:
+        max_idx = max(range(len(probs)), key=probs.__getitem__)
+        return {
+            'sentiment': self.LABELS[max_idx],
+            'confidence': float(probs[max_idx]),
+            'scores': {label: float(prob) for label, prob in zip(self.LABELS, probs)}
+        }
+    
+    def _analyze_text(self, text: str, section_name: str) -> Dict:
+        """Analyze sentiment of text using FinBERT"""
+        result = self.analyze_segments([text])[0]
+        self.logger.info(f"{section_name} sentiment: {result['sentiment']} (confidence: {result['confidence']:.2f})")
+        return result
+    
+    def _analyze_qa_text(self, text: str) -> Dict:
+        """Analyze Q&A sentiment using FinBERT"""
+        return self._analyze_text(text, "Q&A Session (FinBERT)")
     
     def _mock_sentiment(self, text: str) -> Dict:
         """Fallback mock sentiment based on keywords"""
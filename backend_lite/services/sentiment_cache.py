@@ -0,0 +1,57 @@
+"""
+Persistent cache of FinBERT probabilities keyed by text hash and model fingerprint
+"""
+import hashlib
+import logging
+from typing import Dict, List, Optional, Sequence
+import diskcache as dc
+
+logging.basicConfig(level=logging.INFO)
+
+
+class SentimentCache:
+    """Per-text inference results, so re-analysis only runs the model on text it has not seen
+
+    Entries are keyed by the sha256 of the cleaned text plus the analyzer's
+    fingerprint (model name, revision, backend and windowing), so boilerplate
+    repeated across quarters or transcripts re-parsed after a parser change
+    cost a lookup. kind separates results of the same text scored
+    differently ('truncated' probability vectors, 'windows' lists of
+    (tokens, probabilities)).
+    """
+
+    def __init__(self, directory: str, fingerprint: str):
+        self.logger = logging.getLogger(__name__)
+        self.cache = dc.Cache(directory)
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def key(self, kind: str, text: str) -> str:
+        return f'sentiment:{kind}:{self.fingerprint}:{self.text_hash(text)}'
+
+    def get_many(self, kind: str, texts: Sequence[str]) -> List[Optional[List]]:
+        """Stored result per text, None for misses"""
+        results = [self.cache.get(self.key(kind, text)) for text in texts]
+        misses = results.count(None)
+        self.hits += len(results) - misses
+        self.misses += misses
+        return results
+
+    def set_many(self, kind: str, texts: Sequence[str], values: Sequence[List]) -> None:
+        with self.cache.transact():
+            for text, value in zip(texts, values):
+                self.cache.set(self.key(kind, text), value)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'fingerprint': self.fingerprint,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,120 @@
+"""
+Precompiled text normalization shared by the scraper, parser and sentiment analyzer
+"""
+import re
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+class Rule(NamedTuple):
+    """One substitution: matches of pattern are replaced with the literal replacement
+
+    guard lists lowercase strings of which every match contains at least one;
+    the rule is skipped for texts that contain none of them.
+    """
+    name: str
+    pattern: str
+    replacement: str = ''
+    flags: int = 0
+    guard: Tuple[str, ...] = ()
+
+
+class TextNormalizer:
+    """Ordered substitution rules compiled once and applied in a single call per text
+
+    Rules run in order, each as one C-level subn, so the output is exactly
+    that of the equivalent chain of re.sub calls. Guarded rules whose
+    literals do not occur in the (lowercased) text are skipped without a
+    scan. Every match is counted per rule name.
+
+    Fusing rules into one alternation was measured and is no faster with
+    Python's backtracking re engine: each position still tries every branch.
+    """
+
+    def __init__(self, rules: Sequence[Rule], strip: bool = False):
+        self.rules = list(rules)
+        self.strip = strip
+        self._compiled = [(rule, re.compile(rule.pattern, rule.flags), rule.replacement.replace('\\', '\\\\'))
+                          for rule in self.rules]
+
+    def normalize(self, text: str, fired: Optional[Dict[str, int]] = None) -> str:
+        """Apply every rule in order, adding per-rule match counts to fired"""
+        lowered = None
+        for rule, regex, replacement in self._compiled:
+            if rule.guard:
+                if lowered is None:
+                    lowered = text.lower()
+                if not any(literal in lowered for literal in rule.guard):
+                    continue
+
+            text, count = regex.subn(replacement, text)
+            if count:
+                # A rewrite can create a guard literal, so re-check against the new text
+                lowered = None
+                if fired is not None:
+                    fired[rule.name] = fired.get(rule.name, 0) + count
+
+        return text.strip() if self.strip else text
+
+
+# Whitespace runs that are not already a single space; collapsing them to ' '
+# gives the same text as replacing every run, without matching between words
+SPACE_TAB_RUN = r'\t[ \t]*| [ \t]+'
+WHITESPACE_RUN = r'\s{2,}|[^\S ]'
+
+# "Month D, YYYY" anywhere in a word run. A match always starts where the
+# letter run starts, so the lookbehind, and a lookahead that stops the run from
+# giving back letters, skip the quadratic backtracking of the original
+# [A-Z][a-z]+ without changing what matches. (No possessive quantifiers: the
+# image runs Python 3.10.)
+RUN_DATE = r'(?<![A-Z])[A-Z][a-z]+(?![a-z])\s+\d{1,2},\s+\d{4}'
+
+# "\b\d{1,2}:..." with the digit first, so re can skip ahead to digits
+# instead of testing a word boundary at every position
+CLOCK_TIME = r'\d(?<!\w\d)\d?:\d{2}\s*[ap]\.?m\.?\b'
+
+# Scraper: article text after get_text(separator='\n', strip=True)
+SCRAPED_TEXT = TextNormalizer([
+    Rule('blank_lines', r'\n{3,}', '\n\n', guard=('\n\n\n',)),
+    Rule('space_runs', SPACE_TAB_RUN, ' ', guard=('\t', '  ')),
+])
+
+# Parser: whole transcript before sectioning
+RAW_TEXT = TextNormalizer([
+    Rule('html_tags', r'<[^>]+>', guard=('<',)),
+    Rule('image_source', r'Image\s+source:?[^\n]*', flags=re.IGNORECASE, guard=('image',)),
+    Rule('advertisement', r'Advertisement[^\n]*', flags=re.IGNORECASE, guard=('advertisement',)),
+    Rule('blank_lines', r'\n\s*\n\s*\n+', '\n\n'),
+    Rule('line_edges', r'^\s+|\s+$', flags=re.MULTILINE),
+], strip=True)
+
+# Parser: prepared remarks and Q&A sections before speaker splitting
+BOILERPLATE = TextNormalizer([
+    Rule('motley_fool', r'The Motley Fool\.\s*', flags=re.IGNORECASE, guard=('motley fool',)),
+    Rule('ticker_quote', r'Nvidia\s*\(\s*NVDA\s*[+-]?\d*\.?\d*%?\s*\)', flags=re.IGNORECASE, guard=('nvda',)),
+    Rule('call_title', r'Q\d+\s+\d{4}\s+Earnings\s+Call', flags=re.IGNORECASE, guard=('earnings',)),
+    Rule('date', RUN_DATE, flags=re.IGNORECASE),
+    Rule('time', r'\d{1,2}:\d{2}\s+[ap]\.m\.\s+ET', flags=re.IGNORECASE, guard=('m.',)),
+    Rule('image_source', r'Image\s+source[^\n]*', flags=re.IGNORECASE, guard=('image',)),
+    Rule('call_participants', r'Call\s+Participants', flags=re.IGNORECASE, guard=('participants',)),
+    Rule('prepared_remarks', r'Prepared\s+Remarks', flags=re.IGNORECASE, guard=('remarks',)),
+    Rule('questions_and_answers', r'Questions\s+and\s+Answers', flags=re.IGNORECASE, guard=('answers',)),
+    Rule('operator_greeting', r'Operator\s*Good\s+afternoon\.[^.]*conference\s+operator[^.]*\.',
+         flags=re.IGNORECASE, guard=('afternoon.',)),
+], strip=True)
+
+# Parser: one speaker segment's content
+SEGMENT_CONTENT = TextNormalizer([
+    Rule('title_line', r'^[A-Z][a-z\s,]+(?:Director|Officer|President|CEO|CFO)[^\n]*\n', flags=re.MULTILINE,
+         guard=('director', 'officer', 'president', 'ceo', 'cfo')),
+    Rule('thanks_prefix', r'^Thanks?,?\s+[A-Z][a-z]+\.\s*', flags=re.MULTILINE, guard=('thank',)),
+    Rule('comma_line', r'^\s*[\w\s]+,\s+[\w\s]+\s*\n', flags=re.MULTILINE, guard=(',',)),
+    Rule('blank_lines', r'\n\s*\n\s*\n+', '\n\n'),
+], strip=True)
+
+# Sentiment analyzer: combined segment text before tokenization
+SENTIMENT_TEXT = TextNormalizer([
+    Rule('ticker_quote', r'\([A-Z]{2,5}\s*[+-]?\d*\.?\d*%?\)', ' ', flags=re.IGNORECASE, guard=('(',)),
+    Rule('quarter', r'Q\d+\s+\d{4}', ' ', flags=re.IGNORECASE),
+    Rule('time', CLOCK_TIME, ' ', flags=re.IGNORECASE, guard=(':',)),
+    Rule('date', r'\b[A-Z][a-z]+(?![a-z])\s+\d{1,2},\s+\d{4}\b', ' ', flags=re.IGNORECASE),
+    Rule('whitespace', WHITESPACE_RUN, ' '),
+], strip=True)
@@ -168,7 +168,14 @@ class ToneAnalyzer:
                 self.logger.info(f"Extracted management text length: {len(mgmt_text)}")
             
             if 'qa_session' in transcript:
-                qa_segments = transcript['qa_session'][:5]  # First 5 Q&A exchanges
+                qa_session = transcript['qa_session']
+                qa_index = transcript.get('qa_exchanges')
+                if qa_index:
+                    # First 5 Q&A exchanges: each question with its first answer
+                    qa_segments = [qa_session[i] for exchange in qa_index.exchanges[:5]
+                                   for i in exchange.questions + exchange.answers[:1]]
+                else:
+                    qa_segments = qa_session[:5]
                 qa_text = " ".join([seg.get('content', '') for seg in qa_segments])[:1000]
                 self.logger.info(f"Extracted QA text length: {len(qa_text)}")
         else:
@@ -0,0 +1,184 @@
+"""
+Seeded synthetic earnings call transcripts for parser tests and scaling benchmarks
+"""
+import random
+from typing import Dict, List, Optional, Sequence
+
+# Formatting quirks seen in scraped transcripts; any subset can be switched on
+QUIRKS = (
+    'boilerplate',        # image credits, ads, ticker quotes, dates and times between turns
+    'split_roles',        # "Name\n-- Role" as get_text produces for a bold name and plain role
+    'heading_variants',   # "Questions & Answers:", "Prepared remarks", upper-case headings
+    'no_qa_heading',      # Q&A only recognisable from the operator's "first question" line
+    'participants',       # "Call participants:" roster after the Q&A
+    'whitespace',         # tabs, double spaces and runs of blank lines
+    'letters_only',       # long paragraphs of letters, spaces, commas and periods only
+    'single_line',        # every newline inside a turn replaced by a space
+)
+
+WORDS = (
+    'revenue growth data center demand quarter record strong customers inference training '
+    'networking gaming automotive supply margin guidance platform accelerated computing '
+    'hyperscalers enterprise sovereign capacity shipments architecture software ecosystem '
+    'we our the and of to in for with as on this that across continue expect'
+).split()
+
+FIRST_NAMES = ['Jensen', 'Colette', 'Simona', 'Stewart', 'Vivek', 'Joseph', 'Stacy', 'Timothy', 'Aaron',
+               'Harlan', 'Matthew', 'Atif', 'Christopher', 'Blayne', 'Pierre', 'Toshiya', 'Ben', 'Mark']
+LAST_NAMES = ['Huang', 'Kress', 'Jankowski', 'Stecker', 'Arya', 'Moore', 'Rasgon', 'Arcuri', 'Rakers',
+              'Sur', 'Ramsay', 'Malik', 'Muse', 'Curtis', 'Ferragu', 'Hari', 'Reitzes', 'Lipacis']
+EXECUTIVE_ROLES = ['President and Chief Executive Officer', 'Executive Vice President and Chief Financial Officer',
+                   'Vice President, Investor Relations', 'Senior Director, Investor Relations']
+FIRMS = ['Bank of America Merrill Lynch', 'Morgan Stanley', 'Bernstein Research', 'UBS', 'Wells Fargo',
+         'Goldman Sachs', 'Cantor Fitzgerald', 'Evercore ISI', 'Jefferies', 'Melius Research']
+
+
+class _Lines:
+    """Text lines with a running length, so generating 10MB stays linear"""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.length = 0
+
+    def add(self, *lines: str) -> None:
+        self.lines.extend(lines)
+        self.length += sum(len(line) + 1 for line in lines)
+
+
+class TranscriptGenerator:
+    """Builds transcript_data dicts shaped like the scraper's output, reproducibly from a seed"""
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+
+    def generate(self, target_chars: int = 50_000, executives: int = 3, analysts: int = 6,
+                 quirks: Sequence[str] = (), quarter: int = 3, year: int = 2025) -> Dict:
+        """A transcript whose full_text is about target_chars long"""
+        unknown = set(quirks) - set(QUIRKS)
+        if unknown:
+            raise ValueError(f"Unknown quirks: {sorted(unknown)}")
+
+        rng = random.Random(f"{self.seed}:{target_chars}:{executives}:{analysts}:{sorted(quirks)}")
+        people = self._people(rng, executives, analysts)
+        execs = [p for p in people if p[2] is None]
+        analyst_people = [p for p in people if p[2] is not None]
+
+        lines = _Lines()
+        lines.add(f"NVIDIA (NVDA) Q{quarter} {year} Earnings Call Transcript")
+        lines.add(self._heading(rng, 'Prepared Remarks:', quirks))
+        lines.add(*self._turn(rng, 'Operator', None, None, quirks, [
+            "Good afternoon. My name is Abby, and I will be your conference operator today. "
+            "All lines have been placed on mute to prevent any background noise."]))
+
+        # Roughly a third of the text is prepared remarks
+        while lines.length < target_chars // 3:
+            name, role, _ = rng.choice(execs)
+            lines.add(*self._turn(rng, name, role, None, quirks, self._paragraphs(rng, quirks, 2, 5)))
+            if 'boilerplate' in quirks and rng.random() < 0.3:
+                lines.add(self._boilerplate(rng, quarter, year))
+
+        if 'no_qa_heading' not in quirks:
+            lines.add(self._heading(rng, 'Questions and Answers:', quirks))
+        lines.add(*self._turn(rng, 'Operator', None, None, quirks, [
+            "Thank you. [Operator instructions] Your first question comes from "
+            f"{analyst_people[0][0]} with {analyst_people[0][2]}. Please go ahead."]))
+
+        reserve = 2_000 if 'participants' in quirks else 0
+        while lines.length < target_chars - reserve:
+            name, role, firm = rng.choice(analyst_people)
+            lines.add(*self._turn(rng, name, role, firm, quirks, self._paragraphs(rng, quirks, 1, 2, short=True)))
+            name, role, _ = rng.choice(execs)
+            lines.add(*self._turn(rng, name, role, None, quirks, self._paragraphs(rng, quirks, 1, 4)))
+            if 'boilerplate' in quirks and rng.random() < 0.2:
+                lines.add(self._boilerplate(rng, quarter, year))
+
+        if 'participants' in quirks:
+            lines.add('Call participants:')
+            for name, role, firm in people:
+                lines.add(f"{name} -- {firm} -- {role}" if firm else f"{name} -- {role}")
+
+        if 'whitespace' in quirks:
+            full_text = ''.join(line + rng.choice(('\n', '\n', '\n', '\n\n\n\n')) for line in lines.lines).rstrip('\n')
+        else:
+            full_text = '\n'.join(lines.lines)
+        return {
+            'url': f"https://www.fool.com/earnings/call-transcripts/synthetic-{self.seed}-{target_chars}/",
+            'title': lines.lines[0],
+            'full_text': full_text,
+            'quarter': quarter,
+            'year': year,
+            'turns': [],
+            # Ground truth for tests: (name, role, firm or None for executives)
+            'synthetic_speakers': people
+        }
+
+    def corpus(self, count: int, target_chars: int = 50_000, quirks: Optional[Sequence[str]] = None) -> List[Dict]:
+        """count transcripts; with quirks=None each gets a random subset of QUIRKS"""
+        rng = random.Random(self.seed)
+        transcripts = []
+        for i in range(count):
+            chosen = quirks if quirks is not None else [q for q in QUIRKS if rng.random() < 0.3]
+            transcripts.append(TranscriptGenerator(self.seed * 1000 + i).generate(
+                target_chars, executives=rng.randint(2, 4), analysts=rng.randint(3, 12), quirks=chosen,
+                quarter=i % 4 + 1, year=2020 + i // 4))
+        return transcripts
+
+    @staticmethod
+    def _people(rng: random.Random, executives: int, analysts: int) -> List[tuple]:
+        names = rng.sample([(f, l) for f in FIRST_NAMES for l in LAST_NAMES], executives + analysts)
+        people = []
+        for i, (first, last) in enumerate(names):
+            if i < executives:
+                people.append((f"{first} {last}", EXECUTIVE_ROLES[i % len(EXECUTIVE_ROLES)], None))
+            else:
+                people.append((f"{first} {last}", 'Analyst', rng.choice(FIRMS)))
+        return people
+
+    @staticmethod
+    def _heading(rng: random.Random, heading: str, quirks: Sequence[str]) -> str:
+        if 'heading_variants' not in quirks:
+            return heading
+        variants = {
+            'Prepared Remarks:': ['Prepared Remarks:', 'Prepared remarks', 'PREPARED REMARKS'],
+            'Questions and Answers:': ['Questions and Answers:', 'Questions & Answers:', 'QUESTIONS AND ANSWERS'],
+        }
+        return rng.choice(variants[heading])
+
+    @staticmethod
+    def _turn(rng: random.Random, name: str, role: Optional[str], firm: Optional[str],
+              quirks: Sequence[str], paragraphs: List[str]) -> List[str]:
+        if role is None:
+            header = name
+        else:
+            label = f"{firm} -- {role}" if firm else role
+            header = f"{name}\n-- {label}" if 'split_roles' in quirks and rng.random() < 0.5 else f"{name} -- {label}"
+        if 'single_line' in quirks:
+            return [header, ' '.join(paragraphs)]
+        return [header] + paragraphs
+
+    @staticmethod
+    def _paragraphs(rng: random.Random, quirks: Sequence[str], low: int, high: int, short: bool = False) -> List[str]:
+        paragraphs = []
+        for _ in range(rng.randint(low, high)):
+            sentences = []
+            for _ in range(rng.randint(1, 3) if short else rng.randint(3, 8)):
+                words = [rng.choice(WORDS) for _ in range(rng.randint(8, 24))]
+                if 'letters_only' not in quirks and rng.random() < 0.3:
+                    words.insert(rng.randrange(len(words)), f"{rng.randint(2, 95)}%")
+                sentence = ' '.join(words).capitalize()
+                sentences.append(sentence + ('?' if short and 'letters_only' not in quirks else '.'))
+            paragraph = ' '.join(sentences)
+            if 'whitespace' in quirks and rng.random() < 0.3:
+                paragraph = paragraph.replace(' ', rng.choice(['  ', '\t', ' \t ']), rng.randint(1, 5))
+            paragraphs.append(paragraph)
+        return paragraphs
+
+    @staticmethod
+    def _boilerplate(rng: random.Random, quarter: int, year: int) -> str:
+        return rng.choice([
+            'Image source: The Motley Fool.',
+            'Advertisement',
+            f"Nvidia (NVDA {rng.uniform(-5, 5):+.2f}%)",
+            f"NVIDIA (NVDA) Q{quarter} {year} Earnings Call",
+            f"November {rng.randint(1, 28)}, {year}, 5:00 p.m. ET",
+        ])
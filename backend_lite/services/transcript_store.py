@@ -0,0 +1,44 @@
+"""
+Persistent store of scraped and parsed transcripts filled by the backfill CLI
+"""
+import logging
+from datetime import datetime
+from typing import List, Dict, Optional
+import diskcache as dc
+
+from services.segments import serialize_parsed
+
+logging.basicConfig(level=logging.INFO)
+
+
+class TranscriptStore:
+    """Scraped transcript_data and parsed output keyed by URL, plus backfill checkpoints"""
+
+    def __init__(self, directory: str):
+        self.logger = logging.getLogger(__name__)
+        self.cache = dc.Cache(directory)
+
+    def has(self, url: str) -> bool:
+        return f'transcript:{url}' in self.cache
+
+    def get(self, url: str) -> Optional[Dict]:
+        """{'transcript_data', 'parsed', 'stored_at'} for a URL, if ingested"""
+        return self.cache.get(f'transcript:{url}')
+
+    def put(self, url: str, transcript_data: Dict, parsed: Optional[Dict]) -> None:
+        """Store a transcript; parsed segments are kept as plain dicts so the store outlives the Segment class"""
+        self.cache.set(f'transcript:{url}', {
+            'transcript_data': transcript_data,
+            'parsed': serialize_parsed(parsed) if parsed else None,
+            'stored_at': datetime.now().isoformat()
+        })
+
+    def urls(self) -> List[str]:
+        return [key[len('transcript:'):] for key in self.cache.iterkeys()
+                if isinstance(key, str) and key.startswith('transcript:')]
+
+    def get_checkpoint(self, name: str) -> Dict:
+        return self.cache.get(f'checkpoint:{name}', {})
+
+    def set_checkpoint(self, name: str, checkpoint: Dict) -> None:
+        self.cache.set(f'checkpoint:{name}', {**checkpoint, 'updated_at': datetime.now().isoformat()})
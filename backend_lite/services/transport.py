@@ -0,0 +1,173 @@
+"""
+Resilient HTTP transport for the scraper: pooling, retries and per-host circuit breaking
+"""
+import time
+import random
+import logging
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+
+from services.rate_limiter import HostRateLimiter
+
+logging.basicConfig(level=logging.INFO)
+
+
+class CircuitOpenError(Exception):
+    """Raised without making a request while a host's circuit is open"""
+
+
+class CircuitBreaker:
+    """Per-host breaker: opens after consecutive failures, half-opens after a cool-down
+
+    While open, requests fail immediately. Once reset_timeout has passed a
+    single trial request is let through; success closes the circuit, failure
+    re-opens it for another cool-down.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._trial_in_flight: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def state(self, host: str) -> str:
+        with self._lock:
+            return self._state(host)
+
+    def _state(self, host: str) -> str:
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return 'closed'
+        if time.monotonic() - opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def before_request(self, host: str) -> None:
+        """Raise CircuitOpenError if a request to host should not be attempted"""
+        with self._lock:
+            state = self._state(host)
+            if state == 'open':
+                raise CircuitOpenError(f"Circuit open for {host}, failing fast")
+            if state == 'half_open':
+                if self._trial_in_flight.get(host):
+                    raise CircuitOpenError(f"Circuit half-open for {host}, trial request in flight")
+                self._trial_in_flight[host] = True
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures[host] = 0
+            self._opened_at.pop(host, None)
+            self._trial_in_flight.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            self._failures[host] = self._failures.get(host, 0) + 1
+            was_trial = self._trial_in_flight.pop(host, False)
+            if was_trial or self._failures[host] >= self.failure_threshold:
+                self._opened_at[host] = time.monotonic()
+
+
+class HttpTransport:
+    """GETs with a sized keep-alive pool, jittered exponential backoff and Retry-After
+
+    Every attempt goes through the shared per-host rate limiter and circuit
+    breaker. Retries stop once max_retries or the per-request time budget is
+    spent, so one unhealthy upstream cannot pin a worker for long.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, session: requests.Session, rate_limiter: HostRateLimiter,
+                 pool_size: int = 10, max_retries: int = 3, backoff_base: float = 0.5,
+                 max_backoff: float = 20.0, connect_timeout: float = 5.0, read_timeout: float = 20.0,
+                 time_budget: float = 45.0, breaker: Optional[CircuitBreaker] = None):
+        self.logger = logging.getLogger(__name__)
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.timeout = (connect_timeout, read_timeout)
+        self.time_budget = time_budget
+        self.breaker = breaker or CircuitBreaker()
+        self.adapter_kwargs = {'pool_connections': pool_size, 'pool_maxsize': pool_size, 'pool_block': True}
+
+        adapter = HTTPAdapter(**self.adapter_kwargs)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET with retries; returns the final response or raises the final error"""
+        host = urlparse(url).netloc
+        kwargs.setdefault('timeout', self.timeout)
+        deadline = time.monotonic() + self.time_budget
+
+        attempt = 0
+        while True:
+            self.breaker.before_request(host)
+            self.rate_limiter.acquire(url)
+
+            try:
+                response = self.session.get(url, **kwargs)
+            except requests.RequestException as e:
+                self.breaker.record_failure(host)
+                delay = self._backoff(attempt)
+                retryable = isinstance(e, (requests.ConnectionError, requests.Timeout))
+                if not retryable or not self._should_retry(attempt, delay, deadline):
+                    raise
+                self.logger.warning(f"{type(e).__name__} fetching {url}, retrying in {delay:.1f}s")
+            except BaseException:
+                # Bad URLs, interrupts: still settle the breaker so a half-open trial is released
+                self.breaker.record_failure(host)
+                raise
+            else:
+                if response.status_code not in self.RETRY_STATUSES:
+                    self.breaker.record_success(host)
+                    return response
+
+                self.breaker.record_failure(host)
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                if not self._should_retry(attempt, delay, deadline):
+                    return response
+                self.logger.warning(f"HTTP {response.status_code} from {url}, retrying in {delay:.1f}s")
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _should_retry(self, attempt: int, delay: float, deadline: float) -> bool:
+        # A Retry-After longer than max_backoff means the host wants us gone for a while
+        return (attempt < self.max_retries and delay <= self.max_backoff
+                and time.monotonic() + delay < deadline)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(self.max_backoff, self.backoff_base * (2 ** attempt)))
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Seconds requested by a Retry-After header (delta-seconds or HTTP date)"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+        return max(seconds, 0.0)
@@ -1,27 +1,44 @@
 """
 Simple test script for the lightweight backend
+
+Runs against the server at BASE_URL. With SCRAPER_HTTP_MODE=replay (plus
+SCRAPER_FIXTURE_DIR) or upstream, the app is run in-process instead, so its
+scraper reads recorded pages rather than fool.com.
 """
+import os
 import requests
 import json
 import time
 
 BASE_URL = "http://localhost:5000"
+HTTP_MODE = os.getenv('SCRAPER_HTTP_MODE', 'live')
+
+
+def call(method, path, **kwargs):
+    """(status, JSON body) from the server, or from the in-process app when scraping offline"""
+    if HTTP_MODE != 'live':
+        from app import app
+        kwargs.pop('timeout', None)
+        response = app.test_client().open(path, method=method, **kwargs)
+        return response.status_code, response.get_json()
+
+    response = requests.request(method, f"{BASE_URL}{path}", **kwargs)
+    return response.status_code, response.json()
 
 def test_health():
     """Test health endpoint"""
     print("Testing health endpoint...")
-    response = requests.get(f"{BASE_URL}/api/health")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    status, body = call('GET', '/api/health')
+    print(f"Status: {status}")
+    print(f"Response: {json.dumps(body, indent=2)}")
     print()
 
 def test_transcripts():
     """Test transcript URLs endpoint"""
     print("Testing transcript URLs endpoint...")
-    response = requests.get(f"{BASE_URL}/api/transcripts/NVDA?quarters=2")
-    print(f"Status: {response.status_code}")
-    if response.status_code == 200:
-        data = response.json()
+    status, data = call('GET', '/api/transcripts/NVDA?quarters=2')
+    print(f"Status: {status}")
+    if status == 200:
         print(f"Found {data['count']} transcripts")
         for url in data['transcript_urls']:
             print(f"  - {url}")
@@ -38,18 +55,14 @@ def test_analyze():
     }
     
     start_time = time.time()
-    response = requests.post(
-        f"{BASE_URL}/api/analyze",
-        json=payload,
-        timeout=300
-    )
+    status, body = call('POST', '/api/analyze', json=payload, timeout=300)
     elapsed = time.time() - start_time
     
-    print(f"Status: {response.status_code}")
+    print(f"Status: {status}")
     print(f"Time taken: {elapsed:.1f} seconds")
     
-    if response.status_code == 200:
-        data = response.json()['data']
+    if status == 200:
+        data = body['data']
         print(f"\nAnalyzed {data['quarters_analyzed']} quarters")
         
         # Show sentiment results
@@ -83,15 +96,15 @@ def test_cache():
     payload = {"ticker": "NVDA", "quarters": 1}
     
     start1 = time.time()
-    response1 = requests.post(f"{BASE_URL}/api/analyze", json=payload)
+    _, body1 = call('POST', '/api/analyze', json=payload)
     time1 = time.time() - start1
-    from_cache1 = response1.json().get('from_cache', False)
+    from_cache1 = body1.get('from_cache', False)
     
     # Second request (should use cache)
     start2 = time.time()
-    response2 = requests.post(f"{BASE_URL}/api/analyze", json=payload)
+    _, body2 = call('POST', '/api/analyze', json=payload)
     time2 = time.time() - start2
-    from_cache2 = response2.json().get('from_cache', False)
+    from_cache2 = body2.get('from_cache', False)
     
     print(f"First request: {time1:.1f}s (from_cache: {from_cache1})")
     print(f"Second request: {time2:.1f}s (from_cache: {from_cache2})")
@@ -99,8 +112,8 @@ def test_cache():
     
     # Clear cache
     print("\nClearing cache...")
-    response = requests.post(f"{BASE_URL}/api/clear-cache")
-    print(f"Status: {response.status_code}")
+    status, _ = call('POST', '/api/clear-cache')
+    print(f"Status: {status}")
 
 if __name__ == "__main__":
     print("=" * 60)
@@ -0,0 +1,72 @@
+"""
+Tests for resuming the transcript backfill from its checkpoint
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from scripts.backfill_transcripts import MAX_ATTEMPTS, backfill_ticker
+from services.transcript_store import TranscriptStore
+
+URLS = [f"https://www.fool.com/earnings/call-transcripts/nvda-q{i}/" for i in range(5)]
+BAD = URLS[3]
+
+
+class FakeScraper:
+    """Indexed URLs whose scrape fails for BAD, and raises once `crash_after` URLs were fetched"""
+
+    def __init__(self, crash_after=None):
+        self.crash_after = crash_after
+        self.fetched = []
+        self.transcript_index = SimpleNamespace(latest=lambda ticker, num_quarters: [{'url': url} for url in URLS])
+
+    def refresh_transcript_index(self, ticker, sitemap_months=None):
+        return 0
+
+    def scrape_transcripts(self, urls):
+        if self.crash_after is not None and len(self.fetched) >= self.crash_after:
+            raise KeyboardInterrupt
+        self.fetched.extend(urls)
+        return [None if url == BAD else {'url': url} for url in urls]
+
+
+class FakeParser:
+    def parse_many(self, transcripts, workers=None, start_method=None):
+        return [{'management_remarks': [], 'qa_session': []} if data else None for data in transcripts]
+
+
+def run(store, scraper, retry_failed=False):
+    return backfill_ticker('NVDA', scraper, FakeParser(), store, since=None, batch_size=2,
+                           limit=None, retry_failed=retry_failed, workers=1)
+
+
+def test_killed_run_resumes_from_checkpoint(tmp_path):
+    store = TranscriptStore(str(tmp_path))
+
+    with pytest.raises(KeyboardInterrupt):
+        run(store, FakeScraper(crash_after=2))
+    assert sorted(store.urls()) == URLS[:2]
+    assert store.get_checkpoint('backfill:NVDA')['completed'] == 2
+
+    scraper = FakeScraper()
+    processed, _ = run(store, scraper)
+    assert scraper.fetched == URLS[2:]  # stored transcripts are not fetched again
+    assert processed == 3
+    checkpoint = store.get_checkpoint('backfill:NVDA')
+    assert checkpoint['completed'] == 4
+    assert checkpoint['failures'] == {BAD: 1}
+
+
+def test_failures_are_retried_until_given_up(tmp_path):
+    store = TranscriptStore(str(tmp_path))
+    for _ in range(MAX_ATTEMPTS):
+        run(store, FakeScraper())
+    assert store.get_checkpoint('backfill:NVDA')['failures'] == {BAD: MAX_ATTEMPTS}
+
+    scraper = FakeScraper()
+    run(store, scraper)
+    assert scraper.fetched == []
+
+    run(store, scraper, retry_failed=True)
+    assert scraper.fetched == [BAD]
+    assert store.get_checkpoint('backfill:NVDA')['failures'] == {BAD: 1}
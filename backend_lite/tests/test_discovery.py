@@ -0,0 +1,72 @@
+"""
+Tests for transcript URL parsing and the persisted discovery index
+"""
+import time
+from datetime import datetime
+
+from services.discovery import TranscriptIndex, latest_transcripts, parse_transcript_url
+from services.scraper import MotleyFoolScraper
+
+BASE = "https://www.fool.com/earnings/call-transcripts"
+Q3 = f"{BASE}/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/"
+Q2 = f"{BASE}/2024/08/28/nvidia-nvda-q2-2025-earnings-call-transcript/"
+Q1 = f"{BASE}/2024/05/22/nvidia-nvda-q1-2025-earnings-call-transcript/"
+
+
+def test_slug_parsing():
+    assert parse_transcript_url(Q3) == {'ticker': 'NVDA', 'quarter': 3, 'year': 2025, 'published': '2024-11-20'}
+    assert parse_transcript_url(f"{BASE}/2025/2/3/Berkshire-Hathaway-BRK.B-Q4-2024-Earnings-Call-Transcript/") == {
+        'ticker': 'BRK.B', 'quarter': 4, 'year': 2024, 'published': '2025-02-03'}
+    assert parse_transcript_url(f"{BASE}/2024/11/20/nvidia-nvda-q5-2025-earnings-call-transcript/") is None
+    assert parse_transcript_url("https://www.fool.com/investing/2024/11/20/nvidia-earnings/") is None
+
+
+def test_latest_prefers_newest_quarter_and_publication():
+    republished = f"{BASE}/2024/11/21/nvidia-nvda-q3-2025-earnings-call-transcript/"
+    entries = [{**parse_transcript_url(url), 'url': url} for url in (Q1, Q3, republished, Q2)]
+    assert [entry['url'] for entry in latest_transcripts(entries, 2)] == [republished, Q2]
+
+
+def make_scraper(directory, ttl=3600):
+    scraper = MotleyFoolScraper(transcript_index=TranscriptIndex(str(directory), ttl=ttl))
+    crawled = []
+
+    def listing(url):
+        crawled.append(url)
+        return [Q1, Q2, Q3, f"{BASE}/2024/11/20/amd-amd-q3-2024-earnings-call-transcript/"]
+
+    scraper._fetch_transcript_links = listing
+    return scraper, crawled
+
+
+def test_index_is_recrawled_only_after_ttl(tmp_path):
+    scraper, crawled = make_scraper(tmp_path, ttl=0.3)
+
+    assert scraper.find_transcript_urls('NVDA', 2) == [Q3, Q2]
+    assert scraper.find_transcript_urls('nvda', 3) == [Q3, Q2, Q1]
+    assert len(crawled) == 2  # quote page and archive, once
+
+    time.sleep(0.4)
+    scraper.find_transcript_urls('NVDA', 1)
+    assert len(crawled) == 4
+    # Other tickers' links are not indexed under NVDA
+    assert set(scraper.transcript_index.entries('NVDA')) == {Q1, Q2, Q3}
+
+
+def test_past_sitemap_months_are_read_once(tmp_path):
+    scraper, _ = make_scraper(tmp_path)
+    read = []
+
+    def sitemap(url):
+        read.append(url)
+        return []
+
+    scraper._fetch_sitemap_links = sitemap
+    now = datetime.now()
+    months = [(2020, 1), (now.year, now.month)]
+
+    scraper.refresh_transcript_index('NVDA', sitemap_months=months)
+    scraper.refresh_transcript_index('NVDA', sitemap_months=months)
+
+    current = scraper.SITEMAP_URL_TEMPLATE.format(year=now.year, month=now.month)
+    assert read == [scraper.SITEMAP_URL_TEMPLATE.format(year=2020, month=1), current, current]
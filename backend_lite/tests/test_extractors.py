@@ -0,0 +1,124 @@
+"""
+Tests for the HTML extractors and speaker-turn extraction
+"""
+import pytest
+
+from services.extractors import ARTICLE_BODY_SELECTOR, HtmlParserExtractor, LxmlExtractor, LXML_AVAILABLE, \
+    StreamingArticleParser, extract_speaker_turns, find_largest_text_block, index_text_spans
+from services.scraper import MotleyFoolScraper
+
+# Unclosed paragraphs, a heading right after one, <br> and inline tags between words
+MESSY_PAGE = b"""<html><body><h1>NVIDIA (NVDA) Q3 2025 Earnings Call Transcript</h1>
+<div class="article-body"><h2>Prepared Remarks:</h2>
+<p><strong>Operator</strong>
+<p>Good afternoon.<br>Welcome to the call.
+<p><strong>Jensen Huang</strong> -- President and Chief Executive Officer
+<p>Data center revenue was a record this quarter.<br>Blackwell is in full production.
+<p>Demand is <em>strong</em>.<script>var ad = 1;</script></p>
+<h2>Questions &amp; Answers:</h2>
+<p><strong>Operator</strong></p>
+<p>Our first question comes from <a href="#">Joseph Moore</a> with Morgan Stanley.
+<div class="ad"><p>Advertisement</div>
+</div></body></html>"""
+
+MESSY_TURNS = [
+    {'speaker': 'Operator', 'role': '', 'section': 'prepared_remarks',
+     'content': 'Good afternoon. Welcome to the call.'},
+    {'speaker': 'Jensen Huang', 'role': 'President and Chief Executive Officer', 'section': 'prepared_remarks',
+     'content': 'Data center revenue was a record this quarter. Blackwell is in full production.\n'
+                'Demand is strong .'},
+    {'speaker': 'Operator', 'role': '', 'section': 'qa',
+     'content': 'Our first question comes from Joseph Moore with Morgan Stanley.\nAdvertisement'},
+]
+
+
+def streamed_turns(content, chunk_size):
+    parser = StreamingArticleParser()
+    for start in range(0, len(content), chunk_size):
+        parser.feed(content[start:start + chunk_size].decode())
+    return parser.turns
+
+
+def test_dom_and_streaming_turns_agree_on_unclosed_paragraphs():
+    article = HtmlParserExtractor().parse_transcript_page(MESSY_PAGE).select_one(ARTICLE_BODY_SELECTOR)
+
+    assert extract_speaker_turns(article) == MESSY_TURNS
+    # Small chunks split text nodes across feeds
+    for chunk_size in (7, 64, len(MESSY_PAGE)):
+        assert streamed_turns(MESSY_PAGE, chunk_size) == MESSY_TURNS
+
+
+SAVED_PAGE = b"""<!DOCTYPE html><html><head><title>NVIDIA (NVDA) Q3 2025 Earnings Call Transcript | The Motley Fool</title>
+<script>window.dataLayer = [];</script><style>.article-body p { margin: 0 }</style></head>
+<body><nav><a href="/">Home</a><a href="/investing/">Investing</a></nav>
+<header><h1>NVIDIA (NVDA) Q3 2025 Earnings Call Transcript</h1><span>Nov 20, 2024 at 8:00PM</span></header>
+<main><div class="tailwind-article-body article-body">
+<!-- transcript -->
+<p>Image source: The Motley Fool.</p>
+<h2>Prepared Remarks:</h2>
+<p><strong>Operator</strong></p>
+<p>Good afternoon. My name is Krista, and I&#8217;ll be your conference operator today.</p>
+<p><strong>Jensen Huang</strong> -- <em>President and Chief Executive Officer</em></p>
+<p>Revenue was a record $35.1&nbsp;billion, up 94% from a year ago.<br>Blackwell is in full production.
+<div class="interad"><p>Advertisement</p><script>loadAd()</script></div>
+<p>Demand for Hopper &amp; Blackwell is strong.</p>
+<h2>Questions &amp; Answers:</h2>
+<p><strong>Operator</strong></p>
+<p>Our first question comes from C.J. Muse with Cantor Fitzgerald.</p>
+<p><strong>C.J. Muse</strong> -- <em>Analyst</em></p>
+<p>Good afternoon. How should we think about gross margins?</p>
+<h2>Call participants:</h2>
+<p><strong>Jensen Huang</strong> -- <em>President and Chief Executive Officer</em></p>
+</div></main>
+<footer><p>Premium Investing Services</p><script>trackPage()</script></footer></body></html>"""
+
+
+@pytest.mark.skipif(not LXML_AVAILABLE, reason='lxml is not installed')
+def test_lxml_extracts_the_same_transcript_as_html_parser():
+    url = "https://www.fool.com/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/"
+    expected = MotleyFoolScraper(extractor=HtmlParserExtractor())._extract_transcript(url, SAVED_PAGE)
+    result = MotleyFoolScraper(extractor=LxmlExtractor())._extract_transcript(url, SAVED_PAGE)
+
+    assert expected['full_text'].startswith('Image source: The Motley Fool.')
+    assert [turn['speaker'] for turn in expected['turns']] == ['Operator', 'Jensen Huang', 'Operator', 'C.J. Muse']
+    for key in ('title', 'quarter', 'year', 'full_text', 'turns'):
+        assert result[key] == expected[key]
+
+
+def quadratic_largest_text_block(root, min_length, phrase='earnings call'):
+    """The get_text-per-div scan find_largest_text_block replaced"""
+    best = None
+    for div in root.find_all('div'):
+        text = div.get_text(strip=True)
+        if len(text) > min_length and phrase in text.lower() and (
+                best is None or len(text) > len(best.get_text(strip=True))):
+            best = div
+    return best
+
+
+def block(text, repeat=5):
+    return ' '.join([text] * repeat)
+
+
+@pytest.mark.parametrize('body', [
+    # Ties between siblings, and between a div and its only child
+    f"<div id='a'><p>{block('Earnings call remarks.')}</p></div><div id='b'><p>{block('Earnings call remarks.')}</p></div>",
+    f"<div id='outer'><div id='inner'>{block('The earnings call opened.')}</div></div>",
+    # Nested blocks: the enclosing div is longer than the one holding the phrase; script text does not count
+    f"<div id='page'><div id='nav'>{block('Menu')}</div><div id='body'><p>{block('Q3 results')}</p>"
+    f"<p>Earnings call transcript</p><script>var phrase = 'earnings call';</script></div></div>"
+    f"<div id='footer'>{block('Earnings call replay.', 3)}</div>",
+    # The phrase only outside every long div, or nowhere at all
+    f"<p>earnings call</p><div id='long'>{block('Guidance for the next quarter.')}</div>",
+    "<div id='empty'></div>",
+    "",
+])
+def test_largest_text_block_matches_quadratic_scan(body):
+    soup = HtmlParserExtractor().parse_full(f"<html><body>{body}</body></html>".encode())
+
+    spans, lowered_text = index_text_spans(soup)
+    for tag, start, end, lower_start, lower_end in spans:
+        assert end - start == len(tag.get_text(strip=True))
+        assert lowered_text[lower_start:lower_end] == tag.get_text(strip=True).lower()
+
+    assert find_largest_text_block(soup, min_length=50) is quadratic_largest_text_block(soup, min_length=50)
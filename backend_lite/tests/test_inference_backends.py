@@ -0,0 +1,103 @@
+"""
+Tests for FinBERT inference backend selection, export and reload, on a tiny stand-in model
+"""
+import os
+from types import SimpleNamespace
+import pytest
+
+torch = pytest.importorskip('torch')
+transformers = pytest.importorskip('transformers')
+
+from services import inference_backends
+from services.inference_backends import OnnxBackend, QuantizedTorchBackend, TorchBackend, get_inference_backend
+from services.sentiment_analyzer import SentimentAnalyzer
+
+MODEL_NAME = 'ProsusAI/finbert'
+INPUTS = {'input_ids': torch.tensor([[2, 5, 7, 3]]), 'attention_mask': torch.ones(1, 4, dtype=torch.long)}
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    """Serve a tiny BERT classifier at any revision; records what was loaded from the hub"""
+    hub = SimpleNamespace(revision='rev1', loads=[])
+
+    def config(model_name, revision=None):
+        config = transformers.BertConfig(vocab_size=16, hidden_size=8, num_hidden_layers=1, num_attention_heads=2,
+                                         intermediate_size=16, num_labels=3)
+        config._commit_hash = hub.revision
+        return config
+
+    def model(model_name, revision=None):
+        hub.loads.append(revision)
+        torch.manual_seed(0)
+        return transformers.BertForSequenceClassification(config(model_name))
+
+    monkeypatch.setattr(inference_backends.AutoConfig, 'from_pretrained', staticmethod(config))
+    monkeypatch.setattr(inference_backends.AutoModelForSequenceClassification, 'from_pretrained',
+                        staticmethod(model))
+    return hub
+
+
+def test_artifacts_and_fingerprints_follow_revision_and_settings(hub, tmp_path):
+    cache_dir = str(tmp_path)
+    fp32 = TorchBackend(MODEL_NAME, cache_dir)
+    int8 = QuantizedTorchBackend(MODEL_NAME, cache_dir)
+
+    assert fp32.fingerprint == 'ProsusAI/finbert@rev1:fp32'
+    assert int8.fingerprint == 'ProsusAI/finbert@rev1:int8-dynamic-qint8-linear'
+    assert int8.artifact_path('pt') == os.path.join(cache_dir, 'exported', 'ProsusAI--finbert', 'rev1',
+                                                    'int8-dynamic-qint8-linear.pt')
+    assert hub.loads == ['rev1', 'rev1']
+
+    hub.revision = 'rev2'
+    bumped = QuantizedTorchBackend(MODEL_NAME, cache_dir)
+    assert bumped.fingerprint != int8.fingerprint
+    assert bumped.artifact_path('pt') != int8.artifact_path('pt')
+    # No rev1 weights were reused: the new revision was exported from the hub model
+    assert hub.loads[-1] == 'rev2'
+
+
+def test_int8_export_is_reloaded_with_the_same_logits(hub, tmp_path):
+    cache_dir = str(tmp_path)
+    exported = QuantizedTorchBackend(MODEL_NAME, cache_dir)
+    assert os.path.exists(exported.artifact_path('pt'))
+
+    reloaded = QuantizedTorchBackend(MODEL_NAME, cache_dir)
+    assert len(hub.loads) == 1
+    with torch.inference_mode():
+        assert torch.allclose(exported.logits(INPUTS), reloaded.logits(INPUTS))
+        assert exported.logits(INPUTS).shape == TorchBackend(MODEL_NAME, cache_dir).logits(INPUTS).shape
+
+
+def test_onnx_export_is_reloaded_with_the_fp32_logits(hub, tmp_path):
+    pytest.importorskip('onnxruntime')
+    cache_dir = str(tmp_path)
+    inputs = {**INPUTS, 'token_type_ids': torch.zeros(1, 4, dtype=torch.long)}
+    batch = {name: values.repeat(3, 2) for name, values in inputs.items()}
+
+    exported = OnnxBackend(MODEL_NAME, cache_dir)
+    assert os.path.exists(exported.artifact_path('onnx'))
+    reloaded = OnnxBackend(MODEL_NAME, cache_dir)
+    assert len(hub.loads) == 1
+
+    reference = TorchBackend(MODEL_NAME, cache_dir)
+    with torch.inference_mode():
+        # Batch and sequence axes are dynamic
+        for features in (inputs, batch):
+            assert torch.allclose(reloaded.logits(features), reference.logits(features), atol=1e-4)
+
+
+def test_backend_selection(hub, monkeypatch, tmp_path):
+    assert get_inference_backend(None, MODEL_NAME).name == 'fp32'
+    assert get_inference_backend('int8', MODEL_NAME, str(tmp_path)).name == 'int8'
+    with pytest.raises(ValueError):
+        get_inference_backend('fp16', MODEL_NAME)
+
+    monkeypatch.setattr(inference_backends, 'ONNXRUNTIME_AVAILABLE', False)
+    assert get_inference_backend('onnx', MODEL_NAME).name == 'fp32'
+
+
+def test_analyzer_rejects_unknown_backend():
+    # Raised before any model loads, so a typo cannot fall back to mock sentiment
+    with pytest.raises(ValueError, match='fp16'):
+        SentimentAnalyzer(backend='fp16')
@@ -0,0 +1,36 @@
+"""
+Tests for the Aho-Corasick keyword matcher
+"""
+import json
+import random
+from services.keyword_matcher import DEFAULT_KEYWORDS, KeywordMatcher, load_keyword_groups
+
+
+def test_scan_matches_substring_checks():
+    rng = random.Random(7)
+    for _ in range(200):
+        keywords = [''.join(rng.choice('abc') for _ in range(rng.randint(1, 5))) for _ in range(rng.randint(1, 12))]
+        matcher = KeywordMatcher({'group': keywords})
+        for _ in range(10):
+            text = ''.join(rng.choice('abcAB ') for _ in range(rng.randint(0, 40)))
+            assert matcher.scan(text) == {k for k in keywords if k in text.lower()}
+
+
+def test_groups_share_one_scan():
+    matcher = KeywordMatcher(DEFAULT_KEYWORDS)
+    hits = matcher.scan("Colette Kress -- Executive Vice President and Chief Financial Officer")
+    assert matcher.has_any(hits, 'executive_speaker')
+    assert not matcher.has_any(hits, 'analyst_speaker')
+    assert matcher.count(hits, 'executive_speaker') == 5
+
+    hits = matcher.scan("Good afternoon. My name is Sarah, and I will be your conference operator today.")
+    assert matcher.count(hits, 'call_boilerplate') == 2
+    assert matcher.count(hits, 'segment_boilerplate') == 4
+
+
+def test_keywords_file_replaces_groups(tmp_path):
+    path = tmp_path / 'keywords.json'
+    path.write_text(json.dumps({'executive_speaker': ['lisa su', 'jean hu']}))
+    groups = load_keyword_groups(str(path))
+    assert groups['executive_speaker'] == ['lisa su', 'jean hu']
+    assert groups['analyst_speaker'] == DEFAULT_KEYWORDS['analyst_speaker']
@@ -0,0 +1,81 @@
+"""
+Tests for the raw page store and conditional-GET revalidation
+"""
+import requests
+
+from services.page_store import PageStore
+from services.scraper import MotleyFoolScraper
+
+URL = "https://www.fool.com/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/"
+PAGE = b"""<html><body><h1>NVIDIA (NVDA) Q3 2025 Earnings Call Transcript</h1>
+<div class="article-body"><p>Data center revenue was a record this quarter.</p></div></body></html>"""
+
+
+class TrackedResponse(requests.Response):
+    """A response with its body already read, recording whether it was closed"""
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def make_response(status, body=b'', headers=None):
+    response = TrackedResponse()
+    response.status_code = status
+    response._content = body
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+def test_conditional_headers_and_shared_bodies(tmp_path):
+    store = PageStore(str(tmp_path))
+    assert store.conditional_headers(URL) == {}
+
+    digest = store.put(URL, PAGE, etag='"v1"', last_modified='Wed, 20 Nov 2024 22:00:00 GMT')
+    assert store.conditional_headers(URL) == {'If-None-Match': '"v1"',
+                                              'If-Modified-Since': 'Wed, 20 Nov 2024 22:00:00 GMT'}
+    # The same body under another URL is stored once
+    assert store.put(URL + '?amp', PAGE) == digest
+    assert store.get_body(digest) == PAGE
+    assert store.conditional_headers(URL + '?amp') == {}
+
+
+def test_not_modified_reuses_body_and_extracted_transcript(monkeypatch, tmp_path):
+    scraper = MotleyFoolScraper(page_store=PageStore(str(tmp_path)))
+    sent_headers, extractions = [], []
+    responses = [make_response(200, PAGE, {'ETag': '"v1"', 'Content-Type': 'text/html'}),
+                 make_response(304, headers={'ETag': '"v1"'})]
+    sent = list(responses)
+
+    def get(url, headers=None, **kwargs):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    extract = scraper._extract_transcript
+    monkeypatch.setattr(scraper.transport, 'get', get)
+    monkeypatch.setattr(scraper, '_extract_transcript', lambda url, content: extractions.append(url) or
+                        extract(url, content))
+
+    first = scraper.scrape_transcript(URL)
+    second = scraper.scrape_transcript(URL)
+
+    assert first and first == second
+    assert sent_headers == [{}, {'If-None-Match': '"v1"'}]
+    assert extractions == [URL]  # the unchanged page was not extracted again
+    assert all(response.closed for response in sent)
+
+
+def test_streamed_not_modified_response_is_closed(monkeypatch, tmp_path):
+    # A page stored in full earlier (e.g. by a non-streaming scraper) is revalidated by a streamed GET
+    store = PageStore(str(tmp_path))
+    store.put(URL, PAGE, etag='"v1"')
+    scraper = MotleyFoolScraper(page_store=store, streaming=True)
+    response = make_response(304, headers={'ETag': '"v1"'})
+    monkeypatch.setattr(scraper.transport, 'get', lambda url, headers=None, **kwargs: response)
+
+    assert scraper.scrape_transcript(URL)['title'] == 'NVIDIA (NVDA) Q3 2025 Earnings Call Transcript'
+    # Left open, the streamed connection would never return to the pool
+    assert response.closed
@@ -0,0 +1,39 @@
+"""
+Tests for the parse-result cache
+"""
+from services.parser import TranscriptParser
+from services.parse_cache import ParseCache
+
+REMARKS = ' '.join(['Data center revenue grew strongly this quarter on demand from customers.'] * 5)
+QUESTION = ' '.join(['Could you talk about supply and the ramp into next quarter?'] * 3)
+TRANSCRIPT = {
+    'quarter': 3, 'year': 2025, 'title': 'NVIDIA (NVDA) Q3 2025 Earnings Call Transcript', 'url': 'u1',
+    'full_text': f"Prepared Remarks:\nJensen Huang -- CEO\n{REMARKS}\n"
+                 f"Questions and Answers:\nOperator: Thank you. We will now open the call for questions.\n"
+                 f"Vivek Arya -- Bank of America\n{QUESTION}\nJensen Huang -- CEO\n{REMARKS}"
+}
+
+
+def test_parse_cache_hit_matches_fresh_parse(tmp_path):
+    parser = TranscriptParser()
+    cache = ParseCache(str(tmp_path), parser)
+
+    first = cache.parse(TRANSCRIPT)
+    second = cache.parse({**TRANSCRIPT, 'url': 'u2'})
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second['qa_session'] == first['qa_session'] == parser.parse(TRANSCRIPT)['qa_session']
+    assert second['qa_session'][0].word_count == first['qa_session'][0].word_count
+    assert second['url'] == 'u2'
+
+
+def test_pattern_change_invalidates_parse_results(tmp_path):
+    directory = str(tmp_path)
+    ParseCache(directory, TranscriptParser()).parse(TRANSCRIPT)
+
+    changed = TranscriptParser()
+    changed.qa_start_patterns = changed.qa_start_patterns + [r'over to questions']
+    changed.fingerprint = changed._fingerprint()
+    cache = ParseCache(directory, changed)
+    cache.parse(TRANSCRIPT)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert ParseCache(directory, TranscriptParser()).key(TRANSCRIPT) != cache.key(TRANSCRIPT)
@@ -0,0 +1,32 @@
+"""
+Tests for process-pool batch parsing
+"""
+import pytest
+
+from services.parser import TranscriptParser
+from services.parser_registry import ParserCascade
+from services.transcript_generator import TranscriptGenerator
+
+
+@pytest.mark.parametrize('start_method', [None, 'fork'])
+def test_parse_many_matches_serial_parse_in_input_order(start_method):
+    transcripts = TranscriptGenerator(5).corpus(6, target_chars=15_000)
+    transcripts.insert(2, None)
+    parser = TranscriptParser()
+
+    results = parser.parse_many(transcripts, workers=2, chunksize=2, start_method=start_method)
+    assert results == [parser.parse(transcript_data) for transcript_data in transcripts]
+    assert results[2] is None
+    assert [parsed['quarter'] for parsed in results if parsed] == [1, 2, 3, 4, 1, 2]
+
+
+def test_cascade_parse_many_merges_worker_stats():
+    transcripts = TranscriptGenerator(6).corpus(4, target_chars=15_000, quirks=[])
+    cascade = ParserCascade()
+
+    results = cascade.parse_many(transcripts, workers=2)
+    assert [parsed['parser_strategy'] for parsed in results] == ['regex'] * 4
+    stats = cascade.stats()
+    assert stats['regex']['runs'] == 4 and stats['regex']['selected'] == 4
+    # Transcripts without speaker turns skip the structured strategy
+    assert stats['structured']['selected'] == 0
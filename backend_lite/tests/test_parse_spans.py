@@ -0,0 +1,67 @@
+"""
+Tests for offset-based span segmentation against TranscriptParser.parse
+"""
+import pytest
+
+from services.parser import TranscriptParser
+from services.transcript_generator import TranscriptGenerator
+
+REMARKS = ' '.join(['Revenue growth in the data center business reached a record with strong customers.'] * 4)
+
+
+def documents():
+    transcripts = TranscriptGenerator(8).corpus(6, target_chars=15_000)
+    transcripts.append(TranscriptGenerator(9).generate(15_000, quirks=['no_qa_heading']))
+    # Q&A opening line without a prepared remarks heading
+    transcripts.append({'quarter': 4, 'year': 2024, 'full_text': f"Jensen Huang -- CEO\n{REMARKS}\n"
+                                                                  f"Operator: Thank you. Our first question comes from Vivek Arya.\n"
+                                                                  f"Vivek Arya -- Analyst\n{REMARKS}?\n"
+                                                                  f"Jensen Huang -- CEO\n{REMARKS}"})
+    # No section headings at all: the heuristic split
+    transcripts.append({'quarter': 1, 'year': 2025, 'full_text': f"Jensen Huang -- CEO\n{REMARKS}\n"
+                                                                  f"Vivek Arya -- Analyst\n{REMARKS}?"})
+    transcripts.append({'quarter': 2, 'year': 2025, 'full_text': REMARKS, 'turns': [
+        {'speaker': 'Jensen Huang', 'role': 'CEO', 'section': 'prepared_remarks', 'content': REMARKS},
+        {'speaker': 'Vivek Arya', 'role': 'Analyst', 'section': 'qa', 'content': REMARKS},
+    ]})
+    return transcripts
+
+
+@pytest.mark.parametrize('transcript_data', documents())
+def test_spans_materialize_to_parse_result(transcript_data):
+    parser = TranscriptParser()
+    assert parser.parse_spans(transcript_data).to_parsed() == parser.parse(transcript_data)
+
+
+def test_every_section_split_is_carried():
+    parser = TranscriptParser()
+    splits = {parser.parse_spans(transcript_data).to_parsed()['section_split'] for transcript_data in documents()}
+    assert splits >= {'sections', 'qa_only', 'heuristic', 'turns'}
+
+
+def test_speakerless_remarks_become_one_joined_span():
+    filler = ' '.join(['We thank everyone for joining and refer you to our filings today.'] * 4)
+    # Date lines are stripped as boilerplate, leaving paragraph breaks
+    text = (f"Prepared Remarks:\n{REMARKS}\nNovember 19, 2025\n{filler}\nNovember 19, 2025\n{REMARKS} Outlook.\n"
+            f"Questions and Answers: Operator, Thank you.\nVivek Arya -- Analyst\n{REMARKS}?")
+    transcript_data = {'quarter': 3, 'year': 2025, 'full_text': text}
+    parser = TranscriptParser()
+
+    document = parser.parse_spans(transcript_data)
+    management = list(document.section('prepared_remarks'))
+    assert len(management) == 1
+    assert (management[0].speaker, management[0].speaker_type) == ('Management', 'executive')
+    assert management[0].content == f"{REMARKS}\n\n{REMARKS} Outlook."
+    assert document.to_parsed() == parser.parse(transcript_data)
+
+
+def test_span_content_is_cleaned_when_read():
+    remarks = f"Colette Kress, Executive Vice President and CFO\n{REMARKS}"
+    text = (f"Prepared Remarks:\nJensen Huang -- CEO\n{remarks}\n"
+            f"Questions and Answers: Operator, Thank you.\nVivek Arya -- Analyst\n{REMARKS}?")
+    document = TranscriptParser().parse_spans({'full_text': text})
+
+    span = next(document.section('prepared_remarks'))
+    # The buffer keeps the title line; only the materialized content drops it
+    assert 'Executive Vice President' in document.text[span.start:span.end]
+    assert span.content == REMARKS
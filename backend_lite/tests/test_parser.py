@@ -0,0 +1,52 @@
+"""
+Tests for TranscriptParser's structured-turn and full-text strategies
+"""
+from services.parser import TranscriptParser
+
+REMARKS = ' '.join(['Data center revenue was a record $30.8 billion, up 112% from a year ago.'] * 4)
+ANSWER = ' '.join(['Blackwell demand is strong and supply is improving every quarter for our 2 key customers.'] * 3)
+QUESTION = "Can you talk about the gross margin outlook as Blackwell ramps through the year and what's driving it?"
+
+TURNS = [
+    {'speaker': 'Operator', 'role': '', 'section': 'prepared_remarks',
+     'content': "Good afternoon. My name is Krista, and I'll be your conference operator today."},
+    {'speaker': 'Jensen Huang', 'role': 'President and CEO', 'section': 'prepared_remarks',
+     'content': f"{REMARKS}\nAdvertisement\nImage source: The Motley Fool.\n{REMARKS}"},
+    {'speaker': 'Colette Kress', 'role': 'Executive vice president and CFO', 'section': 'prepared_remarks',
+     'content': f"Thanks, Jensen. {REMARKS}\nNovember 20, 2024\n{REMARKS}"},
+    {'speaker': 'Operator', 'role': '', 'section': 'qa',
+     'content': "Our first question comes from Joseph Moore with Morgan Stanley. Your line's open."},
+    {'speaker': 'Joseph Moore', 'role': 'Morgan Stanley, Analyst', 'section': 'qa', 'content': QUESTION},
+    {'speaker': 'Jensen Huang', 'role': 'President and CEO', 'section': 'qa',
+     'content': f"{ANSWER}\nAdvertisement\n{ANSWER}"},
+]
+
+
+def full_text(turns):
+    """The page text the turns were read from, one header line per turn"""
+    lines = ['NVIDIA (NVDA) Q3 2025 Earnings Call Transcript', 'Prepared Remarks:']
+    for turn in turns:
+        lines.append(f"{turn['speaker']} -- {turn['role']}" if turn['role'] else f"{turn['speaker']}:")
+        lines.append(turn['content'])
+    return '\n'.join(lines)
+
+
+def segments(parsed):
+    return [[(segment.speaker, segment.content, segment.speaker_type) for segment in parsed[section]]
+            for section in ('management_remarks', 'qa_session')]
+
+
+def test_structured_turns_are_cleaned_like_text():
+    parser = TranscriptParser()
+    transcript_data = {'quarter': 3, 'year': 2025, 'full_text': full_text(TURNS), 'turns': TURNS}
+
+    structured = parser.parse_structured(transcript_data)
+    text = parser.parse_text(transcript_data)
+
+    assert segments(structured) == segments(text)
+    management, qa = segments(structured)
+    assert [speaker for speaker, _, _ in management] == ['Jensen Huang', 'Colette Kress']
+    assert len(qa) == 2
+    for _, content, _ in management + qa:
+        assert 'Advertisement' not in content and 'Image source' not in content and 'November' not in content
+    assert structured['normalization']['advertisement'] == 2
@@ -0,0 +1,46 @@
+"""
+Tests for the quality-gated parser cascade
+"""
+from services.parser_registry import ParserCascade
+
+REMARKS = ' '.join(['Revenue growth in the data center business reached a record with strong customers.'] * 4)
+
+
+def test_structured_turns_accepted_first():
+    turns = [
+        {'speaker': 'Jensen Huang', 'role': 'CEO', 'section': 'prepared_remarks', 'content': REMARKS},
+        {'speaker': 'Vivek Arya', 'role': 'Analyst', 'section': 'qa', 'content': REMARKS},
+    ]
+    cascade = ParserCascade()
+    parsed = cascade.parse({'full_text': REMARKS, 'turns': turns})
+    assert parsed['parser_strategy'] == 'structured'
+    assert parsed['quality_issues'] == []
+    assert cascade.stats()['regex']['runs'] == 0
+
+
+def test_heuristic_split_falls_through_to_legacy():
+    # "Q&A Session" is only among the legacy parser's Q&A headings
+    text = (f"Jensen Huang -- CEO\n{REMARKS}\nQ&A Session\n"
+            f"Vivek Arya -- Analyst\n{REMARKS}?\nJensen Huang -- CEO\n{REMARKS}")
+    cascade = ParserCascade()
+    parsed = cascade.parse({'full_text': text})
+    assert parsed['parser_strategy'] == 'legacy'
+    assert len(parsed['qa_session']) == 2
+
+    stats = cascade.stats()
+    # Without speaker turns the structured strategy does not apply
+    assert (stats['structured']['runs'], stats['regex']['runs'], stats['legacy']['runs']) == (0, 1, 1)
+    assert stats['regex']['hit_rate'] == 0.0 and stats['legacy']['selected'] == 1
+
+
+def test_stats_count_the_strategy_that_parsed():
+    text = (f"Prepared Remarks:\nJensen Huang -- CEO\n{REMARKS}\nOperator: Our first question comes from Vivek Arya.\n"
+            f"Vivek Arya -- Analyst\n{REMARKS}?\nJensen Huang -- CEO\n{REMARKS}")
+    cascade = ParserCascade()
+    assert cascade.parse({'full_text': text})['parser_strategy'] == 'regex'
+
+    stats = cascade.stats()
+    assert stats['structured'] == {'runs': 0, 'accepted': 0, 'selected': 0, 'seconds': 0.0,
+                                   'hit_rate': 0.0, 'mean_ms': 0.0}
+    assert (stats['regex']['runs'], stats['regex']['accepted'], stats['regex']['selected']) == (1, 1, 1)
+    assert stats['legacy']['runs'] == 0
@@ -0,0 +1,83 @@
+"""
+Tests for the request-scoped pipeline context and caching of partial analysis runs
+"""
+import pytest
+import diskcache as dc
+
+from services.pipeline import PipelineContext
+
+QUARTERS = {f"https://www.fool.com/earnings/call-transcripts/nvda-q{quarter}-2025/": quarter for quarter in (4, 3, 2, 1)}
+URLS = list(QUARTERS)
+
+
+class FakeScraper:
+    """Scrapes every URL except those in `failing`; counts the URLs it was asked for"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.scraped = []
+
+    def find_transcript_urls(self, ticker, num_quarters):
+        return URLS[:num_quarters]
+
+    def scrape_transcripts(self, urls):
+        self.scraped.extend(urls)
+        return [None if url in self.failing else {'url': url, 'quarter': QUARTERS[url], 'year': 2025,
+                                                   'full_text': 'text'} for url in urls]
+
+
+class FakeParser:
+    def parse_many(self, transcripts, workers=None):
+        return [{'quarter': data['quarter'], 'year': data['year'], 'management_remarks': [], 'qa_session': []}
+                for data in transcripts]
+
+
+def test_failed_scrape_keeps_quarters_aligned():
+    context = PipelineContext('NVDA', 4)
+    context.load(FakeScraper(failing=[URLS[1]]), FakeParser(), URLS)
+
+    assert context.failed_urls == [URLS[1]]
+    assert [transcript.url for transcript in context.transcripts] == [URLS[0], URLS[2], URLS[3]]
+    assert [(result['quarter'], result['transcript_url']) for result in context.results()] == \
+           [(4, URLS[0]), (2, URLS[2]), (1, URLS[3])]
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    pytest.importorskip('torch')
+    import app as app_module
+
+    scraper = FakeScraper(failing=[URLS[1]])
+    sentiment = {'sentiment': 'positive', 'confidence': 0.9, 'coverage': 1.0}
+    stubs = {
+        'get_scraper': scraper,
+        'get_parse_cache': FakeParser(),
+        'get_transcript_store': None,
+        'get_sentiment_analyzer': type('Sentiment', (), {
+            'analyze_transcripts': lambda self, parsed: [(sentiment, sentiment)] * len(parsed)})(),
+        'get_tone_analyzer': type('Tone', (), {'analyze_tone_changes': lambda self, results: []})(),
+        'get_strategic_analyzer': type('Strategic', (), {'extract_focuses': lambda self, data: []})(),
+    }
+    for name, stub in stubs.items():
+        monkeypatch.setattr(app_module, name, lambda stub=stub: stub)
+    monkeypatch.setattr(app_module, 'cache', dc.Cache(str(tmp_path)))
+    return app_module.app.test_client(), scraper
+
+
+@pytest.mark.parametrize('path', ['/api/analyze', '/api/collect-data'])
+def test_partial_runs_are_not_cached(client, path):
+    client, scraper = client
+
+    first = client.post(path, json={'ticker': 'NVDA', 'quarters': 4}).get_json()
+    assert first['from_cache'] is False
+    if path == '/api/analyze':
+        assert first['data']['failed_transcripts'] == [URLS[1]]
+        assert [t['quarter'] for t in first['data']['transcripts']] == [4, 2, 1]
+
+    # The failed quarter is retried rather than served from the cache
+    scraper.failing.clear()
+    second = client.post(path, json={'ticker': 'NVDA', 'quarters': 4}).get_json()
+    assert second['from_cache'] is False
+    assert scraper.scraped.count(URLS[1]) == 2
+
+    assert client.post(path, json={'ticker': 'NVDA', 'quarters': 4}).get_json()['from_cache'] is True
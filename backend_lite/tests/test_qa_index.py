@@ -0,0 +1,49 @@
+"""
+Tests for the Q&A exchange index
+"""
+from services.parser import TranscriptParser
+from services.segments import QAIndex, Segment, deserialize_parsed, serialize_parsed
+from services.transcript_generator import TranscriptGenerator
+
+
+def make_qa():
+    words = ' '.join(['demand'] * 40)
+    return [
+        Segment('Colette Kress', words, 'executive'),      # before any question
+        Segment('Vivek Arya', words, 'analyst'),
+        Segment('Vivek Arya', words, 'analyst'),            # question continued
+        Segment('Jensen Huang', words, 'executive'),
+        Segment('Colette Kress', words, 'executive'),
+        Segment('Unknown', words, 'other'),
+        Segment('Stacy Rasgon', words, 'analyst'),
+        Segment('Jensen Huang', words, 'executive'),
+    ]
+
+
+def test_index_pairs_questions_with_following_answers():
+    index = QAIndex(make_qa())
+
+    assert len(index) == 2
+    first, second = index.exchanges
+    assert (first.questions, first.answers) == ([1, 2], [3, 4])
+    assert (second.questions, second.answers) == ([6], [7])
+    assert index.speaker(first.analyst_id) == 'Vivek Arya'
+    assert [index.speaker(i) for i in first.executive_ids] == ['Jensen Huang', 'Colette Kress']
+    assert index.answers == [0, 3, 4, 7]
+    assert index.exchange_of(0) is None and index.exchange_of(5) is None
+    assert index.exchange_of(4) is first and index.exchange_of(7) is second
+
+
+def test_index_survives_serialization_and_parsing():
+    qa = make_qa()
+    parsed = {'management_remarks': [], 'qa_session': qa, 'qa_exchanges': QAIndex(qa)}
+    restored = deserialize_parsed(serialize_parsed(parsed))
+    assert restored['qa_exchanges'] == parsed['qa_exchanges']
+    # Entries cached before the index existed get one built on read
+    legacy = {key: value for key, value in serialize_parsed(parsed).items() if key != 'qa_exchanges'}
+    assert deserialize_parsed(legacy)['qa_exchanges'] == parsed['qa_exchanges']
+
+    parsed = TranscriptParser().parse(TranscriptGenerator(2).generate(20_000))
+    index = parsed['qa_exchanges']
+    assert index.exchanges and index == QAIndex(parsed['qa_session'])
+    assert all(parsed['qa_session'][i].is_executive for i in index.answers)
@@ -0,0 +1,68 @@
+"""
+Tests for per-host token-bucket pacing and concurrent transcript scraping
+"""
+import time
+import threading
+
+from services.rate_limiter import HostRateLimiter, TokenBucket
+from services.scraper import MotleyFoolScraper
+
+
+def test_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=50.0, capacity=2.0)
+    start = time.monotonic()
+    waits = [bucket.acquire() for _ in range(6)]
+    elapsed = time.monotonic() - start
+
+    assert waits[:2] == [0.0, 0.0]  # the burst
+    assert all(wait > 0 for wait in waits[2:])
+    assert 0.07 <= elapsed < 0.5  # four more tokens at 50/s
+
+
+def test_hosts_have_independent_buckets():
+    limiter = HostRateLimiter(rate=5.0, capacity=1.0)
+    assert limiter.acquire('https://www.fool.com/a') == 0.0
+    assert limiter.acquire('https://example.com/b') == 0.0
+    assert limiter.acquire('https://www.fool.com/c') > 0.1
+
+
+def test_concurrent_callers_queue_behind_each_other():
+    bucket = TokenBucket(rate=40.0, capacity=1.0)
+    finished = []
+
+    def worker():
+        bucket.acquire()
+        finished.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Reservations are spaced by 1/rate, so the last caller waits about 4/40s
+    assert max(finished) - start >= 0.09
+
+
+def test_scrape_transcripts_returns_results_in_input_order(monkeypatch):
+    scraper = MotleyFoolScraper()
+    urls = [f"https://www.fool.com/earnings/call-transcripts/{i}/" for i in range(6)]
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def scrape(url):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        # Later URLs finish first
+        time.sleep(0.05 * (len(urls) - urls.index(url)) / len(urls))
+        with lock:
+            active[0] -= 1
+        return None if url.endswith('3/') else {'url': url}
+
+    monkeypatch.setattr(scraper, 'scrape_transcript', scrape)
+    results = scraper.scrape_transcripts(urls, max_workers=3)
+
+    assert [r and r['url'] for r in results] == [url if not url.endswith('3/') else None for url in urls]
+    assert peak[0] > 1
@@ -0,0 +1,181 @@
+"""
+Offline tests for the scraper's record/replay layer and the local replay server
+"""
+import pytest
+import requests
+from services.scraper import MotleyFoolScraper
+from services.page_store import PageStore
+from services.replay import FixtureStore, ReplayServer, configure_session
+from services.extractors import StreamingArticleParser
+
+QUOTE_PAGE = b"""<html><body><section data-testid="transcripts">
+<a href="/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/">NVIDIA Q3 2025</a>
+<a href="/earnings/call-transcripts/2024/08/28/nvidia-nvda-q2-2025-earnings-call-transcript/">NVIDIA Q2 2025</a>
+</section></body></html>"""
+
+TRANSCRIPT_PAGE = b"""<html><body><h1>NVIDIA (NVDA) Q3 2025 Earnings Call Transcript</h1>
+<div class="article-body"><h2>Prepared Remarks:</h2>
+<p><strong>Jensen Huang -- President and Chief Executive Officer</strong></p>
+<p>Thank you. Data center revenue was a record this quarter.</p></div></body></html>"""
+
+
+def make_fixtures(directory):
+    fixture_dir = str(directory)
+    fixtures = FixtureStore(fixture_dir)
+    fixtures.put(MotleyFoolScraper.NVIDIA_QUOTE_URL, 200, {'Content-Type': 'text/html'}, QUOTE_PAGE)
+    for path in ('2024/11/20/nvidia-nvda-q3-2025', '2024/08/28/nvidia-nvda-q2-2025'):
+        url = f"https://www.fool.com/earnings/call-transcripts/{path}-earnings-call-transcript/"
+        fixtures.put(url, 200, {'Content-Type': 'text/html'}, TRANSCRIPT_PAGE)
+    return fixture_dir
+
+
+def make_scraper(**kwargs):
+    scraper = MotleyFoolScraper(**kwargs)
+    scraper.rate_limiter.rate = 1000.0
+    return scraper
+
+
+def test_replay_mode(tmp_path):
+    scraper = make_scraper()
+    configure_session(scraper.session, mode='replay', fixture_dir=make_fixtures(tmp_path))
+
+    urls = scraper.find_transcript_urls('NVDA', 2)
+    assert [u.split('/')[-2] for u in urls] == [
+        'nvidia-nvda-q3-2025-earnings-call-transcript',
+        'nvidia-nvda-q2-2025-earnings-call-transcript'
+    ]
+
+    results = scraper.scrape_transcripts(urls)
+    assert all(results)
+    assert results[0]['quarter'] == 3 and results[0]['year'] == 2025
+    assert 'Data center revenue was a record' in results[0]['full_text']
+    assert results[0]['turns'] == [{
+        'speaker': 'Jensen Huang',
+        'role': 'President and Chief Executive Officer',
+        'section': 'prepared_remarks',
+        'content': 'Thank you. Data center revenue was a record this quarter.'
+    }]
+
+
+def test_replay_server_upstream_and_revalidation(tmp_path):
+    server = ReplayServer(make_fixtures(tmp_path / 'fixtures'), latency=0.01).start()
+    try:
+        scraper = make_scraper(page_store=PageStore(str(tmp_path / 'pages')))
+        configure_session(scraper.session, mode='upstream', upstream=server.url)
+
+        url = scraper.find_transcript_urls('NVDA', 1)[0]
+        first = scraper.scrape_transcript(url)
+        second = scraper.scrape_transcript(url)
+
+        assert first and first == second
+        assert scraper.page_store.get(url)['etag']
+    finally:
+        server.stop()
+
+
+def test_replay_server_error_injection(tmp_path):
+    server = ReplayServer(make_fixtures(tmp_path), error_rate=1.0, error_status=503, seed=1).start()
+    try:
+        scraper = make_scraper()
+        scraper.transport.max_retries = 0
+        configure_session(scraper.session, mode='upstream', upstream=server.url)
+
+        url = "https://www.fool.com/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/"
+        assert scraper.scrape_transcript(url) is None
+    finally:
+        server.stop()
+
+
+def test_retries_then_circuit_breaker_fails_fast(tmp_path):
+    server = ReplayServer(make_fixtures(tmp_path), error_rate=1.0, error_status=503, seed=1).start()
+    try:
+        scraper = make_scraper()
+        scraper.transport.max_retries = 2
+        scraper.transport.max_backoff = 1.0
+        scraper.transport.breaker.failure_threshold = 3
+        configure_session(scraper.session, mode='upstream', upstream=server.url)
+
+        url = "https://www.fool.com/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/"
+        assert scraper.scrape_transcript(url) is None
+        assert server.requests_served == 3  # first attempt + 2 retries honouring Retry-After
+        assert scraper.transport.breaker.state('www.fool.com') == 'open'
+
+        # While open, requests fail without reaching the server
+        assert scraper.scrape_transcript(url) is None
+        assert server.requests_served == 3
+    finally:
+        server.stop()
+
+
+def test_streaming_matches_full_parse(tmp_path):
+    fixture_dir = make_fixtures(tmp_path)
+    fixtures = FixtureStore(fixture_dir)
+    url = "https://www.fool.com/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/"
+    fixtures.put(url, 200, {'Content-Type': 'text/html'},
+                 TRANSCRIPT_PAGE.replace(b'</body>', b'<footer>' + b'x' * 100000 + b'</footer></body>'))
+
+    full = make_scraper()
+    streaming = make_scraper(streaming=True)
+    streaming.STREAM_CHUNK_SIZE = 1024
+    for scraper in (full, streaming):
+        configure_session(scraper.session, mode='replay', fixture_dir=fixture_dir)
+
+    expected = full.scrape_transcript(url)
+    result = streaming.scrape_transcript(url)
+    for key in ('title', 'quarter', 'year', 'full_text', 'turns'):
+        assert result[key] == expected[key]
+
+    # Reading stops once the article body has closed, before the footer
+    content, _ = streaming._fetch_page(url, StreamingArticleParser())
+    assert len(content) < 10000
+
+
+def test_streamed_prefix_is_not_stored_as_the_page(tmp_path):
+    fixture_dir = make_fixtures(tmp_path / 'fixtures')
+    url = "https://www.fool.com/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/"
+    FixtureStore(fixture_dir).put(url, 200, {'Content-Type': 'text/html'},
+                                  TRANSCRIPT_PAGE.replace(b'</body>', b'<footer>' + b'x' * 100000 + b'</footer></body>'))
+    server = ReplayServer(fixture_dir).start()
+    try:
+        scraper = make_scraper(streaming=True, page_store=PageStore(str(tmp_path / 'pages')))
+        scraper.STREAM_CHUNK_SIZE = 1024
+        configure_session(scraper.session, mode='upstream', upstream=server.url)
+
+        first = scraper.scrape_transcript(url)
+        entry = scraper.page_store.get(url)
+        assert entry['partial'] and entry['etag'] is None
+        assert scraper.page_store.get_body(entry['content_hash']) is None
+        assert scraper.page_store.conditional_headers(url) == {}
+
+        # The prefix hash still finds the transcript extracted from it
+        assert scraper.scrape_transcript(url) == first
+        assert scraper.page_store.get_extracted(entry['content_hash'])
+    finally:
+        server.stop()
+
+
+def test_recording_keeps_good_fixtures_over_errors(tmp_path):
+    good = ReplayServer(make_fixtures(tmp_path / 'good')).start()
+    flaky = ReplayServer(make_fixtures(tmp_path / 'flaky'), error_rate=1.0, error_status=503, seed=1).start()
+    try:
+        record_dir = str(tmp_path / 'recorded')
+        session = configure_session(requests.Session(), mode='record', fixture_dir=record_dir)
+        path = "/earnings/call-transcripts/2024/11/20/nvidia-nvda-q3-2025-earnings-call-transcript/"
+
+        assert session.get(good.url + path).status_code == 200
+        assert session.get(flaky.url + path).status_code == 503
+        assert session.get(flaky.url + '/quote/nasdaq/amd/').status_code == 503
+
+        fixtures = FixtureStore(record_dir)
+        entry, body = fixtures.get(path)
+        assert entry['status'] == 200 and body == TRANSCRIPT_PAGE
+        # An error is still recorded where there is nothing better
+        assert fixtures.get('/quote/nasdaq/amd/')[0]['status'] == 503
+    finally:
+        good.stop()
+        flaky.stop()
+
+
+if __name__ == "__main__":
+    # The tests take pytest's tmp_path, so run them through pytest
+    raise SystemExit(pytest.main([__file__, '-q']))
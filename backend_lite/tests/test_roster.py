@@ -0,0 +1,41 @@
+"""
+Tests for the call participants roster
+"""
+from services.parser import TranscriptParser
+from services.roster import ParticipantRoster
+
+PARTICIPANTS = """Call participants:
+Jensen Huang
+-- President and Chief Executive Officer
+Colette M. Kress -- Executive Vice President and Chief Financial Officer
+C.J. Muse -- Cantor Fitzgerald -- Analyst
+More NVDA analysis"""
+
+
+def test_roster_from_participants_block():
+    roster = ParticipantRoster.from_text(PARTICIPANTS)
+    assert [(p.name, p.firm, p.speaker_type) for p in roster.participants] == [
+        ('Jensen Huang', None, 'executive'),
+        ('Colette M. Kress', None, 'executive'),
+        ('C.J. Muse', 'Cantor Fitzgerald', 'analyst'),
+    ]
+    assert roster.speaker_type('Colette Kress') == 'executive'
+    assert roster.speaker_type('C.J. Muse -- Cantor Fitzgerald -- Analyst') == 'analyst'
+    assert roster.speaker_type('Operator') is None
+
+    newer = ParticipantRoster.from_text("CALL PARTICIPANTS\nChief Executive Officer — Jensen Huang\nTAKEAWAYS")
+    assert newer.participants[0].name == 'Jensen Huang'
+
+
+def test_parser_types_listed_speakers_by_roster():
+    question = ' '.join(['Could you walk us through the data center ramp and supply?'] * 8)
+    answer = ' '.join(['Demand for our accelerated computing platform remains very strong.'] * 8)
+    transcript = {
+        'quarter': 3, 'year': 2025, 'title': 'NVIDIA (NVDA) Q3 2025 Earnings Call Transcript', 'url': 'u',
+        'full_text': f"{PARTICIPANTS}\nPrepared Remarks:\nJensen Huang -- CEO\n{answer}\n"
+                     f"Questions and Answers:\nOperator: Thank you. We will now open the call for questions.\n"
+                     f"C.J. Muse -- Cantor\n{question}\nJensen Huang -- CEO\n{answer}"
+    }
+    qa = TranscriptParser().parse(transcript)['qa_session']
+    # Without the roster a 96-word question from an unlisted firm would be typed 'executive'
+    assert [(s.speaker, s.speaker_type) for s in qa] == [('C.J. Muse', 'analyst'), ('Jensen Huang', 'executive')]
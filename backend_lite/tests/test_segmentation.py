@@ -1,10 +1,14 @@
 """
 Test script to verify proper segmentation between management remarks and Q&A
+
+Set SCRAPER_HTTP_MODE=replay and SCRAPER_FIXTURE_DIR=<dir> (see
+scripts/replay_server.py) to run against recorded pages instead of fool.com.
 """
 import json
 from services.scraper import MotleyFoolScraper
 from services.parser import TranscriptParser
 from services.sentiment_analyzer import SentimentAnalyzer
+from services.replay import configure_session_from_env
 
 def test_segmentation():
     print("=" * 80)
@@ -13,6 +17,7 @@ def test_segmentation():
     
     # Initialize services
     scraper = MotleyFoolScraper()
+    configure_session_from_env(scraper.session, **scraper.transport.adapter_kwargs)
     parser = TranscriptParser()
     
     # Get a transcript
@@ -0,0 +1,67 @@
+"""
+Tests for the slotted Segment record and its dict compatibility
+"""
+import json
+
+import pytest
+
+from services.parse_cache import ParseCache
+from services.parser import TranscriptParser
+from services.segments import Segment
+from services.transcript_generator import TranscriptGenerator
+
+CONTENT = ('Data center revenue was a record $30.8 billion, up 112% from a year ago. '
+           'Blackwell demand is strong and supply is improving every quarter for our customers.')
+
+
+def test_segment_is_slotted():
+    segment = Segment('Jensen Huang', CONTENT, 'executive')
+    assert not hasattr(segment, '__dict__')
+    with pytest.raises(AttributeError):
+        segment.sentiment = 'positive'
+
+
+def test_features_are_computed_once_at_construction():
+    segment = Segment('Jensen Huang', CONTENT, 'executive')
+    assert segment.word_count == len(CONTENT.split())
+    assert segment.content_lower == CONTENT.lower()
+    assert segment.token_count > segment.word_count  # punctuation marks count as tokens
+    assert segment.is_executive and not segment.is_analyst and not segment.is_boilerplate
+    assert Segment('Operator', 'Thank you.', 'other').is_boilerplate
+
+
+def test_mapping_access_for_dict_callers():
+    segment = Segment('Vivek Arya', CONTENT, 'analyst')
+    assert segment['content'] == CONTENT
+    assert segment['speaker_type'] == 'analyst'
+    assert segment.get('word_count') == segment.word_count
+    assert segment.get('sentiment', 'n/a') == 'n/a'
+    # Only the dict keys are exposed, not the derived features
+    assert segment.get('content_lower') is None
+    with pytest.raises(KeyError):
+        segment['content_lower']
+
+
+def test_dict_round_trip():
+    segment = Segment('Colette Kress', CONTENT, 'executive', word_count=7)
+    data = segment.to_dict()
+    assert data == {'speaker': 'Colette Kress', 'content': CONTENT, 'word_count': 7,
+                    'speaker_type': 'executive', 'token_count': segment.token_count}
+
+    restored = Segment.from_dict(json.loads(json.dumps(data)))
+    assert restored == segment
+    assert restored.content_lower == segment.content_lower
+    assert restored.is_boilerplate == segment.is_boilerplate
+
+
+def test_parse_cache_returns_equal_segments(tmp_path):
+    transcript_data = TranscriptGenerator(3).generate(10_000)
+    cache = ParseCache(str(tmp_path), TranscriptParser())
+
+    parsed = cache.parse(transcript_data)
+    cached = cache.parse(transcript_data)
+
+    assert cache.hits == 1
+    for section in ('management_remarks', 'qa_session'):
+        assert parsed[section] and cached[section] == parsed[section]
+        assert all(isinstance(segment, Segment) for segment in cached[section])
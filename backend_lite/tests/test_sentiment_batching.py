@@ -0,0 +1,118 @@
+"""
+Tests for length-bucketed FinBERT batching and windowed full coverage, on a stub tokenizer and model
+"""
+import pytest
+
+torch = pytest.importorskip('torch')
+
+from services.segments import Segment
+from services.sentiment_analyzer import SentimentAnalyzer
+
+
+class WordTokenizer:
+    """One token per word ('strong' and 'weak' have their own ids) with [CLS]/[SEP], like a fast tokenizer"""
+
+    VOCAB = {'strong': 1, 'weak': 2}
+
+    def __init__(self):
+        self.padded_widths = []
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+    def __call__(self, texts, truncation=False, max_length=None, add_special_tokens=True, stride=0,
+                 return_overflowing_tokens=False):
+        encodings = {'input_ids': [], 'attention_mask': []}
+        if return_overflowing_tokens:
+            encodings['overflow_to_sample_mapping'] = []
+        for text_id, text in enumerate(texts):
+            ids = [self.VOCAB.get(word, 3) for word in text.split()]
+            if not add_special_tokens:
+                windows = [ids]
+            else:
+                size = max_length - 2 if truncation else len(ids)
+                windows, start = [], 0
+                while True:
+                    windows.append([101] + ids[start:start + size] + [102])
+                    if not return_overflowing_tokens or start + size >= len(ids):
+                        break
+                    start += size - stride
+            for window in windows:
+                encodings['input_ids'].append(window)
+                encodings['attention_mask'].append([1] * len(window))
+                if return_overflowing_tokens:
+                    encodings['overflow_to_sample_mapping'].append(text_id)
+        return encodings
+
+    def pad(self, features, return_tensors=None):
+        width = max(len(feature['input_ids']) for feature in features)
+        self.padded_widths.append(width)
+        return {key: torch.tensor([feature[key] + [0] * (width - len(feature[key])) for feature in features])
+                for key in ('input_ids', 'attention_mask')}
+
+
+class CountingModel:
+    """Logits are ten times the counts of 'strong' and 'weak' tokens; records every batch size"""
+
+    def __init__(self):
+        self.batches = []
+
+    def logits(self, inputs):
+        rows = inputs['input_ids'].tolist()
+        self.batches.append(len(rows))
+        return torch.tensor([[10.0 * row.count(1), 10.0 * row.count(2), 0.0] for row in rows])
+
+
+@pytest.fixture
+def make_analyzer(monkeypatch):
+    monkeypatch.setattr(SentimentAnalyzer, '_load_models', lambda self: None)
+
+    def make(**kwargs):
+        analyzer = SentimentAnalyzer(**kwargs)
+        analyzer.tokenizer = WordTokenizer()
+        analyzer.model = CountingModel()
+        return analyzer
+
+    return make
+
+
+def test_inputs_are_batched_by_length_and_returned_in_input_order(make_analyzer):
+    analyzer = make_analyzer(batch_size=2)
+    texts = ['strong ' * 5, 'weak', 'strong strong strong weak', 'weak weak', 'strong', 'weak']
+
+    results = analyzer.analyze_segments(texts)
+
+    assert [result['sentiment'] for result in results] == ['positive', 'negative', 'positive', 'negative',
+                                                           'positive', 'negative']
+    # Five distinct texts of 1, 1, 2, 4 and 5 words plus [CLS]/[SEP], each batch padded to its own longest
+    assert analyzer.model.batches == [2, 2, 1]
+    assert analyzer.tokenizer.padded_widths == [3, 6, 7]
+
+
+def test_full_coverage_weights_overlapping_windows_by_tokens(make_analyzer):
+    analyzer = make_analyzer(coverage='full')
+    analyzer.MAX_LENGTH, analyzer.WINDOW_OVERLAP = 62, 2
+    segments = [Segment('Jensen Huang', 'strong ' * 60, 'executive'),
+                Segment('Colette Kress', 'weak ' * 60, 'executive'),
+                Segment('Colette Kress', 'weak ' * 120, 'executive')]
+
+    result = analyzer.analyze_management(segments)
+
+    # Windows of 60, 60, 60, 60 and 4 tokens; only the first is positive
+    assert result['sentiment'] == 'negative'
+    assert result['scores']['positive'] == pytest.approx(60 / 244, abs=1e-6)
+    assert result['scores']['negative'] == pytest.approx(184 / 244, abs=1e-6)
+    assert result['coverage'] == 1.0
+
+
+def test_sampling_reports_the_truncated_share(make_analyzer):
+    analyzer = make_analyzer()
+    analyzer.MAX_LENGTH = 62
+    segments = [Segment('Jensen Huang', 'strong ' * 60, 'executive'),
+                Segment('Colette Kress', 'weak ' * 180, 'executive')]
+
+    result = analyzer.analyze_management(segments)
+
+    # Only the first 60 of 240 tokens reach the model
+    assert result['sentiment'] == 'positive'
+    assert result['coverage'] == pytest.approx(0.25)
@@ -0,0 +1,27 @@
+"""
+Tests for the per-text sentiment cache
+"""
+from services.sentiment_cache import SentimentCache
+
+BOILERPLATE = 'Today we will make forward-looking statements based on our current expectations.'
+REMARKS = 'Data center revenue grew strongly this quarter.'
+
+
+def test_only_unseen_texts_miss(tmp_path):
+    cache = SentimentCache(str(tmp_path), 'ProsusAI/finbert@abc:fp32:512:64')
+    assert cache.get_many('truncated', [BOILERPLATE, REMARKS]) == [None, None]
+
+    cache.set_many('truncated', [BOILERPLATE], [[0.1, 0.1, 0.8]])
+    assert cache.get_many('truncated', [BOILERPLATE, REMARKS]) == [[0.1, 0.1, 0.8], None]
+    # Windows of the same text are a separate entry
+    assert cache.get_many('windows', [BOILERPLATE]) == [None]
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 4
+
+
+def test_model_change_invalidates_results(tmp_path):
+    directory = str(tmp_path)
+    SentimentCache(directory, 'ProsusAI/finbert@abc:fp32:512:64').set_many('truncated', [REMARKS], [[0.9, 0.05, 0.05]])
+
+    assert SentimentCache(directory, 'ProsusAI/finbert@abc:fp32:512:64').get_many('truncated', [REMARKS]) == [[0.9, 0.05, 0.05]]
+    assert SentimentCache(directory, 'ProsusAI/finbert@abc:int8:512:64').get_many('truncated', [REMARKS]) == [None]
+    assert SentimentCache(directory, 'ProsusAI/finbert@def:fp32:512:64').get_many('truncated', [REMARKS]) == [None]
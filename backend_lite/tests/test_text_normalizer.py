@@ -0,0 +1,38 @@
+"""
+Tests for the precompiled text normalizers against the original re.sub chains
+"""
+import time
+
+from scripts.benchmark_normalizer import STAGES
+from services.text_normalizer import BOILERPLATE
+from services.transcript_generator import TranscriptGenerator
+
+EDGE_CASES = [
+    'Published November 19, 2025 at 5:00 p.m. ET',
+    'NOVEMBER 19,  2025 and novemberx 19, 2025 or xNovember 19, 2025',
+    'On Aug 1, 2024 (NVDA +2.5%) Q3 2025 Earnings Call, Nvidia ( NVDA -1.2% )',
+    'Thanks, Colette. \nJensen Huang, CEO\n\n\n\nImage source: The Motley Fool.\tAdvertisement here\n',
+    'Operator Good afternoon. I will be your conference operator today. Prepared Remarks:',
+    'word ' * 50 + 'Abcdefghijklmnopqrstuvwxyz' * 20 + ' 5, 2024',
+    '<p>Call Participants</p>\n  Questions and Answers  \n\t\t at 10:30am today',
+]
+
+
+def test_profiles_match_legacy_re_sub_chains():
+    documents, paragraphs = [], EDGE_CASES[:]
+    for transcript in TranscriptGenerator(3).corpus(4, target_chars=8_000):
+        documents.append(transcript['full_text'])
+        paragraphs += transcript['full_text'].split('\n\n')
+
+    for name, legacy, normalizer in STAGES:
+        # Segment and sentiment cleanup only ever see one segment's text
+        texts = paragraphs + (documents if name in ('scraper', 'raw_text', 'boilerplate') else [])
+        for text in texts:
+            assert normalizer.normalize(text) == legacy(text), (name, text[:80])
+
+
+def test_long_letter_runs_do_not_backtrack():
+    text = ('Abcdefghij' * 2000 + ' ') * 4
+    start = time.perf_counter()
+    BOILERPLATE.normalize(text)
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,36 @@
+"""
+Tests for the synthetic transcript generator
+"""
+import pytest
+
+from services.parser import TranscriptParser
+from services.transcript_generator import TranscriptGenerator
+
+
+def test_generator_is_deterministic_and_sized():
+    first = TranscriptGenerator(7).generate(20_000, quirks=['boilerplate', 'whitespace'])
+    second = TranscriptGenerator(7).generate(20_000, quirks=['boilerplate', 'whitespace'])
+    assert first['full_text'] == second['full_text']
+    assert 20_000 <= len(first['full_text']) < 25_000
+    assert TranscriptGenerator(8).generate(20_000)['full_text'] != first['full_text']
+
+    with pytest.raises(ValueError):
+        TranscriptGenerator().generate(quirks=['unknown'])
+
+
+def test_parser_recovers_generated_speakers():
+    transcript = TranscriptGenerator(3).generate(30_000, quirks=['split_roles', 'participants'])
+    parsed = TranscriptParser().parse(transcript)
+    expected = {name: 'executive' if firm is None else 'analyst'
+                for name, _, firm in transcript['synthetic_speakers']}
+
+    segments = parsed['management_remarks'] + parsed['qa_session']
+    assert parsed['section_split'] == 'sections'
+    assert parsed['management_remarks'] and parsed['qa_session']
+    # The speaker pattern can pull a preceding punctuation-free paragraph into
+    # the label; the name is still the label's last line
+    names = {segment.speaker.splitlines()[-1].partition('--')[0].strip() for segment in segments}
+    assert names <= set(expected)
+    for segment in segments:
+        if '\n' not in segment.speaker:
+            assert expected[segment.speaker.partition('--')[0].strip()] == segment.speaker_type
@@ -0,0 +1,58 @@
+"""
+Tests for the scraper's HTTP transport and circuit breaker
+"""
+import time
+import pytest
+import requests
+
+from services.rate_limiter import HostRateLimiter
+from services.transport import CircuitBreaker, CircuitOpenError, HttpTransport
+
+URL = 'https://www.fool.com/earnings/call-transcripts/2025/11/19/nvidia-nvda-q3-2026-earnings-call-transcript/'
+
+
+class FakeSession(requests.Session):
+    """Raises or returns the queued outcomes in order"""
+
+    def __init__(self, outcomes):
+        super().__init__()
+        self.outcomes = list(outcomes)
+
+    def get(self, url, **kwargs):
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        response = requests.Response()
+        response.status_code = outcome
+        return response
+
+
+def make_transport(outcomes, breaker):
+    return HttpTransport(FakeSession(outcomes), HostRateLimiter(rate=1000, capacity=1000), max_retries=0,
+                         breaker=breaker)
+
+
+def test_unexpected_error_releases_half_open_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    transport = make_transport([requests.ConnectionError(), ValueError('bad url'), 200], breaker)
+
+    with pytest.raises(requests.ConnectionError):
+        transport.get(URL)
+    with pytest.raises(CircuitOpenError):
+        transport.get(URL)
+
+    time.sleep(0.06)
+    with pytest.raises(ValueError):
+        transport.get(URL)  # the half-open trial fails outside requests
+    time.sleep(0.06)
+    assert transport.get(URL).status_code == 200
+    assert breaker.state('www.fool.com') == 'closed'
+
+
+def test_retry_statuses_open_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    transport = make_transport([503, 503], breaker)
+
+    assert transport.get(URL).status_code == 503
+    assert transport.get(URL).status_code == 503
+    assert breaker.state('www.fool.com') == 'open'